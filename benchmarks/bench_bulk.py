@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Benchmark bulk_create against constructing objects one at a time.
+
+The input is a point-list-like DataFrame of N windows (tag, area, azimuth,
+tilt), as read from a CSV:
+
+  constructor:  Window(area=..., azimuth=..., tilt=...) per row, each raw
+                number coerced into its property by __post_init__
+  bulk:         Window.bulk_create(_name=df['tag'], area=df['area'], ...)
+  bulk frame:   the same with as_frame=True (a ResourceFrame)
+
+Each window also creates its three properties, so 4N objects in all.
+
+    python benchmarks/bench_bulk.py [--windows N]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from semantic_objects.naming import naming_session
+from examples.s223_framework_demo import Window
+
+
+def point_list(count):
+    return pd.DataFrame({
+        'tag': [f'WIN-{i:06d}' for i in range(count)],
+        'area': np.linspace(1.0, 5.0, count),
+        'azimuth': np.arange(count) % 360.0,
+        'tilt': np.full(count, 90.0),
+    })
+
+
+def construct(df):
+    windows = []
+    for tag, area, azimuth, tilt in df.itertuples(index=False, name=None):
+        window = Window(area=area, azimuth=azimuth, tilt=tilt)
+        window._name = tag
+        windows.append(window)
+    return windows
+
+
+def bulk(df, as_frame=False):
+    return Window.bulk_create(_name=df['tag'], area=df['area'], azimuth=df['azimuth'], tilt=df['tilt'],
+                              as_frame=as_frame)
+
+
+def timed(fn, *args):
+    with naming_session():
+        start = time.perf_counter()
+        result = fn(*args)
+        return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--windows', type=int, default=50000)
+    args = parser.parse_args()
+
+    df = point_list(args.windows)
+    construct_time, constructed = timed(construct, df)
+    bulk_time, built = timed(bulk, df)
+    frame_time, frame = timed(bulk, df, True)
+    assert len(constructed) == len(built) == len(frame) == args.windows
+    assert [w.area.value for w in constructed[:100]] == [w.area.value for w in built[:100]]
+
+    print(f"windows:     {args.windows}  ({args.windows * 4} objects)")
+    print(f"constructor: {construct_time:.3f} s")
+    print(f"bulk:        {bulk_time:.3f} s  ({construct_time / bulk_time:.1f}x)")
+    print(f"bulk frame:  {frame_time:.3f} s  ({construct_time / frame_time:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Benchmark batch SHACL shapes export against the per-class path.
+
+The per-class path is what callers had to do before `export_shapes`: call
+`generate_rdf_class_definition()` / `generate_rdf_property_definition()` for
+each class and parse every Turtle string back into one graph.
+
+    python benchmarks/bench_export_shapes.py [--repeat N]
+"""
+import argparse
+import time
+
+from rdflib import Graph
+from rdflib.compare import isomorphic
+
+from semantic_objects import s223, watr, g36
+from semantic_objects.core import Predicate
+from semantic_objects.exporters import export_shapes, _collect_shape_classes
+
+MODULES = [s223, watr, g36]
+
+
+def per_class(classes):
+    g = Graph()
+    for klass in classes:
+        if issubclass(klass, Predicate):
+            ttl = klass.generate_rdf_property_definition()
+        else:
+            ttl = klass.generate_rdf_class_definition()
+        g.parse(data=ttl, format='turtle')
+    return g
+
+
+def best_of(repeat, fn):
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    classes = _collect_shape_classes(MODULES)
+    # Warm up relation inference/schema caches so both paths measure export only
+    export_shapes(MODULES)
+
+    per_class_time, per_class_graph = best_of(args.repeat, lambda: per_class(classes))
+    batch_time, batch_graph = best_of(args.repeat, lambda: export_shapes(MODULES))
+
+    print(f"classes:   {len(classes)}")
+    print(f"per-class: {per_class_time:.3f} s  ({len(per_class_graph)} triples)")
+    print(f"batch:     {batch_time:.3f} s  ({len(batch_graph)} triples)")
+    print(f"speedup:   {per_class_time / batch_time:.1f}x")
+    print(f"isomorphic: {isomorphic(per_class_graph, batch_graph)}")
+
+
+if __name__ == '__main__':
+    main()
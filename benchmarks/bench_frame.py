@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Benchmark loading and filtering a ResourceFrame against a list of instances.
+
+Same synthetic model as bench_model_loader.py (N spaces, each with an Area
+value and unit); the SPARQL query is evaluated once up front and served to
+both loaders, so the numbers compare instantiation only:
+
+  load:    load_instances() vs load_frame()
+  filter:  keeping the spaces whose area is over half the largest, in square
+           feet, from ROWS spaces (built with from_instances, since rdflib's
+           query evaluation is too slow to load that many): a list
+           comprehension vs the NumPy mask
+           (frame['area.value'] > x) & frame.iri_mask('area.unit', FT_2)
+
+    python benchmarks/bench_frame.py [--spaces N] [--rows ROWS]
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_model_loader import build_graph, evaluate, timed
+from semantic_objects.frame import ResourceFrame
+from semantic_objects.model_loader import ModelLoader
+from semantic_objects.namespaces import UNIT
+from semantic_objects.qudt.units import M2
+from semantic_objects.s223.properties import Area
+from semantic_objects.units import FT_2
+from examples.s223_framework_demo import Space
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--spaces', type=int, default=1000)
+    parser.add_argument('--rows', type=int, default=200000)
+    args = parser.parse_args()
+    threshold = args.rows / 2
+
+    graph = build_graph(args.spaces)
+    query_time, results = timed(evaluate, graph, Space.get_sparql_query(ontology='s223'))
+    graph.query = lambda *_, **__: results
+
+    load_time, spaces = timed(ModelLoader(graph, native=False).load_instances, Space, 's223')
+    frame_time, frame = timed(ModelLoader(graph, native=False).load_frame, Space, 's223')
+    assert len(spaces) == len(frame) == args.spaces
+
+    spaces = [Space(area=Area(value=float(i + 1), unit=FT_2 if i % 2 else M2)) for i in range(args.rows)]
+    frame = ResourceFrame.from_instances(spaces)
+    frame.code(UNIT.FT_2)  # build the IRI -> code lookup outside the timing
+    list_time, large = timed(lambda: [s for s in spaces if s.area.value > threshold and s.area.unit is FT_2])
+    mask_time, large_frame = timed(
+        lambda: frame.filter((frame['area.value'] > threshold) & frame.iri_mask('area.unit', UNIT.FT_2)))
+    assert len(large) == len(large_frame)
+
+    print(f"spaces:    {args.spaces}")
+    print(f"query:     {query_time:.3f} s  (evaluated once, not included below)")
+    print(f"load:      instances {load_time:.3f} s   frame {frame_time:.3f} s  ({load_time / frame_time:.1f}x)")
+    print(f"filter:    instances {list_time * 1000:.1f} ms  frame {mask_time * 1000:.1f} ms"
+          f"  ({list_time / mask_time:.1f}x, {len(large)} of {args.rows} rows)")
+
+
+if __name__ == '__main__':
+    main()
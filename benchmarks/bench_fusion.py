@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Benchmark loading many classes with one fused query against a query per class.
+
+A synthetic model with --classes space classes (s223:BenchZone0, ...), each
+with --spaces instances shaped like bench_model_loader.py's spaces. Every
+class is loaded with load_multiple_classes(), once with a query per class and
+once with fused=True (one UNION query, rows split by class), on:
+
+  default:   rdflib's SPARQL engine with planned queries (native=False)
+  oxigraph:  the Oxigraph store, which evaluates the query text itself
+  native:    the default store's native matcher, for reference (no queries,
+             so nothing to fuse)
+
+    python benchmarks/bench_fusion.py [--classes K] [--spaces N]
+"""
+import argparse
+import sys
+from pathlib import Path
+
+from rdflib import Graph, Literal, Namespace, RDF
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_model_loader import EX, timed
+from semantic_objects.core import semantic_object
+from semantic_objects.model_loader import ModelLoader
+from semantic_objects.namespaces import S223, QUDT, UNIT, bind_prefixes
+from examples.s223_framework_demo import Space
+
+QK = Namespace('http://qudt.org/vocab/quantitykind/')
+
+
+def build_classes(n_classes):
+    classes = {}
+    for k in range(n_classes):
+        cls = type(f'BenchZone{k}', (Space,), {'_name': f'BenchZone{k}', '__annotations__': {}})
+        classes[f'zones{k}'] = semantic_object(cls)
+    return classes
+
+
+def build_graph(n_classes, n_spaces):
+    g = Graph()
+    bind_prefixes(g)
+    g.bind('ex', EX)
+    for k in range(n_classes):
+        for i in range(n_spaces):
+            space = EX[f'Zone{k}_{i}']
+            area = EX[f'Zone{k}_{i}_Area']
+            g.add((space, RDF.type, S223[f'BenchZone{k}']))
+            g.add((space, S223.hasProperty, area))
+            g.add((area, RDF.type, S223.QuantifiableObservableProperty))
+            g.add((area, S223.hasQuantityKind, QK.Area))
+            g.add((area, S223.hasValue, Literal(float(i + 1))))
+            g.add((area, QUDT.hasUnit, UNIT.FT_2))
+    return g
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--classes', type=int, default=20)
+    parser.add_argument('--spaces', type=int, default=50)
+    args = parser.parse_args()
+
+    classes = build_classes(args.classes)
+    graph = build_graph(args.classes, args.spaces)
+    loaders = {
+        'default': lambda: ModelLoader(graph, native=False),
+        'oxigraph': lambda: ModelLoader(graph, store='oxigraph'),
+        'native': lambda: ModelLoader(graph),
+    }
+
+    print(f"classes:   {args.classes} x {args.spaces} spaces")
+    for name, make_loader in loaders.items():
+        # a fresh loader each, so neither run reuses the other's objects or plans
+        per_class_loader, fused_loader = make_loader(), make_loader()
+        per_class_time, per_class = timed(per_class_loader.load_multiple_classes, classes, 's223')
+        fused_time, fused = timed(fused_loader.load_multiple_classes, classes, 's223', True)
+        assert all(len(per_class[key]) == len(fused[key]) == args.spaces for key in classes)
+        print(f"{name + ':':<10} per class {per_class_time:.3f} s   fused {fused_time:.3f} s  "
+              f"({per_class_time / fused_time:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
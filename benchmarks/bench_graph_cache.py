@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Benchmark ModelLoader construction with and without the parsed-graph cache.
+
+    python benchmarks/bench_graph_cache.py [--source FILE] [--repeat N]
+
+Defaults to the bundled 223P ontology as a stand-in for a large model file.
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from rdflib import BNode
+
+from semantic_objects.graph_cache import GraphCache
+from semantic_objects.model_loader import ModelLoader
+
+DEFAULT_SOURCE = Path(__file__).resolve().parents[1] / 'src/semantic_objects/ontologies/s223/223p.ttl'
+
+
+def same_triples(a, b):
+    """Same size and same ground triples (a full isomorphism check on a
+    blank-node-heavy ontology takes far longer than the benchmark itself)."""
+    def ground(g):
+        return {t for t in g if not any(isinstance(term, BNode) for term in t)}
+    return len(a) == len(b) and ground(a) == ground(b)
+
+
+def best_of(repeat, fn):
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--source', default=str(DEFAULT_SOURCE))
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = GraphCache(directory)
+        start = time.perf_counter()
+        ModelLoader(args.source, cache=cache)
+        first_time = time.perf_counter() - start
+
+        parse_time, parsed = best_of(args.repeat, lambda: ModelLoader(args.source))
+        cached_time, cached = best_of(args.repeat, lambda: ModelLoader(args.source, cache=cache))
+
+        print(f"source:       {args.source} ({len(parsed.g)} triples)")
+        print(f"parse:        {parse_time:.3f} s")
+        print(f"first cached: {first_time:.3f} s  (parse + store, {cache.size()} bytes)")
+        print(f"cache hit:    {cached_time:.3f} s")
+        print(f"speedup:      {parse_time / cached_time:.1f}x")
+        print(f"same triples: {same_triples(parsed.g, cached.g)}")
+
+
+if __name__ == '__main__':
+    main()
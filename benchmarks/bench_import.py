@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Benchmark the cost of `import semantic_objects.s223; s223.Pump`.
+
+Each measurement runs in a fresh interpreter:
+
+  eager:  import the package and everything it re-exports up front - the
+          model loader (pandas, buildingmotif) and every generated s223
+          class, which is what the import used to cost
+  lazy:   the import as it is now - top-level exports and the ontology
+          packages' names resolve on first use
+  split:  the same, against a copy of the package whose s223 _generated/
+          package was regenerated with --split (one module per class), so
+          `s223.Pump` only imports Pump and its ancestors
+
+    python benchmarks/bench_import.py [--repeat N]
+"""
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / 'src'
+
+LAZY = "import semantic_objects.s223 as s223; s223.Pump"
+EAGER = ("import semantic_objects.s223 as s223; import semantic_objects.model_loader; "
+         "from semantic_objects.lazy import load_all; "
+         "[load_all(m) for m in (s223, s223.entities, s223.enumerationkinds, s223.relations)]; s223.Pump")
+
+
+def run(statement, path):
+    code = ("import time; start = time.perf_counter(); "
+            f"{statement}; print(time.perf_counter() - start)")
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(path), os.environ.get('PYTHONPATH')])))
+    output = subprocess.run([sys.executable, '-c', code], env=env, check=True,
+                            capture_output=True, text=True).stdout
+    return float(output.split()[-1])
+
+
+def split_copy(directory):
+    """Copy the package into `directory` and regenerate s223 there with --split."""
+    src = Path(directory) / 'src'  # the ingest CLI locates ontologies relative to src/
+    shutil.copytree(SRC / 'semantic_objects', src / 'semantic_objects',
+                    ignore=shutil.ignore_patterns('__pycache__'))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(src), os.environ.get('PYTHONPATH')])))
+    subprocess.run([sys.executable, '-m', 'semantic_objects.ingest.cli', '--ontology', 's223', '--split'],
+                   env=env, check=True, capture_output=True)
+    return src
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        cases = [('eager', EAGER, SRC), ('lazy', LAZY, SRC), ('split', LAZY, split_copy(directory))]
+        for _, statement, path in cases:
+            run(statement, path)  # warm the bytecode caches
+        results = {label: statistics.median(run(statement, path) for _ in range(args.repeat))
+                   for label, statement, path in cases}
+
+    print(f"import semantic_objects.s223; s223.Pump  (median of {args.repeat})")
+    for label, seconds in results.items():
+        print(f"{label:6s} {seconds * 1000:7.0f} ms  ({results['eager'] / seconds:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
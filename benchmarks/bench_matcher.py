@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Benchmark the native pattern matcher against SPARQL evaluation.
+
+Same synthetic model as bench_model_loader.py (N spaces, each with an Area
+value and unit):
+
+  query_to_df:  the class's prepared query through rdflib's SPARQL engine
+  planned:      the same with the planner's pattern order (ModelLoader with
+                native=False)
+  native:       query_class() with the native matcher (ModelLoader default)
+  load:         load_instances() with the planned SPARQL query vs the matcher
+
+    python benchmarks/bench_matcher.py [--spaces N]
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_model_loader import build_graph, timed
+from semantic_objects.model_loader import ModelLoader, query_to_df
+from examples.s223_framework_demo import Space
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--spaces', type=int, default=1000)
+    args = parser.parse_args()
+
+    graph = build_graph(args.spaces)
+    sparql, native = ModelLoader(graph, native=False), ModelLoader(graph)
+    df_time, df = timed(query_to_df, Space.get_prepared_query(ontology='s223'), graph)
+    planned_time, planned = timed(sparql.query_class, Space, 's223')
+    native_time, matched = timed(native.query_class, Space, 's223')
+    assert len(df) == len(planned) == len(matched) == args.spaces
+    assert sorted(df['name']) == sorted(matched['name'])
+
+    sparql_load_time, loaded = timed(sparql.load_instances, Space, 's223')
+    native_load_time, matched_loaded = timed(native.load_instances, Space, 's223')
+    assert len(loaded) == len(matched_loaded) == args.spaces
+
+    print(f"spaces:       {args.spaces}")
+    print(f"query_to_df:  {df_time:.3f} s")
+    print(f"planned:      {planned_time:.3f} s  ({df_time / planned_time:.1f}x)")
+    print(f"native:       {native_time:.3f} s  ({df_time / native_time:.1f}x, {planned_time / native_time:.1f}x planned)")
+    print(f"load:         sparql {sparql_load_time:.3f} s   native {native_load_time:.3f} s  "
+          f"({sparql_load_time / native_load_time:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Benchmark loading property values from the query rows on a sparse model.
+
+N spaces (as in bench_model_loader.py) in a model with OTHER further
+properties carrying values and units - points, setpoints and the like that
+aren't loaded. Class queries match each property's value and unit with
+OPTIONAL blocks, so
+
+  lookups:  the values and units indexed from the whole graph (one pass over
+            every s223:hasValue and qudt:hasUnit triple), as before
+  rows:     the same load taking them from the query rows, with no graph pass
+
+    python benchmarks/bench_optional.py [--spaces N] [--other N]
+"""
+import argparse
+import sys
+from pathlib import Path
+
+from rdflib import Literal
+from rdflib.namespace import RDF
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_model_loader import EX, build_graph, timed
+from semantic_objects.model_loader import ModelLoader, _TermLookups
+from semantic_objects.namespaces import S223, QUDT, UNIT
+from examples.s223_framework_demo import Space
+
+
+class _GraphLookups(_TermLookups):
+    """Ignores the values and units query rows bind."""
+
+    def bind_row(self, row, seeds):
+        pass
+
+
+def add_points(graph, count):
+    for i in range(count):
+        point = EX[f'Point{i}']
+        graph.add((point, RDF.type, S223.QuantifiableObservableProperty))
+        graph.add((point, S223.hasValue, Literal(float(i))))
+        graph.add((point, QUDT.hasUnit, UNIT.DEG_C))
+    return graph
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--spaces', type=int, default=200)
+    parser.add_argument('--other', type=int, default=200000)
+    args = parser.parse_args()
+
+    graph = add_points(build_graph(args.spaces), args.other)
+    loader = ModelLoader(graph)
+    loader.query_class(Space, 's223')  # gather statistics outside the timing
+
+    lookup_time, looked_up = timed(loader._load_rows, Space, 's223', {}, _GraphLookups(graph, bulk=True))
+    row_time, from_rows = timed(loader._load_rows, Space, 's223', {}, _TermLookups(graph, bulk=True))
+    assert [s.area.value for s in looked_up] == [s.area.value for s in from_rows]
+    assert len(from_rows) == args.spaces
+
+    print(f"spaces:   {args.spaces}  (graph: {len(graph)} triples)")
+    print(f"lookups:  {lookup_time:.3f} s")
+    print(f"rows:     {row_time:.3f} s  ({lookup_time / row_time:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Benchmark ModelLoader.query_class with and without planned pattern order.
+
+Same synthetic model as bench_model_loader.py (N spaces, each with an Area
+value and unit). The Space query joins spaces to their areas; rdflib's own
+pattern order pairs every area with every space (N^2), the planned one (see
+semantic_objects.planner) follows hasProperty from each area (N):
+
+  unplanned:   the class's prepared query, as query_class ran it before
+  planned:     query_class() - statistics gathered and the query planned on
+               first use, included in the timing
+  cached:      query_class() again, reusing both
+
+The loader runs SPARQL (native=False), not the native matcher.
+
+    python benchmarks/bench_planner.py [--spaces N]
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_model_loader import build_graph, evaluate, timed
+from semantic_objects.model_loader import ModelLoader
+from examples.s223_framework_demo import Space
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--spaces', type=int, default=1000)
+    args = parser.parse_args()
+
+    loader = ModelLoader(build_graph(args.spaces), native=False)
+    unplanned_time, results = timed(evaluate, loader.g, Space.get_prepared_query(ontology='s223'))
+    planned_time, df = timed(loader.query_class, Space, 's223')
+    cached_time, _ = timed(loader.query_class, Space, 's223')
+    assert len(results) == len(df) == args.spaces
+
+    print(f"spaces:     {args.spaces}")
+    print(f"unplanned:  {unplanned_time:.3f} s")
+    print(f"planned:    {planned_time:.3f} s  ({unplanned_time / planned_time:.1f}x)")
+    print(f"cached:     {cached_time:.3f} s  ({unplanned_time / cached_time:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Benchmark load_portfolio scaling with worker count on synthetic models.
+
+Writes M synthetic building models (N spaces and N windows each, with area/
+azimuth/tilt properties) to a temporary directory, then loads Space from all
+of them with 1, 2, 4, ... up to --max-workers processes. Windows are parsed
+but not loaded - the generated Window query's cost depends heavily on its
+pattern order, which would make per-model work too uneven to compare.
+
+    python benchmarks/bench_portfolio.py [--models M] [--spaces N] [--max-workers W]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from rdflib import Graph, Literal, Namespace
+from rdflib.namespace import RDF
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from semantic_objects.namespaces import S223, QUDT, UNIT, bind_prefixes
+from semantic_objects.portfolio import load_portfolio
+from examples.s223_framework_demo import Space
+
+QK = Namespace('http://qudt.org/vocab/quantitykind/')
+
+
+def add_property(g, owner, prop, quantity_kind, value):
+    g.add((owner, S223.hasProperty, prop))
+    g.add((prop, RDF.type, S223.QuantifiableObservableProperty))
+    g.add((prop, S223.hasQuantityKind, QK[quantity_kind]))
+    g.add((prop, S223.hasValue, Literal(value)))
+    g.add((prop, QUDT.hasUnit, UNIT.FT_2))
+
+
+def write_model(path, building, n_spaces):
+    ex = Namespace(f'http://example.org/building{building}#')
+    g = Graph()
+    bind_prefixes(g)
+    g.bind('ex', ex)
+    for i in range(n_spaces):
+        space, window = ex[f'Space{i}'], ex[f'Window{i}']
+        g.add((space, RDF.type, S223.Space))
+        add_property(g, space, ex[f'Space{i}_Area'], 'Area', float(i + 1))
+        g.add((window, RDF.type, S223.Window))
+        for quantity_kind in ('Area', 'Azimuth', 'Tilt'):
+            add_property(g, window, ex[f'Window{i}_{quantity_kind}'], quantity_kind, float(i))
+    g.serialize(destination=str(path), format='turtle')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--models', type=int, default=16)
+    parser.add_argument('--spaces', type=int, default=200)
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [Path(tmp) / f'building_{i}.ttl' for i in range(args.models)]
+        for i, path in enumerate(paths):
+            write_model(path, i, args.spaces)
+
+        print(f"models: {args.models}, spaces/windows per model: {args.spaces}")
+        baseline = None
+        workers = 1
+        while workers <= args.max_workers:
+            start = time.perf_counter()
+            results = load_portfolio(paths, [Space], ontology='s223', max_workers=workers)
+            elapsed = time.perf_counter() - start
+            assert all(result.ok for result in results)
+            assert all(len(result.instances['Space']) == args.spaces for result in results)
+            baseline = baseline or elapsed
+            print(f"workers={workers:<3} {elapsed:7.2f} s  speedup {baseline / elapsed:4.1f}x")
+            workers *= 2
+
+
+if __name__ == '__main__':
+    main()
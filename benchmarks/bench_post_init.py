@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Benchmark bulk construction of semantic objects (Resource.__post_init__).
+
+  per-field:   what __post_init__ used to do - inspect every dataclass field
+               (get_origin/get_args/isinstance/issubclass) on every construction
+  compiled:    the current __post_init__ - run the class's precompiled
+               coercion plan (see core._coercion_plan) only
+
+Constructs N instances of a generated s223 class with no Resource-typed
+fields left to coerce (Window) and of one whose field is coerced from a raw
+value (the demo Space, `area=<number>`).
+
+    python benchmarks/bench_post_init.py [--instances N]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import get_args, get_origin
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from semantic_objects.core import Node, Resource
+from semantic_objects.s223 import entities
+from examples.s223_framework_demo import Space
+
+
+def per_field_post_init(self):
+    """The pre-compiled-plan Resource.__post_init__, kept for comparison."""
+    if not hasattr(self.__class__, '__dataclass_fields__'):
+        return
+    for field_name, field_obj in self.__class__.__dataclass_fields__.items():
+        if not hasattr(self, field_name):
+            continue
+        current_value = getattr(self, field_name)
+        if current_value is None:
+            continue
+        expected_type = field_obj.type
+        origin = get_origin(expected_type)
+        if origin is not None:
+            args = get_args(expected_type)
+            if args:
+                expected_type = args[0]
+        if isinstance(current_value, expected_type):
+            continue
+        if (isinstance(expected_type, type) and
+                issubclass(expected_type, Resource) and
+                not isinstance(current_value, Resource)):
+            try:
+                setattr(self, field_name, expected_type(current_value))
+            except Exception:
+                pass
+
+
+_instance_counter = {}
+
+
+def per_field_node_post_init(self):
+    per_field_post_init(self)
+    if self._name is None or self._name == self.__class__.__name__:
+        class_name = self.__class__.__name__
+        if class_name not in _instance_counter:
+            _instance_counter[class_name] = 0
+        _instance_counter[class_name] += 1
+        self._name = f"{class_name}_{_instance_counter[class_name]}"
+
+
+def construct(make, count):
+    start = time.perf_counter()
+    for i in range(count):
+        make(i)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--instances', type=int, default=50000)
+    args = parser.parse_args()
+
+    cases = [
+        ('Window', lambda i: entities.Window(None, None)),
+        ('Space(area=...)', lambda i: Space(area=float(i))),
+    ]
+    print(f"instances: {args.instances}")
+    for label, make in cases:
+        make(0)  # warm the schema caches
+        compiled = construct(make, args.instances)
+        current = (Resource.__post_init__, Node.__post_init__)
+        Resource.__post_init__, Node.__post_init__ = per_field_post_init, per_field_node_post_init
+        try:
+            per_field = construct(make, args.instances)
+        finally:
+            Resource.__post_init__, Node.__post_init__ = current
+        print(f"{label:16s} per-field: {per_field / args.instances * 1e6:6.2f} us  "
+              f"compiled: {compiled / args.instances * 1e6:6.2f} us  "
+              f"({per_field / compiled:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
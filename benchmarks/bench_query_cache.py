@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Benchmark repeated ModelLoader.query_class calls with the per-class query cache.
+
+  uncached: what every call used to do - build the query with a fresh
+            SparqlQueryBuilder and have rdflib parse it
+  cached:   get_prepared_query() - built and parsed once per class/ontology
+
+Both are evaluated against a small model so the numbers are dominated by
+query construction and parsing, as in an API server answering many small
+requests.
+
+    python benchmarks/bench_query_cache.py [--calls N] [--spaces N]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from rdflib.plugins.sparql import prepareQuery
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bench_model_loader import build_graph
+from semantic_objects.model_loader import ModelLoader
+from semantic_objects.query import SparqlQueryBuilder
+from examples.s223_framework_demo import Space, Window
+
+CLASSES = [Space, Window]
+
+
+def uncached(loader):
+    rows = 0
+    for cls in CLASSES:
+        query = prepareQuery(SparqlQueryBuilder(cls).get_sparql_query('s223'))
+        rows += len(loader.g.query(query))
+    return rows
+
+
+def cached(loader):
+    rows = 0
+    for cls in CLASSES:
+        rows += len(loader.g.query(cls.get_prepared_query(ontology='s223')))
+    return rows
+
+
+def timed(calls, fn, loader):
+    start = time.perf_counter()
+    for _ in range(calls):
+        rows = fn(loader)
+    return time.perf_counter() - start, rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--calls', type=int, default=100)
+    parser.add_argument('--spaces', type=int, default=5)
+    args = parser.parse_args()
+
+    loader = ModelLoader(build_graph(args.spaces))
+    cached(loader)  # warm the schema caches so both paths build the same thing
+
+    uncached_time, uncached_rows = timed(args.calls, uncached, loader)
+    cached_time, cached_rows = timed(args.calls, cached, loader)
+
+    print(f"calls: {args.calls} x {len(CLASSES)} classes, spaces: {args.spaces}")
+    print(f"uncached: {uncached_time / args.calls * 1000:.2f} ms/call  ({uncached_rows} rows)")
+    print(f"cached:   {cached_time / args.calls * 1000:.2f} ms/call  ({cached_rows} rows)")
+    print(f"speedup:  {uncached_time / cached_time:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
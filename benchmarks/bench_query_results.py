@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Benchmark peak memory of query_to_df against the streaming results API.
+
+Evaluates a wide SELECT DISTINCT * over a synthetic model (see
+bench_model_loader.py) and reports time and peak traced Python memory for:
+
+  query_to_df:   one dict per row, then one DataFrame
+  query_batches: typed DataFrames of --batch-size rows, consumed one at a time
+  query_rows:    row tuples, consumed one at a time
+
+The model is queried on the Oxigraph store so evaluation doesn't dominate.
+
+    python benchmarks/bench_query_results.py [--spaces N] [--batch-size N]
+"""
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bench_model_loader import build_graph
+from semantic_objects.model_loader import query_to_df
+from semantic_objects.results import query_batches, query_rows
+from semantic_objects.stores import to_store
+from examples.s223_framework_demo import Space
+
+
+def measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    rows = fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--spaces', type=int, default=50000)
+    parser.add_argument('--batch-size', type=int, default=10000)
+    args = parser.parse_args()
+
+    g = to_store(build_graph(args.spaces), 'oxigraph')
+    query = Space.get_sparql_query(ontology='s223')
+
+    paths = {
+        'query_to_df': lambda: len(query_to_df(query, g)),
+        'query_batches': lambda: sum(len(b) for b in query_batches(query, g, batch_size=args.batch_size)),
+        'query_rows': lambda: sum(1 for _ in query_rows(query, g)),
+    }
+    print(f"spaces: {args.spaces}, batch size: {args.batch_size}")
+    for name, fn in paths.items():
+        elapsed, peak, rows = measure(fn)
+        print(f"{name:14} {elapsed:7.2f} s  peak {peak / 2**20:8.1f} MiB  ({rows} rows)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Benchmark resolving RDF IRIs to semantic object classes.
+
+  scan:      what callers had to do without a registry - walk the classes of
+             the ontology modules comparing each one's IRI
+  registry:  registry.class_for_iri, a dict lookup
+
+Resolves the IRI of every class in the s223 and watr packages once, plus a
+`descendants` query per class.
+
+    python benchmarks/bench_registry.py
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from semantic_objects import s223, watr
+from semantic_objects.core import Resource
+from semantic_objects.lazy import load_all
+from semantic_objects.registry import class_for_iri, descendants
+
+
+def module_classes():
+    modules = [s223.entities, s223.relations, s223.properties, watr.entities, watr.relations]
+    return [v for m in modules for v in vars(load_all(m)).values()
+            if isinstance(v, type) and issubclass(v, Resource) and hasattr(v, '_ns')]
+
+
+def scan_for_iri(classes, iri):
+    for cls in classes:
+        if cls._get_iri() == iri:
+            return cls
+    return None
+
+
+def scan_descendants(classes, base):
+    return [cls for cls in classes if cls is not base and issubclass(cls, base)]
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    classes = module_classes()
+    iris = [cls._get_iri() for cls in classes]
+    print(f"classes: {len(classes)}")
+
+    scan = timed(lambda: [scan_for_iri(classes, iri) for iri in iris])
+    registry = timed(lambda: [class_for_iri(iri) for iri in iris])
+    print(f"IRI -> class  scan: {scan * 1000:8.1f} ms  registry: {registry * 1000:6.2f} ms  "
+          f"({scan / registry:.0f}x)")
+
+    scan = timed(lambda: [scan_descendants(classes, cls) for cls in classes])
+    registry = timed(lambda: [descendants(cls) for cls in classes])
+    print(f"descendants   scan: {scan * 1000:8.1f} ms  registry: {registry * 1000:6.2f} ms  "
+          f"({scan / registry:.0f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Benchmark related-class discovery (Resource.get_related_classes).
+
+  bfs:      what get_related_classes used to do - a breadth-first search per
+            class with list membership checks, merged into the module's
+            lists with more list membership checks
+  closure:  the current implementation - one memoized transitive closure of
+            the class reference graph (see schema.related_classes)
+
+Runs get_module_classes over the s223 package, then over a synthetic chain
+of N classes where each references the previous one, which is where the
+per-class search goes quadratic (and the merge cubic).
+
+    python benchmarks/bench_related_classes.py [--chain N]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from semantic_objects import s223
+from semantic_objects.core import Node, Resource, semantic_object
+from semantic_objects.fields import required_field
+from semantic_objects.lazy import load_all
+from semantic_objects.schema import related_classes
+from semantic_objects.s223 import relations
+
+
+def bfs_related_classes(cls):
+    """The pre-closure Resource.get_related_classes(), kept for comparison."""
+    def _is_subclass_of_name(klass, base_name):
+        if not isinstance(klass, type):
+            return False
+        return any(base.__name__ == base_name for base in klass.__mro__)
+
+    all_classes = list(set([cls] + [relation for relation, _ in cls.get_relations()]
+                           + [f.type for f in cls.__dataclass_fields__.values()]))
+    new_classes = all_classes.copy()
+    while new_classes:
+        next_new_classes = []
+        for klass in new_classes:
+            if not _is_subclass_of_name(klass, 'Resource'):
+                continue
+            next_classes = ([relation for relation, _ in klass.get_relations()]
+                            + [f.type for f in klass.__dataclass_fields__.values()])
+            for next_class in next_classes:
+                if next_class not in all_classes:
+                    next_new_classes.append(next_class)
+                    all_classes.append(next_class)
+        new_classes = next_new_classes
+
+    predicate_lst, entity_lst = [], []
+    for klass in all_classes:
+        if not _is_subclass_of_name(klass, 'Resource') or getattr(klass, 'abstract', False):
+            continue
+        if _is_subclass_of_name(klass, 'Predicate'):
+            predicate_lst.append(klass)
+        elif _is_subclass_of_name(klass, 'Node'):
+            entity_lst.append(klass)
+    return predicate_lst, entity_lst
+
+
+def bfs_module_classes(classes):
+    predicate_lst, entity_lst = [], []
+    for cls in classes:
+        for lst, new_klasses in zip([predicate_lst, entity_lst], bfs_related_classes(cls)):
+            for klass in new_klasses:
+                if klass not in lst:
+                    lst.append(klass)
+    return predicate_lst, entity_lst
+
+
+def chain(length):
+    classes = []
+    previous = Node
+    for i in range(length):
+        namespace = {'__annotations__': {'previous': previous},
+                     'previous': required_field(relation=relations.contains)}
+        previous = semantic_object(type(f'Link{i}', (Node,), namespace))
+        classes.append(previous)
+    return classes
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--chain', type=int, default=400)
+    args = parser.parse_args()
+
+    modules = [s223.entities, s223.relations, s223.properties]
+    s223_classes = [v for m in modules for v in vars(load_all(m)).values()
+                    if isinstance(v, type) and issubclass(v, Resource)]
+    cases = [('s223', s223_classes), (f'chain of {args.chain}', chain(args.chain))]
+
+    for label, classes in cases:
+        for cls in classes:
+            cls.get_relations()  # warm the schema caches both variants share
+        bfs, expected = timed(bfs_module_classes, classes)
+        closure, result = timed(related_classes, classes)
+        assert [set(lst) for lst in result] == [set(lst) for lst in expected]
+        print(f"{label:14s} bfs: {bfs * 1000:8.1f} ms  closure: {closure * 1000:6.1f} ms  "
+              f"({bfs / closure:.0f}x)")
+
+
+if __name__ == '__main__':
+    main()
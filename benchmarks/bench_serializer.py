@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Benchmark serializing instances to RDF.
+
+  evaluate:  BMotifSession.evaluate, one BuildingMOTIF template evaluation per
+             object (timed on a sample and extrapolated)
+  to_graph:  serializer.to_graph into an rdflib Graph (Graph.addN)
+  stream:    serializer.to_graph written as N-Triples to a file
+
+The model is N windows, each with area/azimuth/tilt properties, so 4N
+objects in all.
+
+    python benchmarks/bench_serializer.py [--windows N] [--sample N]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from semantic_objects.build_model import BMotifSession
+from semantic_objects.s223.properties import Area, Azimuth, Tilt
+from semantic_objects.serializer import to_graph
+from examples.s223_framework_demo import Window
+
+
+def build(count):
+    return [Window(area=Area(value=float(i)), azimuth=Azimuth(value=180.0), tilt=Tilt(value=90.0))
+            for i in range(count)]
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--windows', type=int, default=12500)
+    parser.add_argument('--sample', type=int, default=20)
+    args = parser.parse_args()
+
+    windows = build(args.windows)
+    objects = args.windows * 4
+    print(f"objects: {objects}")
+
+    session = BMotifSession(ns='bench')
+    sample = build(args.sample)
+    devnull = open(os.devnull, 'w')
+    stdout, sys.stdout = sys.stdout, devnull  # evaluate prints every binding dict
+    try:
+        session.evaluate(sample[0])  # builds the templates
+        evaluate, _ = timed(lambda: [session.evaluate(window) for window in sample[1:]])
+    finally:
+        sys.stdout = stdout
+    estimate = evaluate / (args.sample - 1) * args.windows
+    print(f"evaluate: {estimate:8.1f} s  (extrapolated from {args.sample - 1} windows)")
+
+    seconds, graph = timed(lambda: to_graph(windows, namespace='urn:bench#'))
+    print(f"to_graph: {seconds:8.1f} s  ({len(graph)} triples, {estimate / seconds:.0f}x)")
+
+    with tempfile.TemporaryFile('w') as f:
+        seconds, _ = timed(lambda: to_graph(windows, f, namespace='urn:bench#'))
+    print(f"stream:   {seconds:8.1f} s  ({estimate / seconds:.0f}x)")
+
+
+if __name__ == '__main__':
+    main()
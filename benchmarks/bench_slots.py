@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Benchmark memory per instance of plain vs slotted semantic objects.
+
+Builds N instances of the same three-field class declared with
+@semantic_object and with @semantic_object(slots=True), and reports the bytes
+each instance costs (measured with tracemalloc, so the per-instance __dict__
+is included) and the time to construct them.
+
+    python benchmarks/bench_slots.py [--instances N]
+"""
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from semantic_objects.core import semantic_object
+from semantic_objects.fields import required_field
+from semantic_objects.s223 import enumerationkinds, relations
+from semantic_objects.s223.core import Node
+
+
+@semantic_object
+class PlainConnection(Node):
+    label = 'Plain connection'
+    medium: enumerationkinds.Medium = required_field(relation=relations.hasMedium)
+    note: Optional[str] = required_field()
+    size: Optional[float] = required_field()
+
+
+@semantic_object(slots=True)
+class SlottedConnection(Node):
+    label = 'Slotted connection'
+    medium: enumerationkinds.Medium = required_field(relation=relations.hasMedium)
+    note: Optional[str] = required_field()
+    size: Optional[float] = required_field()
+
+
+def build(cls, count):
+    instances = []
+    for i in range(count):
+        instance = cls(medium=enumerationkinds.Air, note=None, size=float(i))
+        instance._name = f'conn{i}'
+        instances.append(instance)
+    return instances
+
+
+def measure(cls, count):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    instances = build(cls, count)
+    elapsed = time.perf_counter() - start
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # Exclude the list and the _name strings, which both variants share
+    shared = sys.getsizeof(instances) + sum(sys.getsizeof(i._name) for i in instances)
+    shared += sum(sys.getsizeof(i.size) for i in instances)
+    return (used - shared) / count, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--instances', type=int, default=100000)
+    args = parser.parse_args()
+
+    build(PlainConnection, 10)  # warm up
+    build(SlottedConnection, 10)
+    plain_bytes, plain_time = measure(PlainConnection, args.instances)
+    slotted_bytes, slotted_time = measure(SlottedConnection, args.instances)
+
+    print(f"instances: {args.instances}")
+    print(f"plain:   {plain_bytes:.0f} bytes/instance  ({plain_time:.2f} s to build)")
+    print(f"slotted: {slotted_bytes:.0f} bytes/instance  ({slotted_time:.2f} s to build)")
+    print(f"saved:   {1 - slotted_bytes / plain_bytes:.0%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Benchmark the default rdflib store against Oxigraph for ModelLoader.
+
+Writes a synthetic model of N spaces (see bench_model_loader.py) to a Turtle
+file, then for each store times parsing it into a ModelLoader and evaluating
+the loader's generated `SELECT DISTINCT *` queries (results fully
+materialized), plus a full load_instances().
+
+    python benchmarks/bench_stores.py [--spaces N] [--repeat N]
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bench_model_loader import build_graph
+from semantic_objects.model_loader import ModelLoader
+from examples.s223_framework_demo import Space, Window
+
+STORES = ['default', 'oxigraph']
+CLASSES = [Space, Window]
+
+
+def best_of(repeat, fn):
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--spaces', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    queries = {cls.__name__: cls.get_sparql_query(ontology='s223') for cls in CLASSES}
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = str(Path(directory) / 'model.ttl')
+        build_graph(args.spaces).serialize(destination=path, format='turtle')
+        print(f"spaces: {args.spaces}")
+
+        timings = {}
+        for store in STORES:
+            parse_time, loader = best_of(args.repeat, lambda: ModelLoader(path, store=store))
+            row = {'parse': parse_time}
+            for name, query in queries.items():
+                row[f'query {name}'], rows = best_of(args.repeat, lambda: list(loader.g.query(query)))
+                row[f'rows {name}'] = len(rows)
+            row['load Space'], _ = best_of(
+                args.repeat, lambda: loader.load_instances(Space, ontology='s223')
+            )
+            timings[store] = row
+
+        print(f"{'':16}" + ''.join(f"{store:>12}" for store in STORES))
+        for key in timings[STORES[0]]:
+            cells = [timings[store][key] for store in STORES]
+            if key.startswith('rows'):
+                print(f"{key:16}" + ''.join(f"{cell:>12}" for cell in cells))
+            else:
+                print(f"{key:16}" + ''.join(f"{cell:>11.3f}s" for cell in cells))
+
+
+if __name__ == '__main__':
+    main()
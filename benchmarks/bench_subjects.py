@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Benchmark loading a subset of a class's instances by IRI.
+
+Same synthetic model as bench_model_loader.py (N spaces, each with an Area
+value and unit); --subjects of the spaces are loaded as Space:
+
+  filtered:  load_instances() of the whole class, filtered afterwards
+  subjects:  load_instances(subjects=...), the query restricted with VALUES
+             blocks of --chunk-size IRIs
+
+with rdflib's SPARQL engine (native=False), the native matcher and Oxigraph.
+
+    python benchmarks/bench_subjects.py [--spaces N] [--subjects K] [--chunk-size C]
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_model_loader import EX, build_graph, timed
+from semantic_objects.model_loader import ModelLoader
+from examples.s223_framework_demo import Space
+
+
+def load_filtered(loader, subjects):
+    wanted = {str(subject) for subject in subjects}
+    return [space for space in loader.load_instances(Space, ontology='s223')
+            if str(loader.identity_map.iri_of(space)) in wanted]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--spaces', type=int, default=20000)
+    parser.add_argument('--subjects', type=int, default=500)
+    parser.add_argument('--chunk-size', type=int, default=500)
+    args = parser.parse_args()
+
+    graph = build_graph(args.spaces)
+    step = max(args.spaces // args.subjects, 1)
+    subjects = [EX[f'Space{i}'] for i in range(0, args.spaces, step)][:args.subjects]
+    loaders = {
+        'sparql': lambda: ModelLoader(graph, native=False),
+        'native': lambda: ModelLoader(graph),
+        'oxigraph': lambda: ModelLoader(graph, store='oxigraph'),
+    }
+
+    print(f"spaces:    {args.spaces}   subjects: {len(subjects)}   chunk size: {args.chunk_size}")
+    for name, make_loader in loaders.items():
+        filtered_loader, subject_loader = make_loader(), make_loader()
+        filtered_time, filtered = timed(load_filtered, filtered_loader, subjects)
+        subjects_time, loaded = timed(lambda: subject_loader.load_instances(
+            Space, ontology='s223', subjects=subjects, chunk_size=args.chunk_size))
+        assert len(filtered) == len(loaded) == len(subjects)
+        print(f"{name + ':':<10} filtered {filtered_time:.3f} s   subjects {subjects_time:.3f} s  "
+              f"({filtered_time / subjects_time:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -49,6 +49,18 @@ class Space(DomainSpace):
         if not isinstance(self.area, Area):
             self.area = Area(self.area)
 
+    @classmethod
+    def _bulk_post_init(cls, columns, length):
+        """The same conversion for a batch (see Resource.bulk_create)"""
+        super()._bulk_post_init(columns, length)
+        areas = columns.get('area')
+        if areas is None:
+            return
+        rows = [i for i, area in enumerate(areas) if not isinstance(area, Area)]
+        if rows:
+            for i, area in zip(rows, Area.bulk_create(value=[areas[i] for i in rows])):
+                areas[i] = area
+
 
 @semantic_object
 class Space_TwoArea(Space):
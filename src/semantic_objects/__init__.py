@@ -1,4 +1,13 @@
-from .model_loader import ModelLoader, query_to_df
+from .lazy import lazy_exports as _lazy_exports
+
+# Lazy so that importing an ontology package (`import semantic_objects.s223`)
+# doesn't import the loader's pandas/SPARQL dependencies
+_exports_getattr, __dir__ = _lazy_exports(__name__, {
+    'ModelLoader': '.model_loader',
+    'query_to_df': '.model_loader',
+    'query_batches': '.results',
+    'query_rows': '.results',
+})
 
 
 def __getattr__(name):
@@ -11,4 +20,4 @@ def __getattr__(name):
         module = importlib.import_module(f'.{name}', __name__)
         globals()[name] = module
         return module
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
+    return _exports_getattr(name)
\ No newline at end of file
@@ -0,0 +1,199 @@
+"""
+Bulk - Create many semantic objects at once from columns of field values
+
+`Pump(...)` runs the dataclass `__init__` and the `__post_init__` chain
+(Resource-field coercion, name allocation, per-class defaults) once per
+object. `Pump.bulk_create(**columns)` does the same work a column at a time:
+
+  columns are checked (names and lengths) once, and missing ones filled
+  from the field defaults
+  each class's `_bulk_post_init` - the column-wise counterpart of its
+  `__post_init__` - runs once for the whole batch: raw values are coerced
+  into Resources with one nested `bulk_create` per field, names are
+  allocated in one block, default units looked up once per quantity kind
+  the objects are then filled in attribute by attribute, without `__init__`
+
+    points = pd.read_csv('points.csv')
+    sensors = TemperatureSensor.bulk_create(_name=points['tag'], observes=...)
+    frame = Space.bulk_create(area=areas, as_frame=True)   # a ResourceFrame
+
+A column is a list, tuple, range or 1-d array (NumPy, pandas); any other
+value is used for every object. `_name` may be given as a column of instance
+names (None allocates one, as the constructor would). Classes whose
+`__post_init__` (or a base's) has no `_bulk_post_init` are built with their
+constructor, one object at a time, so results are always the same as calling
+the class - except that automatic names are allocated a column at a time, so
+a batch can number them in another order than one-by-one construction would.
+"""
+
+import gc
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import MISSING
+from itertools import repeat
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Type, Union
+
+from .schema import get_schema
+
+if TYPE_CHECKING:
+    from .frame import ResourceFrame
+
+
+def _as_column(value):
+    """value as a list if it's a column (see module docstring), else None."""
+    if isinstance(value, (list, tuple, range)):
+        return list(value)
+    if getattr(value, 'ndim', 0) == 1 and hasattr(value, 'tolist'):
+        return value.tolist()  # plain Python scalars, not NumPy ones
+    return None
+
+
+def prepare_columns(cls, columns: Dict[str, Any]) -> Tuple[int, Dict[str, list]]:
+    """
+    Check columns against cls's init fields and expand them to lists of one
+    common length, filling absent fields from their defaults.
+
+    Raises:
+        TypeError: for a column that isn't an init field, or a missing
+            required field (as the constructor would)
+        ValueError: if columns have different lengths, or none is a column
+    """
+    init_fields, _, _ = get_schema(cls).construction_plan
+    known = {name for name, _, _ in init_fields}
+    unexpected = [name for name in columns if name not in known and name != '_name']
+    if unexpected:
+        raise TypeError(f"{cls.__name__}.bulk_create() got unexpected column(s): {', '.join(map(repr, unexpected))}")
+    missing = [name for name, default, factory in init_fields
+               if name not in columns and default is MISSING and factory is MISSING]
+    if missing:
+        raise TypeError(f"{cls.__name__}.bulk_create() missing required column(s): {', '.join(map(repr, missing))}")
+
+    expanded = {name: _as_column(value) for name, value in columns.items()}
+    lengths = {name: len(column) for name, column in expanded.items() if column is not None}
+    if not lengths:
+        raise ValueError(f"{cls.__name__}.bulk_create() needs at least one column (list or array) "
+                         f"to know how many objects to create")
+    length = next(iter(lengths.values()))
+    if any(n != length for n in lengths.values()):
+        raise ValueError("columns have different lengths: "
+                         + ', '.join(f"{name}={n}" for name, n in lengths.items()))
+
+    prepared = {}
+    for name, column in expanded.items():
+        prepared[name] = column if column is not None else [columns[name]] * length
+    for name, default, factory in init_fields:
+        if name not in prepared:
+            prepared[name] = [default] * length if factory is MISSING else [factory() for _ in range(length)]
+    return length, prepared
+
+
+def coerce_column(column: list, resource_class: Type) -> list:
+    """
+    Wrap the raw values in column (not None, not already Resources) in
+    resource_class, in place, as `Resource.__post_init__` does one value at a
+    time with `resource_class(value)` - here with a single nested bulk_create.
+    Values the class can't be built from are left as they are.
+    """
+    from .core import Resource
+
+    rows = [i for i, value in enumerate(column) if value is not None and not isinstance(value, Resource)]
+    if not rows:
+        return column
+    raw = [column[i] for i in rows]
+    init_fields, _, _ = get_schema(resource_class).construction_plan
+    try:
+        if not init_fields:
+            raise TypeError(f"{resource_class.__name__} takes no field values")
+        coerced = bulk_create(resource_class, {init_fields[0][0]: raw})
+    except Exception:
+        # Some value (or the class itself) can't be built in bulk - go value
+        # by value, leaving the ones that fail, like __post_init__
+        coerced = []
+        for value in raw:
+            try:
+                coerced.append(resource_class(value))
+            except Exception:
+                coerced.append(value)
+    for i, value in zip(rows, coerced):
+        column[i] = value
+    return column
+
+
+@contextmanager
+def _gc_paused():
+    """
+    Suspend the cyclic garbage collector for a batch: allocating many objects
+    at once otherwise triggers a collection every few hundred allocations,
+    each rescanning the objects already built - most of the time a large
+    batch takes. Batches create no reference cycles, so nothing is missed.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _construct(cls, columns: Dict[str, list], length: int) -> list:
+    """One constructor call per object, for classes without `_bulk_post_init`."""
+    names = columns.pop('_name', None)
+    items = list(columns.items())
+    instances = []
+    for i in range(length):
+        instance = cls(**{name: column[i] for name, column in items})
+        if names is not None and names[i] is not None:
+            instance._name = names[i]
+        instances.append(instance)
+    return instances
+
+
+def _assemble(cls, columns: Dict[str, list], factory_fields, length: int) -> list:
+    """The objects for post-processed columns, filled in without `__init__`."""
+    instances = list(map(cls.__new__, repeat(cls, length)))
+    names = columns.pop('_name', None)
+    for name, column in columns.items():
+        # map() runs the setattr loop in C; deque(maxlen=0) just drains it
+        deque(map(setattr, instances, repeat(name), column), maxlen=0)
+    if names is not None:
+        # Nodes have every name filled in by now; other Resources keep their
+        # class's name unless given one
+        for instance, name in zip(instances, names):
+            if name is not None:
+                instance._name = name
+    for name, factory in factory_fields:
+        for instance in instances:
+            setattr(instance, name, factory())
+    return instances
+
+
+def bulk_create(cls, columns: Dict[str, Any], as_frame: bool = False) -> Union[List, 'ResourceFrame']:
+    """
+    Create len(column) instances of cls from columns of field values (see
+    `Resource.bulk_create`).
+
+    Args:
+        cls: The semantic object class to instantiate
+        columns: Field name (or '_name') -> column of values, or one value for
+            every object
+        as_frame: Return a ResourceFrame of the objects instead of a list
+
+    Returns:
+        The instances, in column order, or their ResourceFrame
+    """
+    length, columns = prepare_columns(cls, columns)
+    _, factory_fields, vectorized = get_schema(cls).construction_plan
+    if not vectorized:
+        instances = _construct(cls, columns, length)
+        if as_frame:
+            from .frame import ResourceFrame
+            return ResourceFrame.from_instances(instances, cls)
+        return instances
+
+    with _gc_paused():
+        cls._bulk_post_init(columns, length)
+        if as_frame:
+            from .frame import ResourceFrame
+            return ResourceFrame.from_columns(cls, columns, length)
+        return _assemble(cls, columns, factory_fields, length)
@@ -1,15 +1,34 @@
-from typing import List, Dict, Tuple, Type, Union, Optional, get_origin, get_args, Self
+from typing import List, Dict, Tuple, Type, Union
 from dataclasses import dataclass, field, fields, _MISSING_TYPE
 from pathlib import Path
 
 from rdflib import Graph, Literal, BNode, URIRef
 
+from .naming import allocate_name, allocate_names
 from .namespaces import PARAM, RDF, RDFS, SH, bind_prefixes
-from .query import SparqlQueryBuilder
+from .registry import register_class
+from .schema import (
+    get_schema, index_relations, invalidate_schemas, related_classes, resolve_fixed_default, unwrap_type
+)
 from .fields import * 
 
 
-def semantic_object(cls):
+def semantic_object(cls=None, *, slots: bool = False):
+    """
+    Turn a class into a semantic object dataclass.
+
+    Use as `@semantic_object`, or `@semantic_object(slots=True)` for a compact
+    `__slots__` layout: instances then have no per-instance `__dict__`, which
+    matters when loading hundreds of thousands of them. Class-level values
+    (the class's `_name`, pinned fields such as `qk = quantitykinds.Area`,
+    field defaults) keep working on both the class and its instances - see
+    `_SlotWithClassValue`. Instances only lose their `__dict__` if every base
+    class declares `__slots__` too, as the framework's own bases do; setting an
+    attribute that isn't a field or `_name` then raises AttributeError.
+    """
+    if cls is None:
+        return lambda cls: semantic_object(cls, slots=slots)
+
     # Get parent class fields and their types
     parent_fields = {}
     for base in cls.__mro__[1:]:
@@ -77,10 +96,143 @@ def semantic_object(cls):
     for field_name, fixed_value in factory_pinned_fields.items():
         setattr(cls, field_name, fixed_value)
 
+    cls._coercions = _coercion_plan(cls)
+
+    if slots:
+        cls = _add_slots(cls)
+
+    index_relations(cls)
+    register_class(cls)
+    invalidate_schemas(cls)
+
     return cls
 
+def _coercion_plan(cls):
+    """
+    (field name, Resource class) for each field whose raw values
+    `Resource.__post_init__` wraps in its annotated Resource class. Compiled
+    once per class, so constructing an instance only revisits the fields
+    where that can happen - usually none.
+    """
+    plan = []
+    for f in fields(cls):
+        annotation_type = unwrap_type(f.type)
+        if isinstance(annotation_type, type) and issubclass(annotation_type, Resource):
+            plan.append((f.name, annotation_type))
+    return tuple(plan)
+
+
+def _coercions_of(cls):
+    """
+    cls's `_coercion_plan`: compiled by `semantic_object`, or on first use (and
+    then cached on the class) for a subclass declared with plain `@dataclass`,
+    which would otherwise inherit its decorated parent's plan.
+    """
+    plan = cls.__dict__.get('_coercions')
+    if plan is None:
+        plan = _coercion_plan(cls)
+        cls._coercions = plan
+    return plan
+
+
+class _SlotWithClassValue:
+    """
+    A slot that falls back to a class-level value.
+
+    In a slotted class a name can't be both a slot and a plain class attribute,
+    but semantic objects use both: `cls._name` is the class's IRI local name
+    while `instance._name` names the instance, and pinned fields/defaults are
+    read from the class. This descriptor serves the class value on the class
+    and on instances whose slot hasn't been set, and stores instance values in
+    the slot.
+    """
+    __slots__ = ('member', 'value')
+
+    def __init__(self, member, value):
+        self.member = member
+        self.value = value
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self.value
+        try:
+            return self.member.__get__(instance, owner)
+        except AttributeError:
+            return self.value
+
+    def __set__(self, instance, value):
+        self.member.__set__(instance, value)
+
+    def __delete__(self, instance):
+        self.member.__delete__(instance)
+
+
+def _slot_member(cls, name):
+    """The raw slot descriptor for `name` declared by cls or a base, or None."""
+    for base in cls.__mro__:
+        if name in base.__dict__.get('__slots__', ()):
+            member = base.__dict__.get(name)
+            return member.member if isinstance(member, _SlotWithClassValue) else member
+    return None
+
+
+def _add_slots(cls):
+    """
+    Recreate a dataclass with `__slots__` for its own fields.
+
+    Like `dataclass(slots=True)`, but class-level values of slotted names are
+    kept (see `_SlotWithClassValue`), `_name`/`__weakref__` slots are added if
+    no base provides them, and methods using zero-argument `super()` are
+    pointed at the new class.
+    """
+    inherited = set()
+    for base in cls.__mro__[1:-1]:
+        inherited.update(base.__dict__.get('__slots__', ()))
+
+    names = [f.name for f in fields(cls)] + ['_name']
+    own_slots = [name for name in dict.fromkeys(names) if name not in inherited]
+    if not any(getattr(base, '__weakrefoffset__', 0) for base in cls.__mro__[1:]):
+        own_slots.append('__weakref__')
+
+    cls_dict = dict(cls.__dict__)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+    class_values = {}
+    for name in own_slots:
+        if name in cls_dict:
+            class_values[name] = cls_dict.pop(name)
+    for name in inherited:
+        if name in cls_dict and not isinstance(cls_dict[name], _SlotWithClassValue):
+            class_values[name] = cls_dict[name]
+    cls_dict['__slots__'] = tuple(own_slots)
+
+    new_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    new_cls.__qualname__ = cls.__qualname__
+
+    for name, value in class_values.items():
+        setattr(new_cls, name, _SlotWithClassValue(_slot_member(new_cls, name), value))
+
+    # Zero-argument super() finds the class through a `__class__` closure cell
+    for value in cls_dict.values():
+        if isinstance(value, (classmethod, staticmethod)):
+            functions = [value.__func__]
+        elif isinstance(value, property):
+            functions = [value.fget, value.fset, value.fdel]
+        else:
+            functions = [value]
+        for function in functions:
+            for cell in getattr(function, '__closure__', None) or ():
+                try:
+                    if cell.cell_contents is cls:
+                        cell.cell_contents = new_cls
+                except ValueError:
+                    pass  # empty cell
+    return new_cls
+
 @semantic_object
 class Resource:
+    # Declared so `@semantic_object(slots=True)` subclasses get no __dict__
+    __slots__ = ()
     templatize = True
 
     def __post_init__(self):
@@ -89,45 +241,55 @@ class Resource:
         If a field expects a Resource subclass but receives a raw value,
         instantiate the Resource with that value.
         """
-        if not hasattr(self.__class__, '__dataclass_fields__'):
-            return
-            
-        for field_name, field_obj in self.__class__.__dataclass_fields__.items():
-            # Skip fields that weren't initialized
-            if not hasattr(self, field_name):
+        # Only fields annotated with a Resource class can be coerced; the
+        # list is compiled once per class (see _coercions_of)
+        for field_name, expected_type in _coercions_of(type(self)):
+            current_value = getattr(self, field_name, None)
+            # Skip if value is None or already the correct type (or another Resource)
+            if current_value is None or isinstance(current_value, Resource):
                 continue
-                
-            current_value = getattr(self, field_name)
-            
-            # Skip if value is None or already the correct type
-            if current_value is None:
-                continue
-                
-            expected_type = field_obj.type
-            
-            # Handle Optional types
-            origin = get_origin(expected_type)
-            if origin is not None:
-                args = get_args(expected_type)
-                if args:
-                    expected_type = args[0]
-            
-            # Skip if already the correct type
-            if isinstance(current_value, expected_type):
-                continue
-            
-            # If expected type is a Resource subclass and current value is not,
-            # try to instantiate it
-            if (isinstance(expected_type, type) and 
-                issubclass(expected_type, Resource) and 
-                not isinstance(current_value, Resource)):
-                try:
-                    # Try to instantiate with the current value
-                    setattr(self, field_name, expected_type(current_value))
-                except Exception:
-                    # If instantiation fails, leave the value as-is
-                    # This allows for more complex initialization patterns
-                    pass
+            try:
+                # Try to instantiate with the current value
+                setattr(self, field_name, expected_type(current_value))
+            except Exception:
+                # If instantiation fails, leave the value as-is
+                # This allows for more complex initialization patterns
+                pass
+
+    @classmethod
+    def _bulk_post_init(cls, columns, length):
+        """
+        `__post_init__` for a whole batch of field-value columns (see
+        bulk_create). A class overriding `__post_init__` overrides this too,
+        calling super() first, or bulk_create falls back to its constructor.
+        """
+        from .bulk import coerce_column
+
+        for field_name, expected_type in _coercions_of(cls):
+            column = columns.get(field_name)
+            if column is not None:
+                coerce_column(column, expected_type)
+
+    @classmethod
+    def bulk_create(cls, as_frame=False, **columns):
+        """
+        Create many instances at once from columns of field values, e.g.
+        `Pump.bulk_create(_name=tags, ...)` for a CSV point list.
+
+        Does what calling the class once per row would, but a column at a time:
+        lengths are checked once, coercion and naming run per column (see
+        bulk.py). Columns are lists, tuples or 1-d arrays; other values apply
+        to every instance.
+
+        Args:
+            as_frame: Return a ResourceFrame (see frame.py) instead of a list
+            **columns: Field name (or `_name`) -> column of values
+
+        Returns:
+            List of instances, or a ResourceFrame of them
+        """
+        from .bulk import bulk_create
+        return bulk_create(cls, columns, as_frame=as_frame)
 
     @classmethod
     def _get_iri(cls):
@@ -145,22 +307,7 @@ class Resource:
 
     @classmethod
     def _get_template_parameters(cls):
-        seen_fields = set()
-        parameters = {}
-
-        for base in cls.__mro__:
-            if hasattr(base, '__dataclass_fields__'):
-                for field_name, field_obj in base.__dataclass_fields__.items():
-                    # Skip fields with init=False and templatize=False
-                    if (field_obj.init == False and 
-                        field_obj.metadata.get('templatize', True) == False):
-                        continue
-                    if field_name in seen_fields:
-                        continue
-                    seen_fields.add(field_name)
-                    parameters[field_name] = field_obj
-
-        return parameters
+        return dict(get_schema(cls).template_parameters)
 
     @staticmethod
     def _resolve_fixed_default(field_obj):
@@ -168,11 +315,7 @@ class Resource:
         `default_factory` (used for unhashable values like Resource instances).
         Returns the `_MISSING_TYPE` sentinel if the field has neither - i.e. it's
         a real template parameter, not a fixed value."""
-        if not isinstance(field_obj.default, _MISSING_TYPE):
-            return field_obj.default
-        if not isinstance(field_obj.default_factory, _MISSING_TYPE):
-            return field_obj.default_factory()
-        return field_obj.default
+        return resolve_fixed_default(field_obj)
 
     @classmethod
     def _get_inter_field_relations(cls):
@@ -180,80 +323,18 @@ class Resource:
         Get all inter-field relations defined for this class and its parents.
         Returns a list of inter-field relation dictionaries.
         """
-        all_relations = []
-        seen_relations = set()
-        
-        for base in reversed(cls.__mro__):
-            if hasattr(base, '_inter_field_relations'):
-                for rel in base._inter_field_relations:
-                    # Create a unique key for this relation
-                    rel_key = (rel['source_field'], rel['relation']._name if hasattr(rel['relation'], '_name') else str(rel['relation']), rel['target_field'])
-                    if rel_key not in seen_relations:
-                        all_relations.append(rel)
-                        seen_relations.add(rel_key)
-        
-        return all_relations
+        return list(get_schema(cls).inter_field_relations)
 
     @classmethod
     def get_dependencies(cls):
         """Get template dependencies based on annotations and field metadata"""
-        dependencies = []
-        
-        # Check if this is a dataclass with fields
-        if hasattr(cls, '__dataclass_fields__'):
-            for field_name, field_obj in cls.__dataclass_fields__.items():
-                # Skip fields that are targets of inter-field relations (they're not separate dependencies)
-                target_field_name = field_obj.metadata.get('value')
-                if target_field_name is not None:
-                    # This field is a source in an inter-field relation, skip it
-                    continue
-                
-                annotation_type = field_obj.type
-                
-                # Handle Optional types - extract the actual type
-                origin = get_origin(annotation_type)
-                if origin is not None:
-                    args = get_args(annotation_type)
-                    if args:
-                        annotation_type = args[0]
-                
-                # Skip if not a class type
-                if not isinstance(annotation_type, type):
-                    continue
-
-                if not issubclass(annotation_type, Resource):
-                    continue
-
-                if annotation_type.templatize == False:
-                    continue
-                # Skip if field has init=False and templatize=False
-                if (field_obj.init == False and 
-                    field_obj.metadata.get('templatize', True) == False):
-                    continue
-
-                if not isinstance(cls._resolve_fixed_default(field_obj), _MISSING_TYPE):
-                    continue
-
-                dependencies.append({
-                    'template': annotation_type,
-                    'args': {'name': field_name}
-                })
-        
-        return dependencies
+        return [{'template': dependency['template'], 'args': dict(dependency['args'])}
+                for dependency in get_schema(cls).dependencies]
 
     @classmethod
     def get_optional_fields(cls):
         """Get list of optional field names from field metadata"""
-        optional_fields = []
-        
-        # Check if this is a dataclass with fields
-        if hasattr(cls, '__dataclass_fields__'):
-            for field_name, field_obj in cls.__dataclass_fields__.items():
-                # Fields with explicit optional metadata
-                if field_obj.metadata.get('optional', False):
-                    optional_fields.append(field_name)
-        
-        return optional_fields
+        return list(get_schema(cls).optional_fields)
 
     @classmethod
     def _infer_relation_for_field(cls, field_name, field_obj):
@@ -261,7 +342,9 @@ class Resource:
         Infer the relation for a field based on class type hierarchies.
         
         Looks up the relation by checking (source_class, target_class) pairs
-        in _valid_relations declarations, walking up both hierarchies.
+        in _valid_relations declarations, walking up both hierarchies. Pairs
+        are answered from the relation index built as classes are decorated,
+        and the result is memoized on the class's compiled schema (see schema.py).
         
         Args:
             field_name: Name of the field
@@ -273,41 +356,7 @@ class Resource:
         Raises:
             ValueError: If no relation can be found
         """
-        # If relation is explicitly provided, use it
-        if field_obj.metadata.get('relation') is not None:
-            return field_obj.metadata['relation']
-        
-        # Get the target type from field annotation
-        target_type = field_obj.type
-        
-        # TODO: Look back into handling lists/optional, like looking in Optional, List, etc. - extract the actual type
-        origin = get_origin(target_type)
-        if origin is not None:
-            # For Optional[X], List[X], etc., get X
-            args = get_args(target_type)
-            if args:
-                target_type = args[0]
-        
-        # Handle Self reference
-        if target_type == cls or str(target_type) == 'Self':
-            target_type = cls
-        
-        # Try to find a matching relation by walking up both class hierarchies
-        for source_class in cls.__mro__:
-            if not hasattr(source_class, '_valid_relations'):
-                continue
-            # Walk up target class hierarchy
-            target_mro = target_type.__mro__ if hasattr(target_type, '__mro__') else [target_type]
-            for target_class in target_mro:
-                # Check each relation in _valid_relations
-                for relation, valid_target in source_class._valid_relations:
-                    # Handle Self reference in _valid_relations
-                    if valid_target is Self or str(valid_target) == 'Self':
-                        valid_target = source_class
-                    # Check if target class matches
-                    if valid_target == target_class or (hasattr(valid_target, '__name__') and hasattr(target_class, '__name__') and valid_target.__name__ == target_class.__name__):
-                        return relation
-        raise ValueError(f"No relation found for field '{field_name}' with type '{target_type}' on {cls}, set it manually")
+        return get_schema(cls).relation_for(field_name, field_obj)
                     
     @classmethod
     def get_relations(cls):
@@ -315,46 +364,7 @@ class Resource:
         Accumulate relations from all bases up the MRO (excluding 'object').
         Infers relations when not explicitly provided.
         """
-        # could validate that there are relations to get here
-        all_relations = []
-        seen_relations = set()
-        
-        # Get field-based relations from dataclass fields
-        for base in reversed(cls.__mro__):
-            if hasattr(base, '__dataclass_fields__'):
-                for field_name, field_obj in base.__dataclass_fields__.items():
-                    # Skip fields with init=False and templatize=False
-                    if (field_obj.init == False and 
-                        field_obj.metadata.get('templatize', True) == False):
-                        continue
-                    
-                    # Skip fields that are part of inter-field relations (source fields with 'value' metadata)
-                    if field_obj.metadata.get('value') is not None:
-                        continue
-                    
-                    # Skip fields with relation explicitly set to None
-                    if field_obj.metadata.get('relation') is None and 'relation' in field_obj.metadata:
-                        continue
-                    
-                    relation = cls._infer_relation_for_field(field_name, field_obj)
-                    
-                    relation_key = (relation._name, field_name)
-                    if relation_key not in seen_relations:
-                        all_relations.append((relation, field_name))
-                        seen_relations.add(relation_key)
-        
-        # Add inter-field relations
-        inter_field_rels = cls._get_inter_field_relations()
-        for rel in inter_field_rels:
-            relation = rel['relation']
-            source_field = rel['source_field']
-            
-            relation_key = (relation._name, source_field)
-            if relation_key not in seen_relations:
-                all_relations.append((relation, source_field))
-                seen_relations.add(relation_key)
-        
-        return all_relations
+        return list(get_schema(cls).relations)
 
     @classmethod
     def get_related_classes(cls, get_recursive=True, include_abstract=False):
@@ -363,7 +373,8 @@ class Resource:
         
         This method works correctly regardless of how the class or this module is imported,
         because it uses the actual class hierarchy (MRO) to determine class types rather
-        than comparing against hardcoded class references.
+        than comparing against hardcoded class references. Answered from a memoized
+        transitive closure of the class reference graph (see schema.related_classes).
         
         Args:
             get_recursive: If True, recursively find all related classes. If False, only
@@ -371,84 +382,16 @@ class Resource:
             include_abstract: If True, include abstract classes in the results.
         
         Returns:
-            Tuple of (predicate_list, entity_list, value_list) where each list contains
+            Tuple of (predicate_list, entity_list) where each list contains
             classes of that type found in the class hierarchy.
         """
-        # Helper function to check if a class is a subclass of a base by name
-        def _is_subclass_of_name(klass, base_name):
-            """Check if klass is a subclass of a class with the given name."""
-            if not isinstance(klass, type):
-                return False
-            for base in klass.__mro__:
-                if base.__name__ == base_name:
-                    return True
-            return False
-        
-        # Collect all related classes
-        relations = [relation for relation, field_name in cls.get_relations()]
-        entities_and_values = [field.type for entity, field in cls.__dataclass_fields__.items()]
-        all_classes = [cls] + relations + entities_and_values
-        all_classes = list(set(all_classes))
-
-        if get_recursive:
-            new_classes = all_classes.copy()
-            for i in range(100):
-                next_new_classes = []
-                for klass in new_classes:
-                    # Skip if not a class (e.g., Optional[X], float, etc.)
-                    if not isinstance(klass, type):
-                        continue
-                    # Skip if not a Resource subclass
-                    if not _is_subclass_of_name(klass, 'Resource'):
-                        continue
-                    
-                    # Get relations and fields from this class
-                    relations = [relation for relation, field_name in klass.get_relations()]
-                    entities_and_values = [field.type for entity, field in klass.__dataclass_fields__.items()]
-                    next_classes = relations + entities_and_values
-                    
-                    # Add new classes we haven't seen yet
-                    for next_class in next_classes:
-                        if next_class not in all_classes:
-                            next_new_classes.append(next_class)
-                            all_classes.append(next_class)
-                
-                if not next_new_classes:
-                    break
-                new_classes = next_new_classes
-                
-                if i == 99:
-                    raise RecursionError("Max depth reached")
-        
-        # Categorize classes by type using name-based checks
-        predicate_lst, entity_lst, value_lst = [], [], []
-        
-        for klass in all_classes:
-            # Skip if not a class type
-            if not isinstance(klass, type):
-                continue
-            
-            # Skip if not a Resource subclass
-            if not _is_subclass_of_name(klass, 'Resource'):
-                continue
-            
-            # Skip abstract classes if requested
-            if not include_abstract and hasattr(klass, 'abstract') and klass.abstract:
-                continue
-            
-            # Categorize by checking class hierarchy
-            if _is_subclass_of_name(klass, 'Predicate'):
-                predicate_lst.append(klass)
-            elif _is_subclass_of_name(klass, 'Node'):
-                entity_lst.append(klass)
-        
-        return predicate_lst, entity_lst
+        return related_classes([cls], get_recursive=get_recursive, include_abstract=include_abstract)
 
     @classmethod
     def get_sparql_query(cls, ontology=None):
         """
         Convenience method to generate a SPARQL query from the class definition.
-        Delegates to SparqlQueryBuilder.
+        Delegates to SparqlQueryBuilder; the result is cached per ontology.
         
         Args:
             ontology: Optional ontology identifier (e.g., 's223') for special handling
@@ -456,8 +399,22 @@ class Resource:
         Returns:
             A SPARQL query string that can be used to query for instances of this class
         """
-        builder = SparqlQueryBuilder(cls)
-        return builder.get_sparql_query(ontology)
+        return get_schema(cls).sparql_query(ontology)
+
+    @classmethod
+    def get_prepared_query(cls, ontology=None):
+        """
+        The class's SPARQL query already parsed by rdflib's `prepareQuery`, so
+        evaluating it with `Graph.query` skips query parsing. Built once per
+        class and ontology, like `get_sparql_query()`.
+
+        Args:
+            ontology: Optional ontology identifier (e.g., 's223') for special handling
+
+        Returns:
+            An rdflib prepared Query
+        """
+        return get_schema(cls).prepared_query(ontology)
     
     def _get_evaluation_dict(self):
         parameters = self._get_template_parameters()
@@ -551,6 +508,7 @@ class Resource:
 
 
 class Predicate(Resource):
+    __slots__ = ()
     _subproperty_of = None
     _domain = None
     _range = None
@@ -569,24 +527,41 @@ class Predicate(Resource):
 
 
 class Node(Resource):
-    _name: Optional[str] = field(default=None, init=True, metadata={'templatize': False})
-    _instance_counter = {}
+    # Instance names (`instance._name`) are stored in this slot; each decorated
+    # subclass's `_name` class attribute (its IRI local name) shadows it and
+    # plain subclasses keep instance names in their __dict__, while slotted
+    # ones route them here (see _SlotWithClassValue).
+    __slots__ = ('_name', '__weakref__')
     
     def __post_init__(self):
-        """Auto-generate _name if not provided"""
+        """Auto-generate _name if not provided (see naming.allocate_name)"""
         super().__post_init__()
-        
-        if self._name is None or self._name == self.__class__.__name__:
-            class_name = self.__class__.__name__
-            
-            if class_name not in Node._instance_counter:
-                Node._instance_counter[class_name] = 0
-            
-            Node._instance_counter[class_name] += 1
-            self._name = f"{class_name}_{Node._instance_counter[class_name]}"
+
+        name = self._name
+        if name is None or name == type(self).__name__:
+            self._name = allocate_name(type(self))
+
+    @classmethod
+    def _bulk_post_init(cls, columns, length):
+        """Allocate names for the batch in one block (see Resource._bulk_post_init)"""
+        super()._bulk_post_init(columns, length)
+
+        # A None name isn't given: the instance has the class's `_name`, as
+        # with the constructor, and only gets a new one if that's __name__
+        unallocated = cls._name is None or cls._name == cls.__name__
+        names = columns.get('_name')
+        if names is None:
+            if unallocated:
+                columns['_name'] = allocate_names(cls, length)
+            return
+        unnamed = [i for i, name in enumerate(names)
+                   if (unallocated if name is None else name == cls.__name__)]
+        for i, name in zip(unnamed, allocate_names(cls, len(unnamed))):
+            names[i] = name
 
 
 class NamedNode(Node):
+    __slots__ = ()
     templatize = False
 
 
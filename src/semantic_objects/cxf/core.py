@@ -8,13 +8,14 @@ from ..qudt import QuantityKind, Unit
 
 @dataclass
 class Node(core.Node):
+    __slots__ = ()
     _ns = S231
     _name = 'Class'
 
 
 @dataclass
 class EnumerationKind(Node):
-    pass
+    __slots__ = ()
 
 
 @dataclass
@@ -26,6 +27,7 @@ class Block(Node):
     (S231:isConnectedTo, S231:isFinal) is out of scope; see
     tutorial/cxf-ingestion-tutorial.ipynb.
     """
+    __slots__ = ()
 
 
 # --- port / parameter value objects -----------------------------------------
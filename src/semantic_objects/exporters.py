@@ -1,10 +1,13 @@
-from typing import get_origin, get_args, List, Type
+from types import ModuleType
+from typing import Iterable, List, Type, Union
 from dataclasses import _MISSING_TYPE
 from .namespaces import PARAM, RDF, RDFS, SH, XSD, bind_prefixes
 import yaml
 from pathlib import Path
 from rdflib import Graph, Literal, BNode, URIRef
 from .discovery import get_related_classes
+from .lazy import load_all
+from .schema import get_schema, unwrap_type
 
 
 def export_templates(dclass_lst: List[Type], dir_path_str: str, overwrite = True):
@@ -21,6 +24,82 @@ def export_templates(dclass_lst: List[Type], dir_path_str: str, overwrite = True
         for klass in lst:
             klass.to_yaml(file_path = file)
 
+
+def _collect_shape_classes(modules_or_classes):
+    """Classes to export shapes for, in first-seen order.
+
+    Classes passed directly are always exported. Modules are scanned (packages
+    recursively, through their already-imported submodules) for Predicates with
+    a namespace and Nodes that declare an ontology class (`_other_types`) -
+    framework bases and QUDT units/quantity kinds re-exported alongside them
+    are skipped."""
+    from .core import Resource, Predicate  # Import here to avoid circular dependency
+
+    if isinstance(modules_or_classes, (type, ModuleType)):
+        modules_or_classes = [modules_or_classes]
+
+    classes = {}
+    seen_modules = set()
+
+    def scan(module):
+        if module.__name__ in seen_modules:
+            return
+        seen_modules.add(module.__name__)
+        for value in list(vars(load_all(module)).values()):
+            if isinstance(value, ModuleType):
+                if value.__name__.startswith(module.__name__ + '.'):
+                    scan(value)
+                continue
+            if not isinstance(value, type) or not issubclass(value, Resource):
+                continue
+            if issubclass(value, Predicate):
+                if hasattr(value, '_ns'):
+                    classes.setdefault(value, None)
+            elif hasattr(value, '_ns') and hasattr(value, '_other_types'):
+                classes.setdefault(value, None)
+
+    for item in modules_or_classes:
+        if isinstance(item, ModuleType):
+            scan(item)
+        else:
+            classes.setdefault(item, None)
+    return list(classes)
+
+
+def export_shapes(modules_or_classes: Union[ModuleType, Type, Iterable[Union[ModuleType, Type]]],
+                  destination=None, format: str = 'turtle', include_hierarchy: bool = False) -> Graph:
+    """Export SHACL shapes / RDF definitions for many classes as one graph.
+
+    Equivalent to merging `generate_rdf_class_definition()` (or
+    `generate_rdf_property_definition()` for Predicates) for every class, but
+    all classes are added straight into a single shared graph - no per-class
+    Graph, prefix binding or serialize/parse round-trip.
+
+    Args:
+        modules_or_classes: A module (e.g. `semantic_objects.s223`), a class, or
+            an iterable mixing both
+        destination: Path or file-like object to serialize to; if None nothing
+            is written
+        format: Any rdflib serialization format ('turtle', 'nt', 'xml', ...)
+        include_hierarchy: Passed through to the class definitions
+
+    Returns:
+        The combined rdflib Graph
+    """
+    from .core import Predicate  # Import here to avoid circular dependency
+
+    g = Graph()
+    bind_prefixes(g)
+    for klass in _collect_shape_classes(modules_or_classes):
+        if issubclass(klass, Predicate):
+            RdfExporter.add_rdf_property_definition(klass, g)
+        else:
+            RdfExporter.add_rdf_class_definition(klass, g, include_hierarchy)
+
+    if destination is not None:
+        g.serialize(destination=destination, format=format)
+    return g
+
 class FoldedString(str):
     """Custom string class for YAML folded scalar representation"""
     pass
@@ -52,8 +131,8 @@ class YamlExporter:
         type_source = semantic_type if semantic_type is not None else cls
         g.add((PARAM['name'], RDF.type, type_source._get_iri()))
 
-        parameters = cls._get_template_parameters()
-        for field_name, field_obj in parameters.items():
+        schema = get_schema(cls)
+        for field_name, field_obj in schema.template_parameters.items():
             # Check if this field has a 'value' metadata pointing to another field
             target_field_name = field_obj.metadata.get('value')
             if target_field_name is not None:
@@ -73,8 +152,7 @@ class YamlExporter:
                 g.add((PARAM['name'], relation._get_iri(), PARAM[field_name]))
         
         # Handle inter-field relations
-        inter_field_rels = cls._get_inter_field_relations()
-        for rel in inter_field_rels:
+        for rel in schema.inter_field_relations:
             source_field = rel['source_field']
             target_field = rel['target_field']
             relation = rel['relation']
@@ -162,12 +240,7 @@ class RdfExporter:
         `_create_qualified_value_shape` already did, now shared with the main
         property-shape pass so both branches handle `Optional[...]`/`Self`
         consistently instead of only one of them."""
-        target_type = field_obj.type
-        origin = get_origin(target_type)
-        if origin is not None:
-            args = get_args(target_type)
-            if args:
-                target_type = args[0]
+        target_type = unwrap_type(field_obj.type)
         if target_type == cls or str(target_type) == 'Self':
             target_type = cls
         return target_type
@@ -205,10 +278,15 @@ class RdfExporter:
     @staticmethod
     def generate_rdf_class_definition(cls, include_hierarchy=False):
         """Generate RDF class definition with SHACL constraints"""
-        from .core import Resource  # Import here to avoid circular dependency
-        
         g = Graph()
         bind_prefixes(g)
+        RdfExporter.add_rdf_class_definition(cls, g, include_hierarchy)
+        return g.serialize(format='turtle')
+
+    @staticmethod
+    def add_rdf_class_definition(cls, g, include_hierarchy=False):
+        """Add cls's RDF class definition and SHACL constraints to graph `g`"""
+        from .core import Resource  # Import here to avoid circular dependency
         
         class_iri = cls._get_iri()
         g.add((class_iri, RDF.type, cls._ns['Class']))
@@ -235,19 +313,11 @@ class RdfExporter:
         processed_relations = set()
 
         if hasattr(cls, '__dataclass_fields__'):
+            schema = get_schema(cls)
             if include_hierarchy:
-                fields_to_process = cls.__dataclass_fields__.items()
+                fields_to_process = schema.fields.items()
             else:
-                parent_fields = set()
-                for base in cls.__mro__[1:]:
-                    if hasattr(base, '__dataclass_fields__'):
-                        parent_fields.update(base.__dataclass_fields__.values())
-                
-                fields_to_process = [
-                    (name, field_obj) 
-                    for name, field_obj in cls.__dataclass_fields__.items()
-                    if field_obj not in parent_fields
-                ]
+                fields_to_process = schema.declared_fields.items()
             
             # First pass: count properties and create property shapes
             for field_name, field_obj in fields_to_process:
@@ -418,14 +488,19 @@ class RdfExporter:
                     message = f"s223: If the relation `{relation._name}` is present it must associate the `{cls.__name__}` with a `{target_class_name}`."
                     g.add((prop_node, SH.message, Literal(message)))
         
-        return g.serialize(format='turtle')
+        return g
     
     @staticmethod
     def generate_rdf_property_definition(cls):
         """Generate RDF property definition with subproperty and domain/range constraints"""
         g = Graph()
         bind_prefixes(g)
-        
+        RdfExporter.add_rdf_property_definition(cls, g)
+        return g.serialize(format='turtle')
+
+    @staticmethod
+    def add_rdf_property_definition(cls, g):
+        """Add cls's RDF property definition to graph `g`"""
         prop_iri = cls._get_iri()
         
         g.add((prop_iri, RDF.type, RDF.Property))
@@ -448,4 +523,4 @@ class RdfExporter:
             range_iri = cls._range._get_iri()
             g.add((prop_iri, RDFS.range, range_iri))
         
-        return g.serialize(format='turtle')
\ No newline at end of file
+        return g
@@ -0,0 +1,406 @@
+"""
+Frame - Columnar instances of one Resource class
+
+`ModelLoader.load_instances` builds a dataclass object per entity (and per
+related property). For analytics over a large model, `ModelLoader.load_frame`
+builds a ResourceFrame instead: one NumPy array per field, filled straight
+from the query results without constructing any objects.
+
+  IRIs (entities, related nodes, units) are dictionary-encoded: an int32 code
+  per row indexing `frame.iris`, shared by every column, -1 when unbound
+  Related properties add `<field>.value` (float64, NaN when missing) and
+  `<field>.unit` (IRI codes) columns
+  Numeric fields are float64 arrays; anything else is an object array
+
+Example - all spaces whose area is over 50 square metres:
+    frame = loader.load_frame(Space, ontology='s223')
+    large = frame.filter((frame['area.value'] > 50) & frame.iri_mask('area.unit', UNIT.M2))
+    large.to_pandas()
+
+Frames convert to and from lists of instances (`to_instances`,
+`from_instances`), pandas DataFrames with categorical IRI columns
+(`to_pandas`, `from_pandas`) and Arrow tables (`to_arrow`, `from_arrow`,
+which need pyarrow).
+"""
+
+import math
+from typing import Any, Dict, Iterable, List, Optional, Type
+
+import numpy as np
+import pandas as pd
+from rdflib import Graph, URIRef
+
+from .core import Resource
+from .schema import get_schema
+
+NUMERIC_TYPES = (float, int)
+
+
+def _local_name(iri: str) -> str:
+    return iri.split('#')[-1].split('/')[-1]
+
+
+def as_number(term) -> float:
+    """A literal (or number) as a float, NaN if it isn't numeric."""
+    try:
+        return float(term)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _column_kinds(resource_class: Type[Resource]) -> Dict[str, str]:
+    """Column name -> 'iri', 'float' or 'object' for resource_class's frame."""
+    kinds = {}
+    for field_name, kind, field_type, related in get_schema(resource_class).load_plan:
+        if kind == 'named':
+            kinds[field_name] = 'iri'
+        elif kind == 'related':
+            kinds[field_name] = 'iri'
+            kinds[f'{field_name}.value'] = 'float'
+            kinds[f'{field_name}.unit'] = 'iri'
+        elif field_type in NUMERIC_TYPES:
+            kinds[field_name] = 'float'
+        else:
+            kinds[field_name] = 'object'
+    return kinds
+
+
+def _add_cell(builder: 'FrameBuilder', values: Dict[str, Any], field_name: str, kind: str, value,
+              prefix: str):
+    """Put one field value of an instance into its frame row `values`;
+    instances are named `prefix + instance._name`."""
+    if value is None:
+        return
+    if kind == 'named':
+        values[field_name] = builder.class_code(value) if isinstance(value, type) else -1
+    elif kind == 'related':
+        if not isinstance(value, Resource):
+            return
+        values[field_name] = builder.code(prefix + value._name, value._name)
+        number = getattr(value, 'value', None)
+        if isinstance(number, NUMERIC_TYPES):
+            values[f'{field_name}.value'] = float(number)
+        unit = getattr(value, 'unit', None)
+        if isinstance(unit, type) and issubclass(unit, Resource):
+            values[f'{field_name}.unit'] = builder.class_code(unit)
+    elif builder.kinds[field_name] == 'float':
+        values[field_name] = float(value)
+    else:
+        values[field_name] = value
+
+
+class FrameBuilder:
+    """Accumulates a ResourceFrame row by row (see ModelLoader.load_frame)."""
+
+    def __init__(self, resource_class: Type[Resource]):
+        self.resource_class = resource_class
+        self.kinds = _column_kinds(resource_class)
+        self.iris: List[str] = []
+        self.local_names: List[str] = []
+        self.codes: Dict[str, int] = {}
+        self.class_codes: Dict[type, int] = {}
+        self.names: List[int] = []
+        self.rows: Dict[str, int] = {}
+        self.columns: Dict[str, list] = {column: [] for column in self.kinds}
+        # (column values, unbound value) per column
+        self._cells = [(self.columns[column], -1 if kind == 'iri' else math.nan if kind == 'float' else None, column)
+                       for column, kind in self.kinds.items()]
+
+    def code(self, iri, local_name: Optional[str] = None) -> int:
+        """The dictionary code for iri (-1 for None), adding it if new."""
+        if iri is None:
+            return -1
+        iri = str(iri)
+        code = self.codes.get(iri)
+        if code is None:
+            code = self.codes[iri] = len(self.iris)
+            self.iris.append(iri)
+            self.local_names.append(local_name if local_name is not None else _local_name(iri))
+        return code
+
+    def class_code(self, cls) -> int:
+        """The dictionary code for a class's IRI (memoized per class)."""
+        code = self.class_codes.get(cls)
+        if code is None:
+            code = self.class_codes[cls] = self.code(cls._get_iri())
+        return code
+
+    def add_row(self, iri, local_name: Optional[str], values: Dict[str, Any]) -> bool:
+        """Add a row for the entity iri, unless it already has one. `values`
+        maps columns to codes/numbers/objects; absent columns are unbound."""
+        iri = str(iri)
+        if iri in self.rows:
+            return False
+        self.rows[iri] = len(self.names)
+        self.names.append(self.code(iri, local_name))
+        for cells, default, column in self._cells:
+            cells.append(values.get(column, default))
+        return True
+
+    def add_columns(self, names: List[int], columns: Dict[str, list]):
+        """Add rows a column at a time: `names` holds the codes of entities
+        without a row yet, `columns` a list per column (absent ones are unbound)."""
+        start = len(self.names)
+        self.names.extend(names)
+        for cells, default, column in self._cells:
+            values = columns.get(column)
+            cells.extend(values if values is not None else [default] * len(names))
+        self.rows.update((self.iris[code], start + i) for i, code in enumerate(names))
+
+    def build(self) -> 'ResourceFrame':
+        columns = {}
+        for column, kind in self.kinds.items():
+            if kind == 'iri':
+                columns[column] = np.array(self.columns[column], dtype=np.int32)
+            elif kind == 'float':
+                columns[column] = np.array(self.columns[column], dtype=np.float64)
+            else:
+                array = np.empty(len(self.names), dtype=object)
+                array[:] = self.columns[column]
+                columns[column] = array
+        return ResourceFrame(self.resource_class, self.iris, self.local_names,
+                             np.array(self.names, dtype=np.int32), columns)
+
+
+class ResourceFrame:
+    """
+    Instances of `resource_class` as columns: `names` (the entity IRI codes)
+    plus one array per column in `columns`, all indexed by row, with IRIs
+    encoded as codes into `iris` (and `local_names`, their local parts).
+    """
+
+    def __init__(self, resource_class: Type[Resource], iris: List[str], local_names: List[str],
+                 names: np.ndarray, columns: Dict[str, np.ndarray]):
+        self.resource_class = resource_class
+        self.iris = iris
+        self.local_names = local_names
+        self.names = names
+        self.columns = columns
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self.columns[column]
+
+    def __repr__(self):
+        return f"<ResourceFrame {self.resource_class.__name__}: {len(self)} rows, columns {list(self.columns)}>"
+
+    def code(self, iri) -> int:
+        """iri's dictionary code, or -1 if no row refers to it."""
+        codes = getattr(self, '_codes', None)
+        if codes is None:
+            codes = self._codes = {iri: code for code, iri in enumerate(self.iris)}
+        return codes.get(str(iri), -1)
+
+    def iri_mask(self, column: str, *iris) -> np.ndarray:
+        """Boolean mask of the rows whose IRI column holds one of `iris`."""
+        codes = [code for code in (self.code(iri) for iri in iris) if code >= 0]
+        if len(codes) == 1:
+            return self.columns[column] == codes[0]
+        return np.isin(self.columns[column], codes)
+
+    def iri_column(self, column: str) -> np.ndarray:
+        """An IRI column (or 'name') decoded to an object array of strings/None."""
+        codes = self.names if column == 'name' else self.columns[column]
+        lookup = np.array(self.iris + [None], dtype=object)
+        return lookup[codes]  # -1 picks the trailing None
+
+    def filter(self, mask) -> 'ResourceFrame':
+        """The rows where mask (a boolean array, or row indices) is true."""
+        return ResourceFrame(self.resource_class, self.iris, self.local_names, self.names[mask],
+                             {column: values[mask] for column, values in self.columns.items()})
+
+    # -- pandas / Arrow ----------------------------------------------------
+
+    def to_pandas(self) -> pd.DataFrame:
+        """A DataFrame with a `name` column and one per frame column; IRI
+        columns are categoricals over the frame's IRI dictionary."""
+        categories = pd.Index(self.iris, dtype=object)
+        data = {'name': pd.Categorical.from_codes(self.names, categories=categories)}
+        kinds = _column_kinds(self.resource_class)
+        for column, values in self.columns.items():
+            if kinds.get(column) == 'iri':
+                data[column] = pd.Categorical.from_codes(values, categories=categories)
+            else:
+                data[column] = values
+        return pd.DataFrame(data)
+
+    @classmethod
+    def from_pandas(cls, df: pd.DataFrame, resource_class: Type[Resource]) -> 'ResourceFrame':
+        """Rebuild a frame from a DataFrame laid out like `to_pandas` produces
+        (IRI columns may be categorical or plain strings)."""
+        builder = FrameBuilder(resource_class)
+        frame_columns = [column for column in builder.kinds if column in df.columns]
+        for row in df[['name'] + frame_columns].itertuples(index=False, name=None):
+            values = {}
+            for column, value in zip(frame_columns, row[1:]):
+                if builder.kinds[column] == 'iri':
+                    values[column] = builder.code(None if pd.isna(value) else value)
+                elif builder.kinds[column] == 'float':
+                    values[column] = math.nan if value is None else float(value)
+                else:
+                    values[column] = value
+            builder.add_row(row[0], None, values)
+        return builder.build()
+
+    def to_arrow(self):
+        """A pyarrow Table (IRI columns become dictionary arrays)."""
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError("pyarrow is required for Arrow conversion. Install it with: pip install pyarrow")
+        return pa.Table.from_pandas(self.to_pandas(), preserve_index=False)
+
+    @classmethod
+    def from_arrow(cls, table, resource_class: Type[Resource]) -> 'ResourceFrame':
+        """Rebuild a frame from a Table made by `to_arrow`."""
+        return cls.from_pandas(table.to_pandas(), resource_class)
+
+    # -- instances ---------------------------------------------------------
+
+    @classmethod
+    def from_instances(cls, instances: Iterable[Resource], resource_class: Optional[Type[Resource]] = None,
+                       namespace=None) -> 'ResourceFrame':
+        """
+        A frame of `instances` (all of `resource_class`, default the first
+        one's class). Instances are named `namespace[instance._name]`, as in
+        `serializer.to_graph`.
+        """
+        from .serializer import DEFAULT_NAMESPACE
+
+        prefix = str(DEFAULT_NAMESPACE if namespace is None else namespace)
+        instances = list(instances)
+        if resource_class is None:
+            if not instances:
+                raise ValueError("resource_class is required for an empty list of instances")
+            resource_class = type(instances[0])
+        builder = FrameBuilder(resource_class)
+        plan = get_schema(resource_class).load_plan
+
+        for instance in instances:
+            values = {}
+            for field_name, kind, _, _ in plan:
+                _add_cell(builder, values, field_name, kind, getattr(instance, field_name, None), prefix)
+            builder.add_row(prefix + instance._name, instance._name, values)
+        return builder.build()
+
+    @classmethod
+    def from_columns(cls, resource_class: Type[Resource], columns: Dict[str, list], length: int,
+                     namespace=None) -> 'ResourceFrame':
+        """
+        A frame of the `length` instances whose field values `columns` holds
+        (field name or '_name' -> list), without building them - see
+        `Resource.bulk_create(as_frame=True)`. Named as in `from_instances`.
+        """
+        from .serializer import DEFAULT_NAMESPACE
+
+        prefix = str(DEFAULT_NAMESPACE if namespace is None else namespace)
+        builder = FrameBuilder(resource_class)
+        names = columns.get('_name') or [resource_class._name] * length
+        name_codes = [builder.code(prefix + name, name) for name in names]
+        # One row per entity, the first wins (as with add_row)
+        first_rows = {}
+        for row, code in enumerate(name_codes):
+            first_rows.setdefault(code, row)
+        rows = list(first_rows.values()) if len(first_rows) < length else None
+
+        # Filled a column at a time, with the same conversions as _add_cell
+        built = {}
+        for field_name, kind, _, _ in get_schema(resource_class).load_plan:
+            column = columns.get(field_name)
+            if column is None:
+                continue
+            if rows is not None:
+                column = [column[row] for row in rows]
+            if kind == 'named':
+                built[field_name] = [builder.class_code(value) if isinstance(value, type) else -1
+                                     for value in column]
+            elif kind == 'related':
+                related = [value if isinstance(value, Resource) else None for value in column]
+                built[field_name] = [-1 if value is None else builder.code(prefix + value._name, value._name)
+                                     for value in related]
+                numbers = [getattr(value, 'value', None) for value in related]
+                built[f'{field_name}.value'] = [float(number) if isinstance(number, NUMERIC_TYPES) else math.nan
+                                                for number in numbers]
+                units = [getattr(value, 'unit', None) for value in related]
+                built[f'{field_name}.unit'] = [
+                    builder.class_code(unit) if isinstance(unit, type) and issubclass(unit, Resource) else -1
+                    for unit in units
+                ]
+            elif builder.kinds[field_name] == 'float':
+                built[field_name] = [math.nan if value is None else float(value) for value in column]
+            else:
+                built[field_name] = column
+        builder.add_columns(name_codes if rows is None else [name_codes[row] for row in rows], built)
+        return builder.build()
+
+    def to_instances(self) -> List[Resource]:
+        """
+        Build the instances the frame describes, as `ModelLoader.load_instances`
+        would from the same data: related properties get their value and unit,
+        entities and related nodes are named after their IRIs' local names.
+        """
+        from .core import Node
+        from .model_loader import _TermLookups
+
+        lookups = _TermLookups(Graph())
+        plan = get_schema(self.resource_class).load_plan
+        related_cache = {}
+        instances = []
+        for row in range(len(self)):
+            kwargs = {}
+            for field_name, kind, field_type, related in plan:
+                if kind == 'named':
+                    if self.columns[field_name][row] >= 0:
+                        kwargs[field_name] = field_type
+                elif kind == 'related':
+                    code = int(self.columns[field_name][row])
+                    if code < 0:
+                        continue
+                    instance = self._related_instance(field_name, field_type, related, code, row,
+                                                      related_cache, lookups)
+                    if instance is not None:
+                        kwargs[field_name] = instance
+                else:
+                    value = self.columns[field_name][row]
+                    if self.columns[field_name].dtype == np.float64:
+                        if math.isnan(value):
+                            continue
+                        value = field_type(value)
+                    elif value is None:
+                        continue
+                    kwargs[field_name] = value
+            instance = self.resource_class(**kwargs)
+            if issubclass(self.resource_class, Node):
+                instance._name = self.local_names[self.names[row]]
+            instances.append(instance)
+        return instances
+
+    def _related_instance(self, field_name, field_type, related, code, row, cache, lookups):
+        """The related Resource for one cell, mirroring ModelLoader._instantiate_related."""
+        cached = cache.get(code)
+        if isinstance(cached, field_type):
+            return cached
+        has_semantic_type, init_field_names, has_required_instance_fields = related
+
+        value = self.columns[f'{field_name}.value'][row]
+        if not math.isnan(value):
+            kwargs = {}
+            if 'value' in init_field_names:
+                kwargs['value'] = float(value) if value else None
+            unit_code = self.columns[f'{field_name}.unit'][row]
+            if 'unit' in init_field_names and unit_code >= 0:
+                unit_class = lookups.unit_class(URIRef(self.iris[unit_code]))
+                if unit_class:
+                    kwargs['unit'] = unit_class
+            instance = field_type(**kwargs)
+        elif has_semantic_type and has_required_instance_fields:
+            return None
+        else:
+            instance = field_type()
+
+        if not has_semantic_type:
+            instance._name = self.local_names[code]
+        cache.setdefault(code, instance)
+        return instance
@@ -6,6 +6,7 @@ from ..namespaces import G36, RDFS, SH
 
 @dataclass
 class Node(core.Node):
+    __slots__ = ()
     _ns = G36
     _name = 'Class'
     _other_types = [SH.NodeShape, RDFS.Class]
@@ -13,9 +14,10 @@ class Node(core.Node):
 
 @dataclass
 class ExternalReference(Node):
+    __slots__ = ()
     _name = 'ExternalReference'
 
 
 @dataclass
 class EnumerationKind(Node):
-    pass
+    __slots__ = ()
@@ -5,4 +5,10 @@ relation (hasProperty, hasDomain, connectedTo, ...), re-exported here via
 _generated/relations.py. See _generated/relations.py (regenerated via
 `python -m semantic_objects.ingest.cli --ontology g36`).
 """
-from ._generated.relations import *
+from ..lazy import lazy_exports as _lazy_exports, star_import as _star_import
+from ._generated import relations as _generated_relations
+
+# Re-exported lazily: with a split _generated/ package each class is only
+# imported on first use (see semantic_objects.lazy)
+__all__ = list(_generated_relations.__all__)
+__getattr__, __dir__ = _lazy_exports(__name__, _star_import(globals(), _generated_relations))
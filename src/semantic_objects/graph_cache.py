@@ -0,0 +1,304 @@
+"""
+Graph Cache - Persistent on-disk cache of parsed RDF model files
+
+Parsing large Turtle files dominates the time it takes to construct a
+ModelLoader. GraphCache keeps a compact binary copy of each parsed graph (a
+table of distinct terms plus integer triples, pickled) so that later loads of
+an unchanged file rebuild the graph directly instead of parsing it.
+
+Entries are keyed by the file's resolved path, mtime and size, and stored by
+the SHA-256 of its contents: a touched but unchanged file is re-hashed and
+reuses its entry, and identical files share one. The cache is bounded by
+`max_bytes`, evicting least recently used entries first.
+
+Example:
+    cache = GraphCache()                      # ~/.cache/semantic_objects/graphs
+    loader = ModelLoader('building.ttl', cache=cache)
+    ...
+    cache.invalidate('building.ttl')          # force a re-parse next time
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from rdflib import BNode, Graph, Literal, URIRef
+
+from .stores import load_graph, new_graph
+
+# Bump when the entry layout changes; entries with another version are re-parsed
+CACHE_FORMAT_VERSION = 1
+
+# Environment variable overriding the default cache directory
+CACHE_DIR_ENV = 'SEMANTIC_OBJECTS_CACHE_DIR'
+
+_INDEX_FILE = 'index.json'
+_ENTRY_SUFFIX = '.graph.pickle'
+
+# Term kinds in the term table
+_URI, _BNODE, _LITERAL = 0, 1, 2
+
+
+def default_cache_dir() -> Path:
+    """$SEMANTIC_OBJECTS_CACHE_DIR, or ~/.cache/semantic_objects/graphs."""
+    directory = os.environ.get(CACHE_DIR_ENV)
+    if directory:
+        return Path(directory)
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return Path(base) / 'semantic_objects' / 'graphs'
+
+
+def file_digest(path: Union[str, Path]) -> str:
+    """SHA-256 of a file's contents, as hex."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def encode_graph(graph: Graph) -> bytes:
+    """Serialize a graph's triples and namespace bindings to the cache format."""
+    term_ids = {}
+    terms = []
+
+    def term_id(term):
+        index = term_ids.get(term)
+        if index is None:
+            index = term_ids[term] = len(terms)
+            if isinstance(term, Literal):
+                datatype = str(term.datatype) if term.datatype is not None else None
+                terms.append((_LITERAL, str(term), datatype, term.language))
+            elif isinstance(term, BNode):
+                terms.append((_BNODE, str(term)))
+            else:
+                terms.append((_URI, str(term)))
+        return index
+
+    triples = [(term_id(s), term_id(p), term_id(o)) for s, p, o in graph]
+    namespaces = [(prefix, str(namespace)) for prefix, namespace in graph.namespaces()]
+    payload = (CACHE_FORMAT_VERSION, namespaces, terms, triples)
+    return pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def decode_graph(data: bytes, graph: Optional[Graph] = None) -> Graph:
+    """Rebuild a graph from `encode_graph` output (into `graph` if given)."""
+    version, namespaces, terms, triples = pickle.loads(data)
+    if version != CACHE_FORMAT_VERSION:
+        raise ValueError(f"Unsupported graph cache format version: {version}")
+
+    objects = []
+    for entry in terms:
+        kind = entry[0]
+        if kind == _URI:
+            objects.append(URIRef(entry[1]))
+        elif kind == _BNODE:
+            objects.append(BNode(entry[1]))
+        else:
+            _, lexical, datatype, language = entry
+            objects.append(Literal(
+                lexical,
+                datatype=URIRef(datatype) if datatype is not None else None,
+                lang=language
+            ))
+
+    if graph is None:
+        graph = Graph()
+    for prefix, namespace in namespaces:
+        graph.bind(prefix, namespace, override=True, replace=True)
+    graph.addN((objects[s], objects[p], objects[o], graph) for s, p, o in triples)
+    return graph
+
+
+class GraphCache:
+    """
+    On-disk cache of parsed model files.
+
+    The directory holds one `<sha256>.graph.pickle` file per distinct file
+    content and an `index.json` mapping resolved paths to the mtime, size and
+    digest they had when cached. Writes go through a temporary file and
+    `os.replace`, so concurrent processes never see partial entries.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path, None] = None,
+        max_bytes: Optional[int] = 512 * 1024 * 1024
+    ):
+        """
+        Args:
+            directory: Cache directory (default: `default_cache_dir()`)
+            max_bytes: Total size bound for cached entries (None: unbounded)
+        """
+        self.directory = Path(directory) if directory is not None else default_cache_dir()
+        self.max_bytes = max_bytes
+
+    def load(
+        self,
+        path: Union[str, Path],
+        format: Optional[str] = None,
+        store: str = 'default'
+    ) -> Graph:
+        """
+        Return the parsed graph for `path`, parsing (and caching) it only if
+        no entry matches the file's current contents.
+
+        Args:
+            path: RDF file to load
+            format: rdflib parser format (default: guessed from the file name)
+            store: Store backing the returned graph (see stores)
+        """
+        path = Path(path).resolve()
+        stat = path.stat()
+        index = self._read_index()
+        key = str(path)
+
+        known = index.get(key)
+        if known is not None and known[0] == stat.st_mtime_ns and known[1] == stat.st_size:
+            digest = known[2]
+        else:
+            digest = file_digest(path)
+
+        stored = self._read_entry(digest, store)
+        if known != [stat.st_mtime_ns, stat.st_size, digest]:
+            index[key] = [stat.st_mtime_ns, stat.st_size, digest]
+            # The file's previous contents are no longer reachable by path
+            if known is not None and known[2] != digest:
+                self._drop_unreferenced(known[2], index)
+            self._write_index(index)
+
+        if stored is not None:
+            return stored
+        graph = load_graph(path, store=store, format=format)
+        self._write_entry(digest, encode_graph(graph))
+        return graph
+
+    def invalidate(self, path: Union[str, Path, None] = None):
+        """
+        Drop the cached graph for `path` so the next load re-parses it, or
+        drop everything if `path` is None.
+        """
+        if path is None:
+            self.clear()
+            return
+
+        index = self._read_index()
+        known = index.pop(str(Path(path).resolve()), None)
+        if known is None:
+            return
+        self._drop_unreferenced(known[2], index)
+        self._write_index(index)
+
+    def clear(self):
+        """Remove every cached graph and the index."""
+        if not self.directory.is_dir():
+            return
+        for entry in self.directory.glob('*' + _ENTRY_SUFFIX):
+            self._remove(entry)
+        self._remove(self.directory / _INDEX_FILE)
+
+    def size(self) -> int:
+        """Total bytes currently used by cached entries."""
+        return sum(size for _, size, _ in self._entries())
+
+    # Storage
+
+    def _entry_path(self, digest: str) -> Path:
+        return self.directory / (digest + _ENTRY_SUFFIX)
+
+    def _drop_unreferenced(self, digest: str, index: Dict[str, list]):
+        """Delete the entry for `digest` unless another indexed path uses it."""
+        if not any(entry[2] == digest for entry in index.values()):
+            self._remove(self._entry_path(digest))
+
+    def _read_entry(self, digest: str, store: str = 'default') -> Optional[Graph]:
+        entry = self._entry_path(digest)
+        try:
+            data = entry.read_bytes()
+        except OSError:
+            return None
+        try:
+            graph = decode_graph(data, new_graph(store))
+        except Exception:
+            # Corrupt or from another format version: treat as a miss
+            self._remove(entry)
+            return None
+        # Mark as recently used for eviction
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+        return graph
+
+    def _write_entry(self, digest: str, data: bytes):
+        if self.max_bytes is not None and len(data) > self.max_bytes:
+            return
+        self._atomic_write(self._entry_path(digest), data)
+        self._evict(keep=digest)
+
+    def _entries(self) -> List[tuple]:
+        """(last used, size, path) for every entry file."""
+        entries = []
+        if self.directory.is_dir():
+            for entry in self.directory.glob('*' + _ENTRY_SUFFIX):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, entry))
+        return entries
+
+    def _evict(self, keep: str):
+        """Delete least recently used entries until under max_bytes."""
+        if self.max_bytes is None:
+            return
+        entries = sorted(self._entries(), key=lambda entry: entry[0])
+        total = sum(size for _, size, _ in entries)
+        removed = set()
+        for _, size, entry in entries:
+            if total <= self.max_bytes:
+                break
+            digest = entry.name[:-len(_ENTRY_SUFFIX)]
+            if digest == keep:
+                continue
+            self._remove(entry)
+            removed.add(digest)
+            total -= size
+
+        if removed:
+            index = self._read_index()
+            index = {key: value for key, value in index.items() if value[2] not in removed}
+            self._write_index(index)
+
+    def _read_index(self) -> Dict[str, list]:
+        try:
+            with open(self.directory / _INDEX_FILE) as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return index if isinstance(index, dict) else {}
+
+    def _write_index(self, index: Dict[str, list]):
+        self._atomic_write(self.directory / _INDEX_FILE, json.dumps(index).encode())
+
+    def _atomic_write(self, target: Path, data: bytes):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, target)
+        except BaseException:
+            self._remove(Path(tmp))
+            raise
+
+    @staticmethod
+    def _remove(path: Path):
+        try:
+            path.unlink()
+        except OSError:
+            pass
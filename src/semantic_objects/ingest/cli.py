@@ -9,6 +9,7 @@ from .config import IngestConfig
 from .cxf.emitter import CxfEmitter
 from .cxf.parser import CxfParser
 from .parser import OntologyParser
+from ..stores import STORES
 
 REPO_ROOT = Path(__file__).resolve().parents[3]
 
@@ -37,6 +38,12 @@ ONTOLOGY_CHOICES = sorted(set(ADAPTERS) | {'cxf'})
 def main(argv=None):
     parser = argparse.ArgumentParser(description="Ingest an ontology into generated Python classes.")
     parser.add_argument('--ontology', required=True, choices=ONTOLOGY_CHOICES)
+    parser.add_argument('--store', default='default', choices=sorted(STORES),
+                        help="rdflib store to parse the ontology into")
+    parser.add_argument('--slots', action='store_true',
+                        help="emit __slots__-backed classes (no per-instance __dict__)")
+    parser.add_argument('--split', action='store_true',
+                        help="emit one module per class, imported lazily on first use")
     args = parser.parse_args(argv)
 
     if args.ontology == 'cxf':
@@ -44,12 +51,13 @@ def main(argv=None):
         return
 
     adapter_cls, source_path, output_dir = ADAPTERS[args.ontology]
-    config = IngestConfig(ontology_name=args.ontology, source_path=source_path, output_dir=output_dir)
+    config = IngestConfig(ontology_name=args.ontology, source_path=source_path, output_dir=output_dir,
+                          store=args.store)
     adapter = adapter_cls()
 
     ir = OntologyParser(config, adapter).parse()
     emitter = Emitter(ir, adapter.scaffold_parent_local_names(), source_path, output_dir, args.ontology,
-                       adapter=adapter)
+                       adapter=adapter, slots=args.slots, split=args.split)
     emitter.emit()
 
     print(f"Generated {len(ir.classes)} classes and {len(ir.relations)} relations into {output_dir}")
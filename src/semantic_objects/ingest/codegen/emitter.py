@@ -1,5 +1,10 @@
 import hashlib
+import io
 import json
+import keyword
+import re
+import shutil
+import tokenize
 from datetime import datetime, timezone
 from pathlib import Path
 from pprint import pformat
@@ -21,6 +26,10 @@ QUDT_KNOWN = {'Unit': 'Unit', 'QuantityKind': 'QuantityKind'}
 BUCKET_ORDER = ['enumerationkinds', 'properties', 'entities']
 BUCKET_ROOT = {'enumerationkinds': 'EnumerationKind', 'properties': 'Node', 'entities': 'Node'}
 
+# With split=True each class gets its own module in a per-bucket subpackage
+# (e.g. _generated/_entities/Pump.py) and the bucket module becomes a lazy index
+SPLIT_BUCKETS = ['relations'] + BUCKET_ORDER
+
 
 def _sha256(path: Path) -> str:
     h = hashlib.sha256()
@@ -39,6 +48,38 @@ def _same_bucket_deps(cls: ClassIR, by_local: dict) -> List[str]:
     return deps
 
 
+def _bare_names(source: str) -> set:
+    """Names a class's source reads from module scope: identifiers that aren't
+    attribute accesses (`relations.X`), keywords, strings or comments."""
+    names = set()
+    previous = None
+    for token in tokenize.generate_tokens(io.StringIO(source).readline):
+        if token.type == tokenize.NAME and not keyword.iskeyword(token.string) and previous != '.':
+            names.add(token.string)
+        if token.type not in (tokenize.NL, tokenize.NEWLINE, tokenize.COMMENT,
+                              tokenize.INDENT, tokenize.DEDENT):
+            previous = token.string
+    return names
+
+
+def _module_names(class_names: List[str]) -> Dict[str, str]:
+    """Per-class module name for each class: the class name, suffixed if it
+    would clash with another module on a case-insensitive file system."""
+    modules, taken = {}, set()
+    for class_name in class_names:
+        module, n = class_name, 2
+        while module.lower() in taken:
+            module, n = f"{class_name}__{n}", n + 1
+        taken.add(module.lower())
+        modules[class_name] = module
+    return modules
+
+
+def _deepen(import_line: str) -> str:
+    """A relative import line as written one package level further down."""
+    return re.sub(r'^from \.', 'from ..', import_line)
+
+
 def _topo_order(classes_in_bucket: List[ClassIR]) -> List[ClassIR]:
     """Cycle-safe DFS post-order. A genuine circular same-bucket dependency (rare)
     has its back-edge dropped so the sort still terminates; the emitter separately
@@ -66,7 +107,8 @@ class Emitter:
     """OntologyIR -> deterministic, header-stamped .py source under s223/_generated/."""
 
     def __init__(self, ir: OntologyIR, scaffold_names: dict, source_path: Path, output_dir: Path,
-                 ontology_name: str, adapter: Optional[OntologyAdapter] = None):
+                 ontology_name: str, adapter: Optional[OntologyAdapter] = None, slots: bool = False,
+                 split: bool = False):
         self.ir = ir
         self.scaffold_names = scaffold_names
         self.source_path = source_path
@@ -76,6 +118,12 @@ class Emitter:
         self.unresolved_notes: Dict[str, List[dict]] = {}
         self.raw_shapes: Dict[str, List[dict]] = {}
         self._bucket_positions: Dict[str, Dict[str, int]] = {}
+        # Emit `@semantic_object(slots=True)` classes (no per-instance __dict__),
+        # except where that would make a multiple-inheritance class impossible
+        self.slots = slots
+        self._unslotted: set = self._layout_conflict_locals() if slots else set()
+        # Emit one module per class behind lazy bucket modules (see SPLIT_BUCKETS)
+        self.split = split
 
     # -- cross-ontology reference helpers ------------------------------------------
 
@@ -162,6 +210,34 @@ class Emitter:
                 break
         return ordered
 
+    @staticmethod
+    def _adds_slots(cls: ClassIR) -> bool:
+        """Whether cls, emitted slotted, could declare slots of its own - i.e. it
+        has a dedicated field (an over-approximation: its type may not resolve)."""
+        return any(shape.qualified or (shape.min_count is not None and shape.min_count >= 1)
+                   for shape in cls.property_shapes)
+
+    def _layout_conflict_locals(self) -> set:
+        """Classes to emit without slots so every multiple-inheritance class can
+        still be created. Python rejects `class C(A, B)` when both A's and B's
+        branches add slots of their own, so for each such class, every in-IR
+        ancestor that adds slots on one branch but isn't shared by all of them
+        stays a plain (__dict__-backed) class. Only this ontology's hierarchy is
+        visible here: two external parents that both add slots can't be detected."""
+        unslotted = set()
+        for cls in self.ir.classes.values():
+            parents = list(dict.fromkeys(cls.parent_local_names))
+            if len(parents) < 2:
+                continue
+            # A same-named parent is an external class (see _render_class)
+            branches = [set() if p == cls.local_name else self._transitive_ancestor_locals(p) | {p}
+                        for p in parents]
+            shared = set.intersection(*branches)
+            for branch in branches:
+                unslotted |= {local for local in branch - shared
+                              if local in self.ir.classes and self._adds_slots(self.ir.classes[local])}
+        return unslotted
+
     def _note_unresolved(self, class_name: str, shape_or_cc, reason: str):
         self.unresolved_notes.setdefault(class_name, []).append({
             'reason': reason,
@@ -196,7 +272,9 @@ class Emitter:
         if not parents:
             parents = [BUCKET_ROOT[cls.bucket]]
 
-        lines = [f"@semantic_object", f"class {cls.class_name}({', '.join(parents)}):"]
+        decorator = ("@semantic_object(slots=True)"
+                     if self.slots and cls.local_name not in self._unslotted else "@semantic_object")
+        lines = [decorator, f"class {cls.class_name}({', '.join(parents)}):"]
         body_lines = []
         if cls.label:
             body_lines.append(f"    label = {cls.label!r}")
@@ -286,9 +364,12 @@ class Emitter:
             ontology_name=self.ontology_name,
         )
 
-    def _render_bucket(self, bucket: str, prior_buckets: List[str]) -> str:
+    def _bucket_classes(self, bucket: str) -> List[ClassIR]:
         classes = _topo_order([c for c in self.ir.classes.values() if c.bucket == bucket])
         self._bucket_positions[bucket] = {c.local_name: i for i, c in enumerate(classes)}
+        return classes
+
+    def _bucket_imports(self, bucket: str, classes: List[ClassIR], prior_buckets: List[str]) -> List[str]:
         needed_imports = {b for c in classes for p in c.parent_local_names
                            if p in self.ir.classes and self.ir.classes[p].bucket in prior_buckets}
         for c in classes:
@@ -298,18 +379,24 @@ class Emitter:
                     if tb in prior_buckets:
                         needed_imports.add(tb)
 
-        parts = [self._header()]
-        parts.append("from typing import Self")
-        parts.append("from ...core import *")
-        parts.append("from ..core import Node, EnumerationKind, ExternalReference")
-        parts.append("from . import relations")
+        lines = ["from typing import Self"]
+        lines.append("from ...core import *")
+        lines.append("from ..core import Node, EnumerationKind, ExternalReference")
+        lines.append("from . import relations")
         for b in prior_buckets:
             if b in needed_imports:
-                parts.append(f"from . import {b}")
+                lines.append(f"from . import {b}")
         if bucket == 'properties':
-            parts.append("from ...qudt import Unit, QuantityKind")
+            lines.append("from ...qudt import Unit, QuantityKind")
         if self.adapter is not None:
-            parts.extend(self.adapter.external_import_lines())
+            lines.extend(self.adapter.external_import_lines())
+        return lines
+
+    def _render_bucket(self, bucket: str, prior_buckets: List[str]) -> str:
+        classes = self._bucket_classes(bucket)
+
+        parts = [self._header()]
+        parts.extend(self._bucket_imports(bucket, classes, prior_buckets))
         # Restrict `from X import *` to the classes actually defined here - without
         # this, the cross-bucket `from . import {b}` lines above (needed so field
         # types can reference e.g. properties.SomeClass) would themselves leak into
@@ -323,20 +410,48 @@ class Emitter:
 
         return "\n".join(parts)
 
-    def _render_relations(self) -> str:
-        ns_name = getattr(self.adapter, 'namespace_import_name', None) or 'S223'
-        parts = [self._header()]
-        parts.append("from ...core import semantic_object, Predicate as _CorePredicate")
-        parts.append(f"from ...namespaces import {ns_name}")
-        parts.append("__all__ = " + repr(['Predicate'] + sorted(r.class_name for r in self.ir.relations.values())))
-        parts.append("\n@semantic_object")
-        parts.append("class Predicate(_CorePredicate):")
-        parts.append(f"    _ns = {ns_name}\n")
+    def _render_bucket_split(self, bucket: str, prior_buckets: List[str]) -> Tuple[str, Dict[str, str]]:
+        """(lazy bucket module, {module name: source} of its per-class modules)."""
+        classes = self._bucket_classes(bucket)
+        imports = [_deepen(line) for line in self._bucket_imports(bucket, classes, prior_buckets)]
+        sources = [(c.class_name, self._render_class(c, prior_buckets)) for c in classes]
+        return self._split_modules(bucket, imports, sources)
+
+    def _split_modules(self, bucket: str, imports: List[str],
+                       sources: List[Tuple[str, str]]) -> Tuple[str, Dict[str, str]]:
+        """Split a bucket's class sources (in definition order) into one module
+        each. A class that reads an earlier class of the same bucket by bare
+        name imports it from that class's module - later ones can't be meant,
+        as in the single-file layout the name still referred to an import."""
+        modules = _module_names([class_name for class_name, _ in sources])
+        position = {class_name: i for i, (class_name, _) in enumerate(sources)}
+        files = {}
+        for i, (class_name, source) in enumerate(sources):
+            siblings = sorted(name for name in _bare_names(source)
+                              if name != class_name and position.get(name, i) < i)
+            parts = [self._header()]
+            parts.extend(imports)
+            parts.extend(f"from .{modules[name]} import {name}" for name in siblings)
+            parts.append("\n")
+            parts.append(source)
+            files[modules[class_name]] = "\n".join(parts).rstrip("\n") + "\n"
 
+        parts = [self._header()]
+        parts.append("from ...lazy import lazy_exports")
+        parts.append("__all__ = " + repr([class_name for class_name, _ in sources]))
+        parts.append("__getattr__, __dir__ = lazy_exports(__name__, {")
+        parts.extend(f"    {class_name!r}: '._{bucket}.{modules[class_name]}',"
+                     for class_name, _ in sources)
+        parts.append("})")
+        return "\n".join(parts) + "\n", files
+
+    def _relation_namespace(self) -> str:
+        return getattr(self.adapter, 'namespace_import_name', None) or 'S223'
+
+    def _relation_sources(self) -> List[Tuple[str, str]]:
+        sources = []
         for local in sorted(self.ir.relations.keys()):
             rel = self.ir.relations[local]
-            parts.append("@semantic_object")
-            parts.append(f"class {rel.class_name}(Predicate):")
             body = []
             if rel.label:
                 body.append(f"    label = {rel.label!r}")
@@ -346,9 +461,32 @@ class Emitter:
                 body.append(f"    # inverse of {self.ontology_name}:{rel.inverse_of_local}")
             if not body:
                 body.append("    pass")
-            parts.append("\n".join(body) + "\n")
+            sources.append((rel.class_name, "\n".join(
+                ["@semantic_object", f"class {rel.class_name}(Predicate):", "\n".join(body) + "\n"])))
+        return sources
+
+    def _render_relations(self) -> str:
+        ns_name = self._relation_namespace()
+        parts = [self._header()]
+        parts.append("from ...core import semantic_object, Predicate as _CorePredicate")
+        parts.append(f"from ...namespaces import {ns_name}")
+        parts.append("__all__ = " + repr(['Predicate'] + sorted(r.class_name for r in self.ir.relations.values())))
+        parts.append("\n@semantic_object")
+        parts.append("class Predicate(_CorePredicate):")
+        parts.append(f"    _ns = {ns_name}\n")
+
+        for _, source in self._relation_sources():
+            parts.append(source)
         return "\n".join(parts)
 
+    def _render_relations_split(self) -> Tuple[str, Dict[str, str]]:
+        ns_name = self._relation_namespace()
+        imports = ["from ....core import semantic_object, Predicate as _CorePredicate",
+                   f"from ....namespaces import {ns_name}"]
+        predicate = "\n".join(["@semantic_object", "class Predicate(_CorePredicate):", f"    _ns = {ns_name}\n"])
+        # Predicate comes first in definition order, not sorted in with the relations
+        return self._split_modules('relations', imports, [('Predicate', predicate)] + self._relation_sources())
+
     def _render_meta(self) -> str:
         parts = [self._header()]
         parts.append(f"SOURCE_FILE = {str(self.source_path)!r}")
@@ -379,27 +517,49 @@ class Emitter:
 
     def _render_init(self) -> str:
         parts = [self._header()]
+        if self.split:
+            parts.append("from ...lazy import lazy_exports, star_import")
         parts.append("from . import relations")
         parts.append("from . import enumerationkinds")
         parts.append("from . import properties")
         parts.append("from . import entities")
-        parts.append("from .relations import *")
-        parts.append("from .enumerationkinds import *")
-        parts.append("from .properties import *")
-        parts.append("from .entities import *")
+        if self.split:
+            # The bucket modules are lazy, so re-export their names lazily too
+            parts.append("__getattr__, __dir__ = lazy_exports(__name__, star_import(globals(), relations, "
+                         "enumerationkinds, properties, entities))")
+        else:
+            parts.append("from .relations import *")
+            parts.append("from .enumerationkinds import *")
+            parts.append("from .properties import *")
+            parts.append("from .entities import *")
         return "\n".join(parts) + "\n"
 
     # -- top-level entry point --------------------------------------------------
 
+    def _write_split_package(self, bucket: str, files: Dict[str, str]):
+        package = self.output_dir / f"_{bucket}"
+        package.mkdir(exist_ok=True)
+        for stale in package.glob("*.py"):
+            stale.unlink()
+        (package / '__init__.py').write_text(self._header())
+        for module, source in files.items():
+            (package / f"{module}.py").write_text(source)
+
     def emit(self):
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-        relations_src = self._render_relations()
-        enum_src = self._render_bucket('enumerationkinds', [])
-        properties_src = self._render_bucket('properties', ['enumerationkinds'])
-        entities_src = self._render_bucket('entities', ['enumerationkinds', 'properties'])
+        if self.split:
+            relations_src, relations_files = self._render_relations_split()
+            enum_src, enum_files = self._render_bucket_split('enumerationkinds', [])
+            properties_src, properties_files = self._render_bucket_split('properties', ['enumerationkinds'])
+            entities_src, entities_files = self._render_bucket_split('entities', ['enumerationkinds', 'properties'])
+        else:
+            relations_src = self._render_relations()
+            enum_src = self._render_bucket('enumerationkinds', [])
+            properties_src = self._render_bucket('properties', ['enumerationkinds'])
+            entities_src = self._render_bucket('entities', ['enumerationkinds', 'properties'])
         # raw_shapes/meta depend on unresolved_notes/raw_shapes populated during the
-        # three _render_bucket calls above, so render them last.
+        # three bucket renders above, so render them last.
         raw_shapes_src = self._render_raw_shapes()
         meta_src = self._render_meta()
         init_src = self._render_init()
@@ -411,3 +571,13 @@ class Emitter:
         (self.output_dir / '_raw_shapes.py').write_text(raw_shapes_src)
         (self.output_dir / '_meta.py').write_text(meta_src)
         (self.output_dir / '__init__.py').write_text(init_src)
+
+        if self.split:
+            self._write_split_package('relations', relations_files)
+            self._write_split_package('enumerationkinds', enum_files)
+            self._write_split_package('properties', properties_files)
+            self._write_split_package('entities', entities_files)
+        else:
+            # Switching back from a split layout
+            for bucket in SPLIT_BUCKETS:
+                shutil.rmtree(self.output_dir / f"_{bucket}", ignore_errors=True)
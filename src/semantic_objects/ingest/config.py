@@ -8,3 +8,7 @@ class IngestConfig:
     source_path: Path
     output_dir: Path
     include_extension_namespaces: bool = False
+    # rdflib store to parse the source into ('default' or 'oxigraph', see stores).
+    # Oxigraph iterates triples in its own order, so shape order in the
+    # generated code can differ from a 'default' run.
+    store: str = 'default'
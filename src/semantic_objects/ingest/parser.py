@@ -1,8 +1,9 @@
 from typing import Dict, List, Set
 
-from rdflib import Graph, URIRef
+from rdflib import URIRef
 
 from ..namespaces import QK, RDFS
+from ..stores import load_graph
 from .adapters.base import OntologyAdapter
 from .config import IngestConfig
 from .ir import ClassIR, OntologyIR, RelationIR
@@ -20,8 +21,7 @@ class OntologyParser:
         self.adapter = adapter
 
     def parse(self) -> OntologyIR:
-        g = Graph()
-        g.parse(str(self.config.source_path), format='turtle')
+        g = load_graph(self.config.source_path, store=self.config.store, format='turtle')
 
         subjects = {s for s in g.subjects() if isinstance(s, URIRef)}
         if not self.config.include_extension_namespaces:
@@ -0,0 +1,95 @@
+"""
+Lazy - Module-level `__getattr__` (PEP 562) for lazily imported names
+
+Generated ontology packages define hundreds of classes, but most programs use
+a handful. A module built with `lazy_exports` keeps an index of
+name -> defining module and only imports a name's module the first time the
+name is looked up; the value is then stored in the module's globals, so later
+lookups never reach `__getattr__` again.
+
+    # semantic_objects/s223/_generated/entities.py (generated with --split)
+    __getattr__, __dir__ = lazy_exports(__name__, {'Pump': '._entities.Pump', ...})
+
+`star_import` is the lazy counterpart of a run of `from m import *` lines, and
+`load_all` imports everything a lazy module indexes, for code that scans a
+module's namespace (see discovery.get_module_classes).
+"""
+
+import importlib
+import sys
+from importlib.util import resolve_name
+from types import ModuleType
+from typing import Callable, Dict, List, Tuple
+
+
+def lazy_exports(module_name: str, index: Dict[str, str]) -> Tuple[Callable, Callable]:
+    """
+    Build `__getattr__` and `__dir__` for the module `module_name` (pass
+    `__name__`), serving each name in `index` from the module it maps to.
+
+    Args:
+        module_name: The lazy module's own name
+        index: name -> module defining it (absolute, or relative to the lazy
+            module's package); the value is that module's attribute `name`
+
+    Returns:
+        (__getattr__, __dir__) to assign at module level
+    """
+    package = sys.modules[module_name].__package__
+    index = {name: resolve_name(target, package) for name, target in index.items()}
+
+    def __getattr__(name):
+        target = index.get(name)
+        if target is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(target), name)
+        vars(sys.modules[module_name])[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[module_name])) | set(index))
+
+    __getattr__.lazy_index = index
+    return __getattr__, __dir__
+
+
+def lazy_index(module: ModuleType) -> Dict[str, str]:
+    """The name -> module index of a `lazy_exports` module ({} for others)."""
+    return getattr(vars(module).get('__getattr__'), 'lazy_index', {})
+
+
+def star_names(module: ModuleType) -> List[str]:
+    """The names `from module import *` binds (for a lazy module without
+    `__all__`, including the public names it hasn't imported yet)."""
+    names = vars(module).get('__all__')
+    if names is None:
+        names = [name for name in vars(module) if not name.startswith('_')]
+        names += [name for name in lazy_index(module) if not name.startswith('_') and name not in names]
+    return list(names)
+
+
+def star_import(namespace: dict, *modules: ModuleType) -> Dict[str, str]:
+    """
+    Like `from m import *` into `namespace` for each module in turn (later
+    modules win), except that names a lazy module hasn't imported yet aren't
+    bound: they're returned as an index to pass to `lazy_exports`.
+    """
+    index = {}
+    for module in modules:
+        pending = lazy_index(module)
+        loaded = vars(module)
+        for name in star_names(module):
+            if name in pending and name not in loaded:
+                namespace.pop(name, None)
+                index[name] = pending[name]
+            else:
+                namespace[name] = getattr(module, name)
+                index.pop(name, None)
+    return index
+
+
+def load_all(module: ModuleType) -> ModuleType:
+    """Import every name a lazy module indexes (no-op for other modules)."""
+    for name in lazy_index(module):
+        getattr(module, name)
+    return module
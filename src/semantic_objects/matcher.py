@@ -0,0 +1,239 @@
+"""
+Matcher - Match a class's query pattern against a graph without SPARQL
+
+The queries SparqlQueryBuilder generates are conjunctive patterns around the
+instance variable `?name`:
+
+    ?name rdf:type s223:Space .                  class (and fixed values)
+    ?name s223:hasProperty ?area .               one relation per field
+    ?area rdf:type s223:QuantifiableObservableProperty .
+    ?area s223:hasQuantityKind quantitykind:Area .   tests on a field's node
+
+plus exact_values filters (`FILTER(?v IN (...))`, `FILTER NOT EXISTS`) and
+OPTIONAL groups hanging off those variables (optional fields, a property's
+value and unit). Going through rdflib's SPARQL parser and evaluator for them
+costs far more than the matching itself. `PatternMatcher` compiles the pattern (`ClassPattern`, see
+`SparqlQueryBuilder.get_pattern`) into direct index lookups instead:
+
+  candidates: the subjects of the rarest fixed `?name` pattern (an index
+              lookup on its predicate and object), checked against the others
+  fields:     per relation, a hash join on `?name` - one scan of the
+              predicate's triples into a subject -> objects table - or, for
+              few candidates, a lookup per candidate (see SCAN_RATIO)
+  tests:      each field node checked once against its patterns and filters,
+              memoized
+  optional:   each group matched per row by lookups from its bound variable,
+              its variables left None (unbound) where it doesn't match
+
+It yields the same rows as `SELECT DISTINCT *` over the query, possibly in
+another order, one tuple per solution in `variables` order. ModelLoader uses
+it for the default store (see `ModelLoader(native=...)`); classes whose
+pattern has another shape have no matcher (`ClassSchema.matcher` is None)
+and go through SPARQL.
+"""
+
+from itertools import product
+from typing import Iterable, Iterator, List, Optional
+
+from rdflib import Graph, Variable
+from rdflib.term import BNode
+
+from .query import ClassPattern
+
+# Scan a relation's triples (hash join) rather than look up each candidate's
+# objects when there are at most this many triples per candidate
+SCAN_RATIO = 4
+
+
+def _is_variable(term) -> bool:
+    return isinstance(term, (Variable, BNode))
+
+
+class PatternMatcher:
+    """A ClassPattern compiled for matching with graph index lookups."""
+
+    def __init__(self, pattern: ClassPattern):
+        """
+        Args:
+            pattern: The class's pattern (see `SparqlQueryBuilder.get_pattern`)
+
+        Raises:
+            ValueError: if the pattern isn't a star around ?name with at most
+                fixed tests on its field variables (and OPTIONAL groups
+                looked up from them)
+        """
+        name = Variable('name')
+        self.constraints = []   # (p, o) for ?name p o
+        self.edges = {}         # field variable -> predicates of ?name p ?var
+        self.tests = {}         # field variable -> (p, o) of ?var p o
+        for s, p, o in pattern.triples:
+            if _is_variable(p) or not _is_variable(s):
+                raise ValueError(f"unsupported pattern {s} {p} {o}")
+            if s == name:
+                if o == name:
+                    raise ValueError(f"unsupported pattern {s} {p} {o}")
+                if _is_variable(o):
+                    self.edges.setdefault(o, []).append(p)
+                else:
+                    self.constraints.append((p, o))
+            elif _is_variable(o):
+                raise ValueError(f"unsupported pattern {s} {p} {o}: joins two field variables")
+            else:
+                self.tests.setdefault(s, []).append((p, o))
+        if not self.constraints:
+            raise ValueError("the pattern needs a fixed ?name pattern (its rdf:type)")
+        unjoined = [var for var in self.tests if var not in self.edges]
+        if unjoined:
+            raise ValueError(f"unsupported pattern: {', '.join(map(str, unjoined))} not joined to ?name")
+
+        self.allowed = {}       # field variable -> terms it may take
+        for var, terms in pattern.filters:
+            if var not in self.edges:
+                raise ValueError(f"unsupported filter on {var}")
+            self.allowed[var] = self.allowed[var] & terms if var in self.allowed else frozenset(terms)
+
+        self.variables: List[Variable] = [name, *self.edges]
+        self.optional = [self._compile_optional(group) for group in pattern.optional]
+        self.not_exists = []    # (p, row position of o or None, o)
+        for s, p, o in pattern.not_exists:
+            if s != name or _is_variable(p):
+                raise ValueError(f"unsupported NOT EXISTS pattern {s} {p} {o}")
+            position = self.variables.index(o) if o in self.edges else None
+            self.not_exists.append((p, position, o))
+
+    def _compile_optional(self, group) -> tuple:
+        """
+        An OPTIONAL group as (triples in evaluation order, its new variables),
+        its variables added to `variables`.
+
+        Raises:
+            ValueError: unless each pattern can be looked up from a variable
+                bound before it, and the group's new variables are its own
+        """
+        bound = set(self.variables[:1 + len(self.edges)])
+        new = []
+        remaining, ordered = list(group), []
+        while remaining:
+            ready = [t for t in remaining if not _is_variable(t[1]) and (t[0] in bound or t[0] in new)]
+            if not ready:
+                raise ValueError(f"unsupported OPTIONAL group {group}")
+            triple = ready[0]
+            remaining.remove(triple)
+            ordered.append(triple)
+            o = triple[2]
+            if _is_variable(o) and o not in bound and o not in new:
+                if o in self.variables:
+                    raise ValueError(f"unsupported OPTIONAL group {group}: shares {o} with another")
+                new.append(o)
+        self.variables.extend(new)
+        return ordered, new
+
+    def candidates(self, graph: Graph, statistics=None, subjects: Optional[Iterable] = None) -> List:
+        """
+        The ?name values matching every fixed ?name pattern, in graph order
+        (or the order of `subjects`, if given: only those are considered).
+        """
+        checks = list(self.constraints)
+        if subjects is None:
+            if statistics is not None:
+                checks.sort(key=lambda constraint: statistics.pair(*constraint))
+            p, o = checks.pop(0)
+            pool = graph.subjects(p, o)
+        else:
+            pool = dict.fromkeys(subjects)
+        return [s for s in pool if all((s, p, o) in graph for p, o in checks)]
+
+    def _objects(self, graph: Graph, predicate, candidates: List, statistics):
+        """subject -> its objects for predicate, as a function (see SCAN_RATIO)."""
+        if statistics is not None and statistics.predicate(predicate)[0] <= SCAN_RATIO * len(candidates):
+            wanted = set(candidates)
+            table = {}
+            for s, o in graph.subject_objects(predicate):
+                if s in wanted:
+                    table.setdefault(s, []).append(o)
+            return lambda s: table.get(s, ())
+        return lambda s: list(graph.objects(s, predicate))
+
+    def match(self, graph: Graph, statistics=None, subjects: Optional[Iterable] = None) -> Iterator[tuple]:
+        """
+        Yield one tuple of terms per solution, in `variables` order.
+
+        Args:
+            graph: The graph to match in
+            statistics: Optional planner.GraphStatistics for graph, to start
+                from the rarest fixed pattern and choose between scans and
+                lookups; without them, lookups per candidate
+            subjects: Only match these ?name values
+        """
+        candidates = self.candidates(graph, statistics, subjects)
+        if not candidates:
+            return
+        fields = [(var, [self._objects(graph, p, candidates, statistics) for p in predicates])
+                  for var, predicates in self.edges.items()]
+        accepted = {var: {} for var in self.edges}
+
+        def accepts(var, value):
+            known = accepted[var].get(value)
+            if known is None:
+                known = (value in self.allowed.get(var, (value,))
+                         and all((value, p, o) in graph for p, o in self.tests.get(var, ())))
+                accepted[var][value] = known
+            return known
+
+        for s in candidates:
+            columns = []
+            for var, lookups in fields:
+                values = lookups[0](s)
+                for lookup in lookups[1:]:
+                    others = set(lookup(s))
+                    values = [value for value in values if value in others]
+                values = [value for value in values if accepts(var, value)]
+                if not values:
+                    break
+                columns.append(values)
+            else:
+                for combination in product(*columns):
+                    row = (s, *combination)
+                    if self.not_exists and not self._absent(graph, row):
+                        continue
+                    if self.optional:
+                        yield from self._extend(graph, row)
+                    else:
+                        yield row
+
+    def _extend(self, graph: Graph, row: tuple) -> Iterator[tuple]:
+        """row with the variables of each OPTIONAL group, one row per
+        combination of group solutions (None for a group that doesn't match)."""
+        binding = dict(zip(self.variables, row))
+        extensions = []
+        for triples, new in self.optional:
+            solutions = [tuple(solution[var] for var in new) for solution in _solutions(graph, triples, binding)]
+            extensions.append(solutions or [(None,) * len(new)])
+        for combination in product(*extensions):
+            yield row + sum(combination, ())
+
+    def _absent(self, graph: Graph, row: tuple) -> bool:
+        """True if no NOT EXISTS pattern matches for row."""
+        s = row[0]
+        for p, position, o in self.not_exists:
+            if position is not None:
+                o = row[position]
+            elif _is_variable(o):
+                o = None
+            if (s, p, o) in graph:
+                return False
+        return True
+
+
+def _solutions(graph: Graph, triples: List[tuple], binding: dict) -> Iterator[dict]:
+    """The extensions of binding matching triples, each looked up from a bound subject."""
+    if not triples:
+        yield binding
+        return
+    (s, p, o), rest = triples[0], triples[1:]
+    s = binding[s] if _is_variable(s) else s
+    if _is_variable(o) and o not in binding:
+        for value in graph.objects(s, p):
+            yield from _solutions(graph, rest, {**binding, o: value})
+    elif (s, p, binding.get(o, o)) in graph:
+        yield from _solutions(graph, rest, binding)
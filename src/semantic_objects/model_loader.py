@@ -8,20 +8,34 @@ LoadModel class with a modern approach using the Resource class system.
 
 import os
 import pandas as pd
-from typing import Any, Dict, List, Optional, Union, Type, get_origin, get_args
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union, Type, get_origin, get_args
 from pathlib import Path
-from dataclasses import fields, is_dataclass, MISSING, _MISSING_TYPE
+from dataclasses import MISSING
 
-from rdflib import Graph, Literal, Namespace, URIRef
+from rdflib import Graph, Literal, Namespace, URIRef, Variable
+from rdflib.term import Identifier
 from buildingmotif import BuildingMOTIF, get_building_motif
 from buildingmotif.dataclasses import Library, Model
 
 from .namespaces import *
-from .core import Resource, Node, NamedNode
-from .query import SparqlQueryBuilder
+from .core import Resource, Node
+from .query import CLASS_VARIABLE, SparqlQueryBuilder, add_values
+from .registry import class_for_iri
+from .schema import get_schema
+from .graph_cache import GraphCache
+from .identity_map import IdentityMap
+from .planner import GraphStatistics, plan_query, union_query, with_values
+from .stores import load_graph, store_of, to_store
+from .results import batch_rows, query_batches
+from .frame import FrameBuilder, ResourceFrame, as_number
 
 
-def query_to_df(query: str, graph: Graph, prefixed: bool = False) -> pd.DataFrame:
+def query_to_df(
+    query: str,
+    graph: Graph,
+    prefixed: bool = False,
+    store: Optional[str] = None
+) -> pd.DataFrame:
     """
     Execute a SPARQL query and return results as a pandas DataFrame.
     
@@ -29,18 +43,24 @@ def query_to_df(query: str, graph: Graph, prefixed: bool = False) -> pd.DataFram
         query: SPARQL query string
         graph: RDF graph to query
         prefixed: If True, keep prefixed notation; if False, use full URIs
+        store: Evaluate the query in this store ('default' or 'oxigraph'),
+            copying the graph into it first if it's backed by another
         
     Returns:
         DataFrame with query results
     """
-    results = graph.query(query)
-    
+    results = to_store(graph, store).query(query)
+    return _rows_to_df(results.vars, results, prefixed)
+
+
+def _rows_to_df(variables, results, prefixed: bool) -> pd.DataFrame:
+    """Result rows (indexable in `variables` order) as query_to_df's DataFrame."""
     # Convert results to list of dictionaries
     rows = []
     for row in results:
         row_dict = {}
-        for var in results.vars:
-            value = row[var]
+        for i, var in enumerate(variables):
+            value = row[i]
             if value is not None:
                 if prefixed:
                     row_dict[str(var)] = value
@@ -54,6 +74,131 @@ def query_to_df(query: str, graph: Graph, prefixed: bool = False) -> pd.DataFram
     return pd.DataFrame(rows)
 
 
+def _as_term(value):
+    """Turn a DataFrame cell back into an rdflib term (query_to_df stringifies URIs)."""
+    if isinstance(value, str) and not isinstance(value, Identifier):
+        return URIRef(value)
+    return value
+
+
+def _pick(row, positions: List[Optional[int]]) -> List[Any]:
+    """The terms at positions in row (None for a None position)."""
+    return [row[i] if i is not None else None for i in positions]
+
+
+def _value_seeds(plan, positions: Dict[str, int], field_positions) -> List[tuple]:
+    """
+    The `_TermLookups.bind_row` seeds for the fields in plan whose value or unit
+    the class query also binds, as ?<field>_value and ?<field>_unit.
+    """
+    seeds = []
+    for entry, field_position in zip(plan, field_positions):
+        if field_position is None:
+            continue
+        for suffix, predicate in (('value', S223['hasValue']), ('unit', QUDT['hasUnit'])):
+            position = positions.get(f'{entry[0]}_{suffix}')
+            if position is not None:
+                seeds.append((field_position, predicate, position))
+    return seeds
+
+
+def _graph_cache(cache) -> Optional[GraphCache]:
+    """Resolve ModelLoader's `cache` argument to a GraphCache (or None)."""
+    if cache is None or cache is False:
+        return None
+    if cache is True:
+        return GraphCache()
+    if isinstance(cache, GraphCache):
+        return cache
+    return GraphCache(cache)
+
+
+class _TermLookups:
+    """
+    Value, unit and local-name lookups (and bookkeeping) for one load.
+
+    With bulk=True, s223:hasValue and qudt:hasUnit are each indexed with a single
+    pass over the graph the first time they're needed, so every row is a dict
+    join instead of a graph lookup. Values and units the query bound itself
+    (see `bind_row`) are used as they are, without either. Local names and unit
+    classes are memoized per IRI either way.
+    """
+
+    def __init__(self, graph: Graph, bulk: bool = False):
+        self.g = graph
+        self.bulk = bulk
+        self._indexes = {}
+        # predicate -> {subject: object (None: it has none)} bound by query rows
+        self._bound = {}
+        self._local_names = {}
+        self._unit_classes = {}
+        # id(instance) -> (IRI, instance) for every object instantiated during
+        # this load; holding the instance keeps its id from being reused
+        self._instance_iris = {}
+
+    def _object(self, subject, predicate):
+        bound = self._bound.get(predicate)
+        if bound is not None and subject in bound:
+            return bound[subject]
+        if not self.bulk:
+            return self.g.value(subject, predicate)
+        index = self._indexes.get(predicate)
+        if index is None:
+            index = {}
+            for s, o in self.g.subject_objects(predicate):
+                index.setdefault(s, o)
+            self._indexes[predicate] = index
+        return index.get(subject)
+
+    def bind_row(self, row, seeds):
+        """
+        Record the values and units a result row binds: seeds are (position of
+        a node, predicate, position of its object) - e.g. ?area, s223:hasValue,
+        ?area_value (see `_value_seeds`). An unbound object means the node has
+        none; the first binding for a node wins, like the bulk indexes.
+        """
+        for node_position, predicate, position in seeds:
+            node = row[node_position]
+            if node is not None:
+                self._bound.setdefault(predicate, {}).setdefault(node, row[position])
+
+    def value(self, uri):
+        return self._object(uri, S223['hasValue'])
+
+    def unit(self, uri):
+        return self._object(uri, QUDT['hasUnit'])
+
+    def local_name(self, uri) -> str:
+        local_name = self._local_names.get(uri)
+        if local_name is None:
+            try:
+                _, _, local_name = self.g.compute_qname(uri)
+            except Exception:
+                local_name = str(uri).split('#')[-1].split('/')[-1]
+            self._local_names[uri] = local_name
+        return local_name
+
+    def record(self, instance, iri: str):
+        """Remember which IRI an instance was built for."""
+        self._instance_iris[id(instance)] = (iri, instance)
+
+    def iri_of(self, instance) -> Optional[str]:
+        """The IRI an instance was built for during this load, if any."""
+        entry = self._instance_iris.get(id(instance))
+        return entry[0] if entry is not None and entry[1] is instance else None
+
+    def unit_class(self, unit_uri):
+        """The Unit class for unit_uri, or None: the registered class with that
+        IRI, else the class in `units` named like its local name."""
+        if unit_uri not in self._unit_classes:
+            unit_class = class_for_iri(unit_uri)
+            if unit_class is None:
+                from . import units
+                unit_class = getattr(units, self.local_name(unit_uri), None)
+            self._unit_classes[unit_uri] = unit_class
+        return self._unit_classes[unit_uri]
+
+
 class ModelLoader:
     """
     Load semantic data from RDF graphs into Python objects based on Resource classes.
@@ -67,7 +212,10 @@ class ModelLoader:
         source: Union[str, Graph],
         namespace: Union[str, Namespace] = None,
         template_dir: Optional[str] = None,
-        load_ontology: bool = False
+        load_ontology: bool = False,
+        cache: Union[bool, str, Path, GraphCache, None] = None,
+        store: Optional[str] = None,
+        native: bool = True
     ):
         """
         Initialize the ModelLoader.
@@ -77,13 +225,26 @@ class ModelLoader:
             namespace: Namespace for the model (default: urn:model#)
             template_dir: Directory containing BuildingMOTIF templates (optional)
             load_ontology: If True, load relevant ontologies (e.g., s223)
+            cache: Reuse parsed file sources across runs - True for the default
+                GraphCache, a cache directory, or a GraphCache (see graph_cache)
+            store: Store backing the graph, 'default' (rdflib in-memory) or
+                'oxigraph' (see stores). A file source is parsed into it; a Graph
+                source backed by another store is copied into it. None keeps a
+                Graph source as is and parses files into the default store.
+            native: Match class queries on the default store with index
+                lookups (see matcher) instead of rdflib's SPARQL engine, for
+                classes whose pattern allows it. False always runs the SPARQL
+                query.
         """
         # Load or use the provided graph
         if isinstance(source, str) and os.path.isfile(source):
-            self.g = Graph()
-            self.g.parse(source)
+            graph_cache = _graph_cache(cache)
+            if graph_cache is not None:
+                self.g = graph_cache.load(source, store=store or 'default')
+            else:
+                self.g = load_graph(source, store=store or 'default')
         elif isinstance(source, Graph):
-            self.g = source
+            self.g = to_store(source, store)
         else:
             raise ValueError("Source must be a file path or an RDF graph.")
         
@@ -105,6 +266,19 @@ class ModelLoader:
             except Exception as e:
                 print(f"Warning: Could not load s223 ontology: {e}")
         
+        # Per-class field plans (see _field_plan)
+        self._field_plans = {}
+
+        # IRI -> object for everything this loader instantiates, held weakly,
+        # so every load returns the same object for the same node
+        self.identity_map = IdentityMap()
+
+        # Graph statistics (see planner) and the class queries planned with
+        # them, both built on first use
+        self._statistics = None
+        self._planned_queries = {}
+        self.native = native
+
         # Initialize BuildingMOTIF if template_dir is provided
         self.template_dir = template_dir
         self.library = None
@@ -131,18 +305,134 @@ class ModelLoader:
         Returns:
             DataFrame with query results
         """
-        # Generate SPARQL query from the class definition
-        query = resource_class.get_sparql_query(ontology=ontology)
-        
-        # Execute query and return results
-        return query_to_df(query, self.g, prefixed=False)
+        # Execute the class's (cached) query and return results
+        variables, rows = self._class_rows(resource_class, ontology)
+        return _rows_to_df(variables, rows, prefixed=False)
+
+    def query_class_batches(
+        self,
+        resource_class: Type[Resource],
+        ontology: Optional[str] = None,
+        batch_size: int = 10000
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Like `query_class`, but yields the results in DataFrames of at most
+        `batch_size` rows with typed columns (see `results.query_batches`).
+
+        Args:
+            resource_class: The Resource class to query for
+            ontology: Optional ontology identifier (e.g., 's223') for special handling
+            batch_size: Maximum rows per DataFrame
+        """
+        matcher = self._matcher(resource_class, ontology)
+        if matcher is not None:
+            return batch_rows([str(var) for var in matcher.variables], matcher.match(self.g, self.statistics),
+                              batch_size=batch_size)
+        return query_batches(self._class_query(resource_class, ontology), self.g, batch_size=batch_size)
+
+    @property
+    def statistics(self) -> GraphStatistics:
+        """Cardinality statistics of the graph, gathered lazily (see planner)."""
+        if self._statistics is None:
+            self._statistics = GraphStatistics(self.g)
+        return self._statistics
+
+    def refresh_statistics(self):
+        """Drop the graph statistics and the queries planned with them, e.g.
+        after adding or removing many triples."""
+        self._statistics = None
+        self._planned_queries.clear()
+
+    def _class_query(self, resource_class: Type[Resource], ontology: Optional[str]):
+        """
+        The query for resource_class in the form this graph's store runs fastest:
+        for the default store, rdflib's prepared (already parsed) query with its
+        triple patterns ordered for this graph's statistics (see planner); the
+        query text for stores that evaluate SPARQL themselves (e.g. Oxigraph),
+        which can't take an rdflib-parsed query and plan their own joins. Both
+        are cached, the planned query per loader and class - planned from a
+        copy of the class's prepared query, so each class is parsed once.
+        """
+        if store_of(self.g) == 'default':
+            key = (resource_class, ontology)
+            planned = self._planned_queries.get(key)
+            if planned is None:
+                planned = plan_query(resource_class.get_prepared_query(ontology=ontology), self.statistics)
+                self._planned_queries[key] = planned
+            return planned
+        return resource_class.get_sparql_query(ontology=ontology)
+
+    def _matcher(self, resource_class: Type[Resource], ontology: Optional[str]):
+        """The class's native PatternMatcher, if this loader uses one for it."""
+        if not self.native or store_of(self.g) != 'default':
+            return None
+        return get_schema(resource_class).matcher(ontology)
+
+    def _class_rows(self, resource_class: Type[Resource], ontology: Optional[str]):
+        """
+        Match resource_class in the graph: (variable names, result rows), rows
+        indexable by variable position - from the native matcher where there is
+        one (see `_matcher`), else from the class's SPARQL query.
+        """
+        matcher = self._matcher(resource_class, ontology)
+        if matcher is not None:
+            return [str(var) for var in matcher.variables], matcher.match(self.g, self.statistics)
+        results = self.g.query(self._class_query(resource_class, ontology))
+        return [str(var) for var in results.vars or []], results
+
+    def _subject_query(self, resource_class: Type[Resource], ontology: Optional[str], subjects: List[URIRef]):
+        """
+        The query for resource_class restricted to the ?name values subjects
+        (see `query.add_values`), like `_class_query`: for the default store,
+        the class's prepared query planned once with a VALUES block, and a copy
+        of it with the rows for each call (see `planner.with_values`); the
+        query text for other stores.
+        """
+        if store_of(self.g) == 'default':
+            key = (resource_class, ontology, 'subjects')
+            planned = self._planned_queries.get(key)
+            if planned is None:
+                planned = plan_query(resource_class.get_prepared_query(ontology=ontology), self.statistics,
+                                     values=Variable('name'))
+                self._planned_queries[key] = planned
+            return with_values(planned, Variable('name'), subjects)
+        return add_values(resource_class.get_sparql_query(ontology=ontology), 'name', subjects)
+
+    def _subject_rows(
+        self,
+        resource_class: Type[Resource],
+        ontology: Optional[str],
+        subjects: List[URIRef],
+        chunk_size: int
+    ):
+        """
+        Like `_class_rows`, for the ?name values subjects only: the native
+        matcher starts from them, and SPARQL queries take them in VALUES
+        blocks of at most chunk_size.
+        """
+        matcher = self._matcher(resource_class, ontology)
+        if matcher is not None:
+            return [str(var) for var in matcher.variables], matcher.match(self.g, self.statistics, subjects)
+        variables, rows = None, []
+        for start in range(0, len(subjects), chunk_size):
+            results = self.g.query(self._subject_query(resource_class, ontology, subjects[start:start + chunk_size]))
+            names = [str(var) for var in results.vars or []]
+            if variables is None:
+                variables = names
+            if names == variables:
+                rows.extend(results)
+            else:
+                order = [names.index(var) if var in names else None for var in variables]
+                rows.extend(_pick(row, order) for row in results)
+        return variables or [], rows
     
     # TODO: Fix this shortcut
     def _get_field_value_from_uri(
         self,
         uri: URIRef,
         field_type: Type,
-        field_obj
+        field_obj,
+        lookups: '_TermLookups' = None
     ) -> Any:
         """
         Extract a field value from a URI in the graph.
@@ -151,10 +441,14 @@ class ModelLoader:
             uri: The URI to extract value from
             field_type: Expected type of the field
             field_obj: The dataclass field object
+            lookups: Value/unit lookups to use (default: point lookups on the graph)
             
         Returns:
             The extracted value, properly typed
         """
+        if lookups is None:
+            lookups = _TermLookups(self.g)
+
         # Handle Optional types - extract the actual type
         origin = get_origin(field_type)
         if origin is not None:
@@ -168,7 +462,7 @@ class ModelLoader:
             return uri
         
         # Check for literal values
-        literal_value = self.g.value(uri, S223['hasValue'])
+        literal_value = lookups.value(uri)
         if literal_value is not None:
             # Try to convert to the expected type
             if field_type == float:
@@ -181,184 +475,123 @@ class ModelLoader:
                 return literal_value
         
         # Check for unit information
-        unit_uri = self.g.value(uri, QUDT['hasUnit'])
+        unit_uri = lookups.unit(uri)
         if unit_uri is not None:
             # Return unit information
             return unit_uri
         
         # If no specific value found, return the URI itself
         return uri
-    
-    def _instantiate_from_row(
+
+    def _row_layout(self, resource_class: Type[Resource], positions: Dict[str, int]) -> tuple:
+        """
+        Where a result row (with variable positions `positions`) binds what
+        resource_class needs: (field plan, the position of each of its fields
+        or None, late plan (see `ClassSchema.late_load_plan`), the position of
+        each of its fields, value/unit seeds (see `_value_seeds`)).
+        """
+        plan = self._field_plan(resource_class)
+        late_plan = get_schema(resource_class).late_load_plan
+        field_positions = [positions.get(entry[0]) for entry in plan]
+        late_positions = [positions.get(entry[0]) for entry in late_plan]
+        seeds = _value_seeds(plan + late_plan, positions, field_positions + late_positions)
+        return plan, field_positions, late_plan, late_positions, seeds
+
+    def _field_plan(self, resource_class: Type[Resource]) -> List[tuple]:
+        """
+        How to fill each init field of resource_class from a query binding
+        (see `ClassSchema.load_plan`), cached on the loader.
+        """
+        plan = self._field_plans.get(resource_class)
+        if plan is None:
+            plan = self._field_plans[resource_class] = get_schema(resource_class).load_plan
+        return plan
+
+    def _instantiate_related(
+        self,
+        field_type: Type[Resource],
+        related: tuple,
+        uri: URIRef,
+        instances_cache: Union[Dict[str, Any], IdentityMap],
+        lookups: '_TermLookups'
+    ) -> Optional[Resource]:
+        """
+        Instantiate the related Resource bound to a field, or None if it can't be
+        built (a `_semantic_type` class with required fields but no value).
+        """
+        # TODO: still need to generalize this. Right now just working for QuantifiableObservableProperty types with value
+        uri_key = str(uri)
+        cached = instances_cache.get(uri_key)
+        if isinstance(cached, field_type):
+            lookups.record(cached, uri_key)
+            return cached
+
+        # Classes with a _semantic_type set their fields at the class level and
+        # are named by their own counter, not by the IRI
+        has_semantic_type, init_field_names, has_required_instance_fields = related
+
+        value = lookups.value(uri)
+        if value is not None:
+            # It's a property with a value
+            related_kwargs = {}
+            if 'value' in init_field_names:
+                related_kwargs['value'] = float(value) if value else None
+            if 'unit' in init_field_names:
+                unit = lookups.unit(uri)
+                if unit:
+                    unit_class = lookups.unit_class(unit)
+                    if unit_class:
+                        related_kwargs['unit'] = unit_class
+            instance = field_type(**related_kwargs)
+        elif has_semantic_type and has_required_instance_fields:
+            # Can't create instance without required fields - skip this field
+            return None
+        else:
+            instance = field_type()
+
+        if not has_semantic_type:
+            # _name isn't an init field, so it's set after instantiation
+            instance._name = lookups.local_name(uri)
+
+        # Don't evict an instance another class already loaded for this IRI
+        instances_cache.setdefault(uri_key, instance)
+        lookups.record(instance, uri_key)
+        return instance
+
+    def _instantiate(
         self,
         resource_class: Type[Resource],
-        row: pd.Series,
-        instances_cache: Dict[str, Any] = None
+        plan: List[tuple],
+        entity_uri: URIRef,
+        field_values: List[Any],
+        instances_cache: Union[Dict[str, Any], IdentityMap],
+        lookups: '_TermLookups',
+        late_plan: List[tuple] = (),
+        late_values: List[Any] = ()
     ) -> Resource:
         """
-        Instantiate a Resource object from a DataFrame row.
-        
+        Instantiate a Resource object from the terms bound to its fields.
+
         Args:
             resource_class: The Resource class to instantiate
-            row: DataFrame row with query results
+            plan: The class's field plan (see `_field_plan`)
+            entity_uri: URI of the entity itself
+            field_values: Bound term (or None) for each plan entry, in plan order
             instances_cache: Cache of already instantiated objects to avoid duplicates
-            
-        Returns:
-            Instantiated Resource object
+            lookups: Value/unit/local-name lookups for this load
+            late_plan: The class's `ClassSchema.late_load_plan`, and
+            late_values: the bound term (or None) for each of its entries
         """
-        if instances_cache is None:
-            instances_cache = {}
-        
-        # Get the main entity URI (should be in 'name' column)
-        entity_uri = row.get('name')
-        if entity_uri is None:
-            raise ValueError("Row must contain 'name' column with entity URI")
-        
-        # Check if we've already instantiated this entity
+        # Check if we've already instantiated this entity (as this class, or a
+        # subclass of it - the cache may be shared by several classes)
         entity_key = str(entity_uri)
-        if entity_key in instances_cache:
-            return instances_cache[entity_key]
-        
-        # Prepare kwargs for instantiation
-        kwargs = {}
-        
-        # We'll set _name after instantiation if needed, since it may not be in __init__
-        # due to how the @semantic_object decorator works
-        local_name = None
-        if issubclass(resource_class, Node):
-            # Extract local name from URI for later use
-            try:
-                _, _, local_name = self.g.compute_qname(entity_uri)
-            except:
-                local_name = str(entity_uri).split('#')[-1].split('/')[-1]
-        
-        # Process each field
-        # TODO: still need to generalize this. Right now just working for QuantifiableObservableProperty types with value
-        if hasattr(resource_class, '__dataclass_fields__'):
-            for field_name, field_obj in resource_class.__dataclass_fields__.items():
-                # Skip _name field as we handled it above
-                if field_name == '_name':
-                    continue
-                
-                # Skip fields with init=False
-                if not field_obj.init:
-                    continue
-                
-                # Check if this field is in the row
-                if field_name in row.index and row[field_name] is not None:
-                    field_value_uri = row[field_name]
-                    field_type = field_obj.type
-                    
-                    # Handle Optional types
-                    origin = get_origin(field_type)
-                    if origin is not None:
-                        args = get_args(field_type)
-                        if args:
-                            field_type = args[0]
-                    
-                    # If field type is a Resource subclass, recursively instantiate
-                    if isinstance(field_type, type) and issubclass(field_type, Resource):
-                        # Check if it's a NamedNode (fixed value)
-                        if issubclass(field_type, NamedNode):
-                            # Just use the class itself
-                            kwargs[field_name] = field_type
-                        else:
-                            # Recursively instantiate the related object
-                            # For now, create a simple instance with just the URI
-                            if str(field_value_uri) in instances_cache:
-                                kwargs[field_name] = instances_cache[str(field_value_uri)]
-                            else:
-                                # Create a minimal instance
-                                try:
-                                    _, _, related_local_name = self.g.compute_qname(field_value_uri)
-                                except:
-                                    related_local_name = str(field_value_uri).split('#')[-1].split('/')[-1]
-                                
-                                # Get value if it's a property
-                                # Convert to URIRef if it's a string
-                                if isinstance(field_value_uri, str):
-                                    field_value_uri = URIRef(field_value_uri)
-                                
-                                value = self.g.value(field_value_uri, S223['hasValue'])
-                                unit = self.g.value(field_value_uri, QUDT['hasUnit'])
-                                
-                                if value is not None:
-                                    # It's a property with a value
-                                    related_kwargs = {}
-                                    
-                                    # Check if this class has a _semantic_type attribute
-                                    # This indicates fields that are set at the class level and shouldn't be passed to __init__
-                                    has_semantic_type = hasattr(field_type, '_semantic_type') and field_type._semantic_type is not None
-                                    
-                                    if has_semantic_type:
-                                        # For classes with _semantic_type, only pass instance-level fields
-                                        # Identify which fields are instance-level (init=True) vs class-level (init=False)
-                                        if hasattr(field_type, '__dataclass_fields__'):
-                                            for inst_field_name, inst_field_obj in field_type.__dataclass_fields__.items():
-                                                if inst_field_obj.init:
-                                                    # This is an instance-level field
-                                                    if inst_field_name == 'value':
-                                                        related_kwargs['value'] = float(value) if value else None
-                                                    elif inst_field_name == 'unit' and unit:
-                                                        # Find the Unit class for this unit
-                                                        try:
-                                                            _, _, unit_name = self.g.compute_qname(unit)
-                                                            # Try to import the unit class
-                                                            from . import units
-                                                            unit_class = getattr(units, unit_name, None)
-                                                            if unit_class:
-                                                                related_kwargs['unit'] = unit_class
-                                                        except:
-                                                            pass
-                                    else:
-                                        # For other Node types, include _name
-                                        related_kwargs['_name'] = related_local_name
-                                        if 'value' in [f.name for f in fields(field_type)]:
-                                            related_kwargs['value'] = float(value) if value else None
-                                        if 'unit' in [f.name for f in fields(field_type)] and unit:
-                                            # Find the Unit class for this unit
-                                            try:
-                                                _, _, unit_name = self.g.compute_qname(unit)
-                                                # Try to import the unit class
-                                                from . import units
-                                                unit_class = getattr(units, unit_name, None)
-                                                if unit_class:
-                                                    related_kwargs['unit'] = unit_class
-                                            except:
-                                                pass
-                                    
-                                    related_instance = field_type(**related_kwargs)
-                                    instances_cache[str(field_value_uri)] = related_instance
-                                    kwargs[field_name] = related_instance
-                                else:
-                                    # No value found - check if this class requires instance-level fields
-                                    has_semantic_type = hasattr(field_type, '_semantic_type') and field_type._semantic_type is not None
-                                    
-                                    # Check if there are required instance-level fields
-                                    has_required_instance_fields = False
-                                    if hasattr(field_type, '__dataclass_fields__'):
-                                        for inst_field_name, inst_field_obj in field_type.__dataclass_fields__.items():
-                                            if inst_field_obj.init and isinstance(inst_field_obj.default, _MISSING_TYPE):
-                                                has_required_instance_fields = True
-                                                break
-                                    
-                                    if has_semantic_type and has_required_instance_fields:
-                                        # Can't create instance without required fields - skip this field
-                                        pass
-                                    else:
-                                        # Just create with name
-                                        related_instance = field_type(_name=related_local_name)
-                                        instances_cache[str(field_value_uri)] = related_instance
-                                        kwargs[field_name] = related_instance
-                    else:
-                        # For primitive types, extract the value
-                        value = self._get_field_value_from_uri(
-                            field_value_uri,
-                            field_type,
-                            field_obj
-                        )
-                        kwargs[field_name] = value
-        
+        cached = instances_cache.get(entity_key)
+        if isinstance(cached, resource_class):
+            lookups.record(cached, entity_key)
+            return cached
+
+        kwargs = self._field_values(plan, field_values, instances_cache, lookups)
+
         # Instantiate the object
         try:
             instance = resource_class(**kwargs)
@@ -372,47 +605,214 @@ class ModelLoader:
                 for name, f in expected_fields.items():
                     print(f"  {name}: init={f.init}, default={f.default}, default_factory={f.default_factory}")
             raise
-        
-        # Set _name if we extracted it and the instance has this attribute
-        if local_name is not None and hasattr(instance, '_name'):
-            instance._name = local_name
-        
+
+        # We set _name after instantiation, since it's not in __init__
+        # due to how the @semantic_object decorator works
+        if issubclass(resource_class, Node) and hasattr(instance, '_name'):
+            instance._name = lookups.local_name(entity_uri)
+
+        # Optional init=False fields are set on the instance
+        for field_name, value in self._field_values(late_plan, late_values, instances_cache, lookups).items():
+            setattr(instance, field_name, value)
+
         # Cache the instance
         instances_cache[entity_key] = instance
-        
+        lookups.record(instance, entity_key)
+
         return instance
     
+    def _field_values(
+        self,
+        plan: List[tuple],
+        field_values: List[Any],
+        instances_cache: Union[Dict[str, Any], IdentityMap],
+        lookups: '_TermLookups'
+    ) -> Dict[str, Any]:
+        """Field name -> value for the plan entries with a bound term."""
+        values = {}
+        for (field_name, kind, field_type, related), bound in zip(plan, field_values):
+            if bound is None:
+                continue
+            if kind == 'named':
+                # Just use the class itself
+                values[field_name] = field_type
+            elif kind == 'related':
+                related_instance = self._instantiate_related(
+                    field_type, related, bound, instances_cache, lookups
+                )
+                if related_instance is not None:
+                    values[field_name] = related_instance
+            else:
+                # For primitive types, extract the value
+                values[field_name] = self._get_field_value_from_uri(bound, field_type, None, lookups)
+        return values
+
+    def _instantiate_from_row(
+        self,
+        resource_class: Type[Resource],
+        row: pd.Series,
+        instances_cache: Union[Dict[str, Any], IdentityMap, None] = None
+    ) -> Resource:
+        """
+        Instantiate a Resource object from a DataFrame row (see `query_class`).
+        
+        Args:
+            resource_class: The Resource class to instantiate
+            row: DataFrame row with query results
+            instances_cache: Cache of already instantiated objects to avoid
+                duplicates (default: the loader's identity map)
+            
+        Returns:
+            Instantiated Resource object
+        """
+        if instances_cache is None:
+            instances_cache = self.identity_map
+        
+        # Get the main entity URI (should be in 'name' column)
+        entity_uri = row.get('name')
+        if entity_uri is None:
+            raise ValueError("Row must contain 'name' column with entity URI")
+
+        terms = [_as_term(value) for value in row.values]
+        plan, field_positions, late_plan, late_positions, seeds = self._row_layout(
+            resource_class, {name: i for i, name in enumerate(row.index)}
+        )
+        lookups = _TermLookups(self.g)
+        lookups.bind_row(terms, seeds)
+        return self._instantiate(
+            resource_class, plan, _as_term(entity_uri), _pick(terms, field_positions),
+            instances_cache, lookups, late_plan, _pick(terms, late_positions)
+        )
+    
     def load_instances(
         self,
         resource_class: Type[Resource],
-        ontology: Optional[str] = None
+        ontology: Optional[str] = None,
+        subjects: Optional[Iterable[Union[str, URIRef]]] = None,
+        chunk_size: int = 500
     ) -> List[Resource]:
         """
         Load instances of a Resource class from the graph.
+
+        Consumes the SPARQL result rows directly (no DataFrame), and resolves
+        values/units for all rows with one pass over the graph instead of a
+        lookup per row. Nodes this loader has already instantiated (and that are
+        still referenced) are returned as the same objects - see `identity_map`.
+
+        With subjects, only those entities are matched (the ones that aren't
+        instances of the class are left out): the query gets them in VALUES
+        blocks of chunk_size IRIs, so the cost follows the number of subjects
+        rather than the size of the model.
         
         Args:
             resource_class: The Resource class to load instances for
             ontology: Optional ontology identifier (e.g., 's223') for special handling
+            subjects: Only load these entities (IRIs)
+            chunk_size: Maximum subjects per query
             
         Returns:
             List of instantiated Resource objects
         """
+        lookups = _TermLookups(self.g, bulk=subjects is None)
+        if subjects is None:
+            return self._load_rows(resource_class, ontology, self.identity_map, lookups)
+        subjects = list(dict.fromkeys(URIRef(str(subject)) for subject in subjects))
+        variables, results = self._subject_rows(resource_class, ontology, subjects, chunk_size)
+        positions = {var: i for i, var in enumerate(variables)}
+        return self._instantiate_rows(resource_class, positions, results, self.identity_map, lookups)
+
+    def load_frame(
+        self,
+        resource_class: Type[Resource],
+        ontology: Optional[str] = None
+    ) -> ResourceFrame:
+        """
+        Load instances of a Resource class as a columnar ResourceFrame (see
+        frame.py): one row per entity, filled from the query results without
+        building any objects.
+
+        Args:
+            resource_class: The Resource class to load instances for
+            ontology: Optional ontology identifier (e.g., 's223') for special handling
+
+        Returns:
+            ResourceFrame with a row per entity
+        """
+        variables, results = self._class_rows(resource_class, ontology)
+        positions = {var: i for i, var in enumerate(variables)}
+        name_position = positions.get('name')
+        plan, field_positions, _, _, seeds = self._row_layout(resource_class, positions)
+        lookups = _TermLookups(self.g, bulk=True)
+        builder = FrameBuilder(resource_class)
+
+        for row in results:
+            entity_uri = row[name_position] if name_position is not None else None
+            if entity_uri is None or str(entity_uri) in builder.rows:
+                continue
+            lookups.bind_row(row, seeds)
+            values = {}
+            for (field_name, kind, field_type, related), position in zip(plan, field_positions):
+                bound = row[position] if position is not None else None
+                if bound is None:
+                    continue
+                if kind == 'named':
+                    values[field_name] = builder.code(bound)
+                elif kind == 'related':
+                    values[field_name] = builder.code(bound, lookups.local_name(bound))
+                    value = lookups.value(bound)
+                    if value is not None:
+                        values[f'{field_name}.value'] = as_number(value)
+                        values[f'{field_name}.unit'] = builder.code(lookups.unit(bound))
+                elif builder.kinds[field_name] == 'float':
+                    values[field_name] = as_number(bound if isinstance(bound, Literal) else lookups.value(bound))
+                else:
+                    values[field_name] = self._get_field_value_from_uri(bound, field_type, None, lookups)
+            builder.add_row(entity_uri, lookups.local_name(entity_uri), values)
+        return builder.build()
+
+    def _load_rows(
+        self,
+        resource_class: Type[Resource],
+        ontology: Optional[str],
+        instances_cache: Union[Dict[str, Any], IdentityMap],
+        lookups: '_TermLookups'
+    ) -> List[Resource]:
+        """Query for resource_class and instantiate one object per result row."""
         # Query for instances
-        df = self.query_class(resource_class, ontology=ontology)
-        
-        if df.empty:
-            return []
-        
+        variables, results = self._class_rows(resource_class, ontology)
+        positions = {var: i for i, var in enumerate(variables)}
+        return self._instantiate_rows(resource_class, positions, results, instances_cache, lookups)
+
+    def _instantiate_rows(
+        self,
+        resource_class: Type[Resource],
+        positions: Dict[str, int],
+        results: Iterable,
+        instances_cache: Union[Dict[str, Any], IdentityMap],
+        lookups: '_TermLookups'
+    ) -> List[Resource]:
+        """One resource_class object per result row, its variables at positions."""
+        name_position = positions.get('name')
+        plan, field_positions, late_plan, late_positions, seeds = self._row_layout(resource_class, positions)
+
         # Instantiate objects from results
         instances = []
-        instances_cache = {}
-        
-        for _, row in df.iterrows():
+
+        for row in results:
             try:
-                instance = self._instantiate_from_row(
+                entity_uri = row[name_position] if name_position is not None else None
+                if entity_uri is None:
+                    raise ValueError("Row must contain 'name' column with entity URI")
+                lookups.bind_row(row, seeds)
+                instance = self._instantiate(
                     resource_class,
-                    row,
-                    instances_cache
+                    plan,
+                    entity_uri,
+                    _pick(row, field_positions),
+                    instances_cache,
+                    lookups,
+                    late_plan,
+                    _pick(row, late_positions)
                 )
                 instances.append(instance)
             except Exception as e:
@@ -420,31 +820,190 @@ class ModelLoader:
                 continue
         
         return instances
+
+    def _fused_query(self, resource_classes: Tuple[Type[Resource], ...], ontology: Optional[str]):
+        """
+        The fused query for resource_classes (see
+        `SparqlQueryBuilder.get_fused_query`), in the form `_class_query`
+        gives a single class's: for the default store, planned and cached,
+        built from the classes' prepared queries (see `planner.union_query`);
+        text for others.
+        """
+        if store_of(self.g) == 'default':
+            key = (resource_classes, ontology)
+            planned = self._planned_queries.get(key)
+            if planned is None:
+                fused = union_query([resource_class.get_prepared_query(ontology=ontology)
+                                     for resource_class in resource_classes], Variable(CLASS_VARIABLE))
+                planned = plan_query(fused, self.statistics)
+                self._planned_queries[key] = planned
+            return planned
+        return SparqlQueryBuilder.get_fused_query(resource_classes, ontology=ontology)
+
+    def _fused_rows(self, resource_classes: Tuple[Type[Resource], ...], ontology: Optional[str]):
+        """
+        Match resource_classes with one fused query: (variable names, a list
+        of result rows per class, in resource_classes order).
+        """
+        results = self.g.query(self._fused_query(resource_classes, ontology))
+        variables = [str(var) for var in results.vars or []]
+        class_position = variables.index(CLASS_VARIABLE)
+        rows = [[] for _ in resource_classes]
+        for row in results:
+            rows[int(row[class_position])].append(row)
+        return variables, rows
+
+    def _index_types(self) -> Dict[URIRef, set]:
+        """Subjects of the graph by rdf:type, from a single pass over the graph."""
+        type_index = {}
+        for subject, type_iri in self.g.subject_objects(RDF.type):
+            type_index.setdefault(type_iri, set()).add(subject)
+        return type_index
+
+    def _dependency_order(self, class_dict: Dict[str, Type[Resource]]) -> List[str]:
+        """
+        Result keys ordered so that a class is loaded after the classes whose
+        instances can fill its fields (e.g. properties before the sensors that
+        observe them). Ties and cycles keep class_dict's order; cycles are
+        resolved afterwards by `_resolve_cross_references`.
+        """
+        keys = list(class_dict)
+        depends_on = {}
+        for key in keys:
+            field_types = [entry[2] for entry in self._field_plan(class_dict[key]) if entry[1] == 'related']
+            depends_on[key] = [
+                other for other in keys
+                if other != key and any(issubclass(class_dict[other], t) for t in field_types)
+            ]
+
+        ordered, visiting, done = [], set(), set()
+
+        def visit(key):
+            if key in done or key in visiting:
+                return
+            visiting.add(key)
+            for other in depends_on[key]:
+                visit(other)
+            visiting.discard(key)
+            done.add(key)
+            ordered.append(key)
+
+        for key in keys:
+            visit(key)
+        return ordered
+
+    def _resolve_cross_references(
+        self,
+        results: Dict[str, List[Resource]],
+        class_dict: Dict[str, Type[Resource]],
+        lookups: '_TermLookups'
+    ):
+        """
+        Point every Resource-valued field of the loaded objects at the loaded
+        object for the same IRI, where one exists and fits the field's type -
+        covers references made before the referenced class was loaded.
+        """
+        def iri_of(instance):
+            iri = lookups.iri_of(instance)
+            return iri if iri is not None else self.identity_map.iri_of(instance)
+
+        loaded_by_iri = {}
+        for instances in results.values():
+            for instance in instances:
+                iri = iri_of(instance)
+                if iri is not None:
+                    loaded_by_iri.setdefault(iri, instance)
+
+        for result_key, instances in results.items():
+            plan = self._field_plan(class_dict[result_key])
+            for instance in instances:
+                for field_name, kind, field_type, _ in plan:
+                    if kind != 'related':
+                        continue
+                    current = getattr(instance, field_name, None)
+                    if current is None:
+                        continue
+                    target = loaded_by_iri.get(iri_of(current))
+                    if target is not None and target is not current and isinstance(target, field_type):
+                        setattr(instance, field_name, target)
     
+    def _load_fused(
+        self,
+        class_dict: Dict[str, Type[Resource]],
+        ontology: Optional[str],
+        type_index: Dict[URIRef, set]
+    ) -> Dict[str, tuple]:
+        """
+        Result key -> (variable positions, result rows) for the classes of
+        class_dict with instances and no native matcher, from one fused
+        query. Empty if that query can't be built or run; the classes are
+        then queried one by one.
+        """
+        keys = [key for key, resource_class in class_dict.items()
+                if type_index.get(resource_class._get_iri()) and self._matcher(resource_class, ontology) is None]
+        resource_classes = tuple(dict.fromkeys(class_dict[key] for key in keys))
+        if len(resource_classes) < 2:
+            return {}
+        try:
+            variables, rows = self._fused_rows(resource_classes, ontology)
+        except Exception as e:
+            print(f"Warning: Could not run the fused query, querying classes one by one: {e}")
+            return {}
+        positions = {var: i for i, var in enumerate(variables)}
+        by_class = dict(zip(resource_classes, rows))
+        return {key: (positions, by_class[class_dict[key]]) for key in keys}
+
     def load_multiple_classes(
         self,
         class_dict: Dict[str, Type[Resource]],
-        ontology: Optional[str] = None
+        ontology: Optional[str] = None,
+        fused: bool = False
     ) -> Dict[str, List[Resource]]:
         """
-        Load instances of multiple Resource classes.
+        Load instances of multiple Resource classes in a single pass.
+
+        The graph is indexed by rdf:type once (classes with no instances aren't
+        queried at all), and every class shares the loader's identity map and one
+        set of value/unit lookups, so an entity reached from several classes is
+        instantiated once. Cross-references between loaded objects are resolved,
+        e.g. a sensor's `observes` is the same object the property class loaded.
+
+        With fused=True, the classes that would each run a SPARQL query run one
+        query together instead (see `SparqlQueryBuilder.get_fused_query`), its
+        rows split by class - one round trip, which pays off on stores with a
+        per-query cost (e.g. Oxigraph). Classes the native matcher handles are
+        matched as before.
         
         Args:
             class_dict: Dictionary mapping result keys to Resource classes
                        e.g., {'spaces': Space, 'windows': Window}
             ontology: Optional ontology identifier (e.g., 's223') for special handling
+            fused: Query the classes without a native matcher in one query
             
         Returns:
             Dictionary with keys from class_dict and lists of instances as values
         """
+        type_index = self._index_types()
+        instances_cache = self.identity_map
+        lookups = _TermLookups(self.g, bulk=True)
         results = {}
-        
-        for result_key, resource_class in class_dict.items():
+        fused_rows = self._load_fused(class_dict, ontology, type_index) if fused else {}
+
+        for result_key in self._dependency_order(class_dict):
+            resource_class = class_dict[result_key]
             try:
-                instances = self.load_instances(resource_class, ontology=ontology)
+                if not type_index.get(resource_class._get_iri()):
+                    results[result_key] = []
+                    continue
+                if result_key in fused_rows:
+                    positions, rows = fused_rows[result_key]
+                    instances = self._instantiate_rows(resource_class, positions, rows, instances_cache, lookups)
+                else:
+                    instances = self._load_rows(resource_class, ontology, instances_cache, lookups)
                 results[result_key] = instances
             except Exception as e:
                 print(f"Warning: Could not load instances for {resource_class.__name__}: {e}")
                 results[result_key] = []
-        
-        return results
+
+        self._resolve_cross_references(results, class_dict, lookups)
+        return {result_key: results[result_key] for result_key in class_dict}
@@ -0,0 +1,167 @@
+"""
+Naming - Allocate `_name`s for Nodes constructed without one
+
+`Node.__post_init__` asks the current allocator for a local name whenever an
+instance isn't given one. Allocators are pluggable:
+
+  CounterAllocator: `Space_1`, `Space_2`, ... - one counter per class name
+                    (the default, as before)
+  WorkerAllocator:  the same, prefixed with the process id, so models built in
+                    parallel worker processes never reuse each other's names
+  UUIDAllocator:    `Space_<32 hex digits>` - random, or deterministic
+                    (UUID5 of a seed, the class and a sequence number) when
+                    given a seed
+
+The current allocator is held in a context variable. `naming_session()` swaps
+in a fresh one for a block - each build gets its own counters, which are
+dropped afterwards - and only affects the current thread (or asyncio task), so
+concurrent builds never share state or need a lock.
+
+Example:
+    with naming_session(UUIDAllocator(seed='building-7.ttl')):
+        model = build_model(...)
+"""
+
+import itertools
+import os
+import uuid
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional
+
+
+class NameAllocator(ABC):
+    """Base class for allocators: `allocate(cls)` returns a new local name for
+    an instance of `cls`."""
+
+    @abstractmethod
+    def allocate(self, cls) -> str:
+        """A new local name for an instance of `cls`."""
+
+    def allocate_many(self, cls, count: int) -> List[str]:
+        """`count` new local names for instances of `cls`, in order."""
+        return [self.allocate(cls) for _ in range(count)]
+
+
+class CounterAllocator(NameAllocator):
+    """
+    `{prefix}{ClassName}_{n}`, numbered from 1 per class name.
+
+    Each counter is an `itertools.count`, whose `next()` is atomic, so threads
+    sharing one allocator never draw the same number without taking a lock.
+    """
+
+    def __init__(self, prefix: str = ''):
+        self.prefix = prefix
+        self._counters = {}
+
+    def _next(self, class_name: str) -> int:
+        counter = self._counters.get(class_name)
+        if counter is None:
+            counter = self._counters.setdefault(class_name, itertools.count(1))
+        return next(counter)
+
+    def _prefix(self) -> str:
+        return self.prefix
+
+    def allocate(self, cls) -> str:
+        class_name = cls.__name__
+        return f"{self._prefix()}{class_name}_{self._next(class_name)}"
+
+    def allocate_many(self, cls, count: int) -> List[str]:
+        class_name = cls.__name__
+        prefix = f"{self._prefix()}{class_name}_"
+        return [f"{prefix}{self._next(class_name)}" for _ in range(count)]
+
+    def reset(self):
+        """Start every class's numbering again from 1."""
+        self._counters.clear()
+
+
+class WorkerAllocator(CounterAllocator):
+    """
+    A CounterAllocator whose prefix identifies the process: `w{pid}_Space_1`.
+
+    The prefix is read at allocation time, so an allocator inherited by a
+    forked worker switches to the worker's own prefix.
+    """
+
+    def _prefix(self) -> str:
+        return f"{self.prefix}w{os.getpid()}_"
+
+
+class UUIDAllocator(CounterAllocator):
+    """
+    `{prefix}{ClassName}_{uuid hex}`.
+
+    Without a seed the UUIDs are random (uuid4). With a seed they are UUID5s of
+    the seed, class name and per-class sequence number, so rebuilding the same
+    model with the same seed reproduces its names, while builds with different
+    seeds (e.g. the source file of each building) never collide.
+    """
+
+    def __init__(self, seed: Optional[str] = None, prefix: str = ''):
+        super().__init__(prefix)
+        self.seed = seed
+
+    def allocate(self, cls) -> str:
+        class_name = cls.__name__
+        if self.seed is None:
+            token = uuid.uuid4()
+        else:
+            token = uuid.uuid5(uuid.NAMESPACE_URL, f"{self.seed}/{class_name}/{self._next(class_name)}")
+        return f"{self._prefix()}{class_name}_{token.hex}"
+
+    allocate_many = NameAllocator.allocate_many
+
+
+_default_allocator: NameAllocator = CounterAllocator()
+_session_allocator: ContextVar[Optional[NameAllocator]] = ContextVar('semantic_objects_name_allocator',
+                                                                     default=None)
+
+
+def get_allocator() -> NameAllocator:
+    """The allocator in effect: the innermost `naming_session`'s, or the default."""
+    allocator = _session_allocator.get()
+    return _default_allocator if allocator is None else allocator
+
+
+def set_default_allocator(allocator: NameAllocator) -> NameAllocator:
+    """Replace the process-wide default allocator; returns the previous one."""
+    global _default_allocator
+    previous, _default_allocator = _default_allocator, allocator
+    return previous
+
+
+def allocate_name(cls) -> str:
+    """A new local name for an instance of `cls` from the current allocator."""
+    # get_allocator(), inlined: this runs for most Node constructions
+    allocator = _session_allocator.get()
+    if allocator is None:
+        allocator = _default_allocator
+    return allocator.allocate(cls)
+
+
+def allocate_names(cls, count: int) -> List[str]:
+    """`count` new local names for instances of `cls` (see `bulk_create`)."""
+    return get_allocator().allocate_many(cls, count)
+
+
+@contextmanager
+def naming_session(allocator: Optional[NameAllocator] = None) -> Iterator[NameAllocator]:
+    """
+    Name Nodes built inside the block with `allocator` (default: a fresh
+    CounterAllocator, so numbering starts again from 1).
+
+    Scoped to the current thread or asyncio task; threads started inside the
+    block don't inherit it unless run in a copy of the context
+    (`contextvars.copy_context().run`).
+    """
+    if allocator is None:
+        allocator = CounterAllocator()
+    token = _session_allocator.set(allocator)
+    try:
+        yield allocator
+    finally:
+        _session_allocator.reset(token)
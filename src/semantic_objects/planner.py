@@ -0,0 +1,351 @@
+"""
+Planner - Order a query's triple patterns by their selectivity in a graph
+
+rdflib evaluates a basic graph pattern as nested loops, in an order it picks
+only by how many terms of each pattern are constants or already bound - the
+order the query text lists them in (SparqlQueryBuilder's, which follows the
+template graph) only breaks ties. For a generated class query that often
+starts a join from the wrong side: in
+
+    ?area s223:hasQuantityKind quantitykind:Area .
+    ?area rdf:type s223:QuantifiableObservableProperty .
+    ?name rdf:type s223:Space .
+    ?name s223:hasProperty ?area .
+
+every area is paired with every space before `hasProperty` is checked, so
+loading N spaces takes N^2 steps. `plan_query` orders each pattern list
+greedily by estimated cardinality from `GraphStatistics`: it starts from the
+rarest pattern and then repeatedly takes the connected pattern with the
+smallest fan-out per solution so far (here `?name s223:hasProperty ?area`
+right after the areas), which keeps the evaluation linear. Since rdflib would
+re-sort a reordered pattern list, the planned order is split into BGPs rdflib
+keeps as they are, chained with lazy joins (each evaluated with the variables
+of the ones before it bound) in the prepared query's algebra.
+
+GraphStatistics are counted from the graph on demand - per predicate (triples,
+distinct subjects and objects), per class (instances) and per fixed
+predicate-object pair - and memoized, so they cost a few index scans per
+predicate a query uses. ModelLoader keeps one per graph (`loader.statistics`)
+and plans each class's query once, from a copy of its prepared query. They're a snapshot: call
+`loader.refresh_statistics()` after changing the graph a lot.
+"""
+
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from rdflib import Graph, RDF
+from rdflib.term import BNode, Variable
+
+
+class GraphStatistics:
+    """Cardinality estimates for triple patterns over one graph."""
+
+    def __init__(self, graph: Graph):
+        self.graph = graph
+        # predicate -> (triples, distinct subjects, distinct objects)
+        self._predicates: Dict = {}
+        # (predicate, object) -> triples; rdf:type entries are class sizes
+        self._pairs: Dict[Tuple, int] = {}
+        self._triples: Optional[int] = None
+
+    def triples(self) -> int:
+        """Triples in the graph."""
+        if self._triples is None:
+            self._triples = len(self.graph)
+        return self._triples
+
+    def predicate(self, predicate) -> Tuple[int, int, int]:
+        """(triples, distinct subjects, distinct objects) for predicate."""
+        stats = self._predicates.get(predicate)
+        if stats is None:
+            subjects, objects, count = set(), set(), 0
+            for s, _, o in self.graph.triples((None, predicate, None)):
+                subjects.add(s)
+                objects.add(o)
+                count += 1
+            stats = self._predicates[predicate] = (count, len(subjects), len(objects))
+        return stats
+
+    def pair(self, predicate, obj) -> int:
+        """Triples with this predicate and object (the size of a class, for rdf:type)."""
+        key = (predicate, obj)
+        count = self._pairs.get(key)
+        if count is None:
+            count = self._pairs[key] = sum(1 for _ in self.graph.triples((None, predicate, obj)))
+        return count
+
+    def class_size(self, cls_iri) -> int:
+        """Instances of the class cls_iri (by rdf:type)."""
+        return self.pair(RDF.type, cls_iri)
+
+    def estimate(self, triple, bound=frozenset()) -> float:
+        """
+        Estimated solutions of the pattern `triple` per solution of the
+        patterns before it, given the variables already `bound`.
+        """
+        s, p, o = triple
+        s_bound = not _is_variable(s) or s in bound
+        o_bound = not _is_variable(o) or o in bound
+        if _is_variable(p) and p not in bound:
+            count = self.triples()
+            return 1.0 if s_bound and o_bound else float(count)
+        count, subjects, objects = self.predicate(p)
+        if not _is_variable(o):
+            count = self.pair(p, o)
+            objects = 1 if count else 0
+        if count == 0:
+            return 0.0
+        if s_bound and o_bound:
+            # A membership check: at most one solution each
+            return min(1.0, count / max(subjects, 1) / max(objects, 1))
+        if s_bound:
+            return count / max(subjects, 1)
+        if o_bound:
+            return count / max(objects, 1)
+        return float(count)
+
+
+def _is_variable(term) -> bool:
+    return isinstance(term, (Variable, BNode))
+
+
+def order_triples(triples: Sequence[Tuple], statistics: GraphStatistics, bound=frozenset()) -> List[Tuple]:
+    """
+    triples in evaluation order: greedily the pattern with the fewest
+    estimated solutions next, among those sharing a variable with the ones
+    already placed (or with no variables at all) while there are any, so no
+    join turns into a cross product. Ties keep the given order. `bound` are
+    variables bound before the triples are evaluated (e.g. by VALUES).
+    """
+    remaining = list(triples)
+    ordered = []
+    bound = set(bound)
+    while remaining:
+        connected = [t for t in remaining
+                     if not bound or any(term in bound for term in t if _is_variable(term))
+                     or not any(_is_variable(term) for term in t)]
+        candidates = connected or remaining
+        best = min(candidates, key=lambda t: statistics.estimate(t, bound))
+        remaining.remove(best)
+        ordered.append(best)
+        bound.update(term for term in best if _is_variable(term))
+    return ordered
+
+
+def _segments(ordered: List[Tuple], bound=frozenset()) -> List[List[Tuple]]:
+    """
+    ordered split into runs that rdflib evaluates in the given order.
+
+    rdflib re-sorts a BGP's triples when evaluating it (stably, by how many
+    of their terms are unbound at that point), so a run may only continue
+    while that count doesn't drop; each run is then evaluated with the
+    variables of the runs before it (and `bound`) bound (see `_chain`).
+    """
+    segments = []
+    bound = set(bound)
+    segment, previous, segment_bound = [], -1, set(bound)
+    for triple in ordered:
+        unbound = sum(1 for term in triple if _is_variable(term) and term not in segment_bound)
+        if segment and unbound < previous:
+            segments.append(segment)
+            segment_bound = set(bound)
+            segment = []
+            unbound = sum(1 for term in triple if _is_variable(term) and term not in segment_bound)
+        segment.append(triple)
+        previous = unbound
+        bound.update(term for term in triple if _is_variable(term))
+    if segment:
+        segments.append(segment)
+    return segments
+
+
+def _chain(bgp, statistics: GraphStatistics, bound=frozenset()):
+    """A BGP's triples as BGPs of `_segments`, nested in lazy joins."""
+    from rdflib.plugins.sparql.parserutils import CompValue
+
+    def part(triples):
+        return CompValue('BGP', triples=triples,
+                         _vars={term for t in triples for term in t if isinstance(term, Variable)})
+
+    segments = _segments(order_triples(bgp['triples'], statistics, bound), bound)
+    planned = part(segments[0] if segments else [])
+    for segment in segments[1:]:
+        following = part(segment)
+        # lazy: the right side is evaluated once per solution of the left,
+        # with its variables bound
+        planned = CompValue('Join', p1=planned, p2=following, lazy=True,
+                            _vars=planned['_vars'] | following['_vars'])
+    return planned
+
+
+def _plan_algebra(node, statistics: GraphStatistics, bound=frozenset()):
+    """
+    node with every BGP under it planned (see `_chain`). The right side of a
+    lazy join on VALUES is planned with the VALUES variables bound, as
+    rdflib evaluates it once per VALUES row.
+    """
+    from rdflib.plugins.sparql.parserutils import CompValue
+
+    if isinstance(node, CompValue):
+        if node.name == 'BGP':
+            return _chain(node, statistics, bound)
+        if node.name == 'Join' and node.get('lazy') and _values(node['p1']) is not None:
+            values = _values(node['p1'])
+            variables = {var for row in values['res'] for var in row} | set(values['_vars'] or ())
+            node['p2'] = _plan_algebra(node['p2'], statistics, bound | variables)
+            return node
+        for key, value in list(node.items()):
+            node[key] = _plan_algebra(value, statistics, bound)
+    elif isinstance(node, list):
+        node[:] = [_plan_algebra(value, statistics, bound) for value in node]
+    return node
+
+
+def _values(node):
+    """The `values` node of a VALUES block's algebra (ToMultiSet), else None."""
+    from rdflib.plugins.sparql.parserutils import CompValue
+
+    if isinstance(node, CompValue) and node.name == 'ToMultiSet' and getattr(node['p'], 'name', None) == 'values':
+        return node['p']
+    return None
+
+
+def with_values(prepared, variable: Variable, terms: Sequence):
+    """
+    A query from `plan_query` with the rows of its (first) VALUES block
+    replaced by one row per term of terms for variable - to run one prepared
+    and planned query for any set of values. Only the nodes on the way to the
+    VALUES block are copied; prepared is left as it is, so queries for other
+    values (still being evaluated, or in other threads) aren't affected.
+
+    Raises:
+        ValueError: if the query has no VALUES block
+    """
+    from rdflib.plugins.sparql.sparql import Query
+
+    algebra = _replace_values(prepared.algebra, [{variable: term} for term in terms])
+    if algebra is None:
+        raise ValueError("the query has no VALUES block")
+    return Query(prepared.prologue, algebra)
+
+
+def _replace_values(node, res):
+    """A copy of node with the rows of its first VALUES block set to res, sharing
+    everything off the path to it; None if it has no VALUES block."""
+    from rdflib.plugins.sparql.parserutils import CompValue
+
+    values = _values(node)
+    if values is not None:
+        clone = _shallow_copy(node)
+        OrderedDict.__setitem__(clone, 'p', _shallow_copy(values))
+        OrderedDict.__setitem__(clone['p'], 'res', res)
+        return clone
+    if isinstance(node, CompValue):
+        for key, child in OrderedDict.items(node):
+            replaced = _replace_values(child, res)
+            if replaced is not None:
+                clone = _shallow_copy(node)
+                OrderedDict.__setitem__(clone, key, replaced)
+                return clone
+    elif isinstance(node, list):
+        for index, child in enumerate(node):
+            replaced = _replace_values(child, res)
+            if replaced is not None:
+                return node[:index] + [replaced] + node[index + 1:]
+    return None
+
+
+def plan_query(query, statistics: GraphStatistics, values: Optional[Variable] = None):
+    """
+    `query` prepared for rdflib (see `rdflib.plugins.sparql.prepareQuery`),
+    with the triples of each basic graph pattern evaluated in the order
+    `order_triples` picks for the statistics' graph. Results are the same;
+    only the order of the result rows can differ.
+
+    Args:
+        query: Query text, or an already prepared query (e.g.
+            `Resource.get_prepared_query()`), which is planned as a copy and
+            left as it is
+        statistics: Statistics of the graph the query will run on
+        values: Join the query's pattern with a VALUES block for this
+            variable, planned with the variable bound; its rows are set
+            with `with_values` (none to begin with)
+    """
+    from rdflib.plugins.sparql import prepareQuery
+    from rdflib.plugins.sparql.parserutils import CompValue
+    from rdflib.plugins.sparql.sparql import Query
+
+    if isinstance(query, str):
+        prepared = prepareQuery(query)
+    else:
+        prepared = Query(query.prologue, _copy_algebra(query.algebra))
+    if values is not None:
+        project = _project(prepared.algebra)
+        rows = CompValue('ToMultiSet', p=CompValue('values', res=[], _vars={values}), _vars={values})
+        project['p'] = CompValue('Join', p1=rows, p2=project['p'], lazy=True,
+                                 _vars=project['p']['_vars'] | {values})
+    prepared.algebra = _plan_algebra(prepared.algebra, statistics)
+    return prepared
+
+
+def union_query(queries: Sequence, variable: Variable):
+    """
+    One prepared query matching the patterns of the prepared `SELECT DISTINCT
+    *` queries as branches of a UNION, each binding its position in queries
+    to variable - what parsing `SparqlQueryBuilder.get_fused_query`'s text
+    gives, without parsing anything again. Shares the queries' algebra; plan
+    it with `plan_query`, which copies it.
+    """
+    from rdflib import Literal
+    from rdflib.plugins.sparql.parserutils import CompValue
+    from rdflib.plugins.sparql.sparql import Query
+
+    union = None
+    for index, query in enumerate(queries):
+        pattern = _project(query.algebra)['p']
+        branch = CompValue('Extend', p=pattern, expr=Literal(index), var=variable,
+                           _vars=pattern['_vars'] | {variable})
+        union = branch if union is None else CompValue('Union', p1=union, p2=branch,
+                                                       _vars=union['_vars'] | branch['_vars'])
+    variables = list(union['_vars'])
+    project = CompValue('Project', p=union, PV=variables, _vars=set(variables))
+    algebra = CompValue('SelectQuery', p=CompValue('Distinct', p=project, _vars=set(variables)),
+                        datasetClause=None, PV=variables, _vars=set(variables))
+    return Query(queries[0].prologue, algebra)
+
+
+def _project(algebra):
+    """The Project node of a SELECT query's algebra (under Distinct, Slice, ...)."""
+    node = algebra
+    while node.name != 'Project':
+        node = node['p']
+    return node
+
+
+def _shallow_copy(node):
+    """A copy of an algebra node sharing its children."""
+    from types import MethodType
+
+    clone = type(node).__new__(type(node))
+    OrderedDict.__init__(clone)
+    clone.__dict__.update(node.__dict__)
+    if getattr(node, '_evalfn', None) is not None:
+        # Expr: its evaluation function is bound to the node
+        clone._evalfn = MethodType(node._evalfn.__func__, clone)
+    for key, value in OrderedDict.items(node):
+        OrderedDict.__setitem__(clone, key, value)
+    return clone
+
+
+def _copy_algebra(node):
+    """A copy of a query's algebra to plan, sharing only its terms."""
+    from rdflib.plugins.sparql.parserutils import CompValue
+
+    if isinstance(node, CompValue):
+        clone = _shallow_copy(node)
+        for key, value in OrderedDict.items(node):
+            OrderedDict.__setitem__(clone, key, _copy_algebra(value))
+        return clone
+    if isinstance(node, list):
+        return [_copy_algebra(value) for value in node]
+    return node
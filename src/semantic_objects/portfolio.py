@@ -0,0 +1,206 @@
+"""
+Portfolio Loader - Load many building models in parallel
+
+Fans `ModelLoader.load_multiple_classes` out over a process pool, one model
+file (and so one graph) per task, and returns plain, picklable data per
+building rather than live Resource objects.
+
+Example:
+    results = load_portfolio(sorted(Path('models').glob('*.ttl')),
+                             [entities.DomainSpace, entities.Window],
+                             ontology='s223', progress=print_progress)
+    for result in results:
+        if result.ok:
+            print(result.path, len(result.instances['DomainSpace']))
+"""
+
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Type, Union
+
+from rdflib import BNode, Literal, URIRef
+
+from .core import Resource
+from .graph_cache import GraphCache
+from .model_loader import ModelLoader
+from .naming import naming_session
+
+
+@dataclass
+class BuildingResult:
+    """What was loaded from one model file, as plain data."""
+    path: str
+    # result key -> one dict per loaded instance (see `to_plain_data`)
+    instances: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+    # Formatted traceback if the file couldn't be loaded
+    error: Optional[str] = None
+    # Seconds spent parsing and loading the file
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def to_plain_data(value: Any, _seen: Optional[set] = None) -> Any:
+    """
+    Convert a loaded Resource (and anything it references) to plain data.
+
+    Resources become dicts with '_type' (class name) and '_name' plus one entry
+    per dataclass field; classes used as values (e.g. units, quantity kinds)
+    become their IRI; rdflib terms become Python values/strings. A Resource
+    seen again further down its own references becomes {'_ref': name}.
+    """
+    if _seen is None:
+        _seen = set()
+
+    if isinstance(value, type):
+        return str(value._get_iri()) if hasattr(value, '_get_iri') else value.__name__
+    if isinstance(value, Resource):
+        if id(value) in _seen:
+            return {'_ref': getattr(value, '_name', None)}
+        _seen.add(id(value))
+        data = {'_type': type(value).__name__, '_name': getattr(value, '_name', None)}
+        for field_name in getattr(value, '__dataclass_fields__', {}):
+            data[field_name] = to_plain_data(getattr(value, field_name, None), _seen)
+        _seen.discard(id(value))
+        return data
+    if isinstance(value, Literal):
+        return value.toPython()
+    if isinstance(value, (URIRef, BNode)):
+        return str(value)
+    if isinstance(value, (list, tuple, set)):
+        return [to_plain_data(item, _seen) for item in value]
+    return value
+
+
+def _load_building(
+    path: str,
+    class_dict: Dict[str, Type[Resource]],
+    ontology: Optional[str],
+    namespace: Optional[str],
+    cache,
+    store: Optional[str]
+) -> BuildingResult:
+    """Worker: load one model file. Never raises - errors go in the result."""
+    start = time.perf_counter()
+    try:
+        # Fresh name counters per file, so generated names don't depend on
+        # which files the worker loaded before
+        with naming_session():
+            loader = ModelLoader(source=path, namespace=namespace, cache=cache, store=store)
+            loaded = loader.load_multiple_classes(class_dict, ontology=ontology)
+            instances = {
+                result_key: [to_plain_data(instance) for instance in resources]
+                for result_key, resources in loaded.items()
+            }
+        return BuildingResult(path=path, instances=instances, elapsed=time.perf_counter() - start)
+    except Exception:
+        return BuildingResult(path=path, error=traceback.format_exc(), elapsed=time.perf_counter() - start)
+
+
+def load_portfolio(
+    paths: List[Union[str, Path]],
+    classes: Union[List[Type[Resource]], Dict[str, Type[Resource]]],
+    ontology: Optional[str] = None,
+    namespace: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    max_tasks_per_child: Optional[int] = 10,
+    progress: Optional[Callable[[int, int, BuildingResult], None]] = None,
+    cache: Union[bool, str, Path, GraphCache, None] = None,
+    store: Optional[str] = None
+) -> List[BuildingResult]:
+    """
+    Load the same Resource classes from many model files in parallel.
+
+    Each file is parsed and loaded in a worker process with its own graph;
+    a file that fails to load, or kills its worker, only fails its own
+    result. Workers are replaced after about `max_tasks_per_child` files each
+    so memory held by rdflib/Python between files can't grow without bound.
+
+    Classes are sent to the workers by reference, so they must be importable
+    (defined at module level), like anything else sent to a process pool.
+
+    Args:
+        paths: Model files to load
+        classes: Resource classes to load from each file, as a list (results
+            keyed by class name) or a dict of result key -> class, as for
+            `ModelLoader.load_multiple_classes`
+        ontology: Optional ontology identifier (e.g., 's223') for special handling
+        namespace: Namespace for the models (default: urn:model#)
+        max_workers: Worker processes (default: os.cpu_count())
+        max_tasks_per_child: Files each worker loads before the pool is
+            replaced (None: never)
+        progress: Called as progress(done, total, result) as each file finishes
+        cache: Parsed-graph cache for the model files, as for `ModelLoader`
+        store: Store to parse each model file into, as for `ModelLoader`
+
+    Returns:
+        One BuildingResult per path, in the order given
+    """
+    if isinstance(classes, dict):
+        class_dict = dict(classes)
+    else:
+        class_dict = {resource_class.__name__: resource_class for resource_class in classes}
+
+    paths = [str(path) for path in paths]
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(paths) or 1))
+
+    results: List[Optional[BuildingResult]] = [None] * len(paths)
+    done = 0
+
+    def finish(index, result):
+        nonlocal done
+        results[index] = result
+        done += 1
+        if progress is not None:
+            progress(done, len(paths), result)
+
+    def run(indices, workers):
+        """Load `indices` in fresh pools; return the ones lost to a broken pool."""
+        broken = []
+        # Workers are recycled by giving each batch of files a fresh pool
+        # (ProcessPoolExecutor's own max_tasks_per_child deadlocks on 3.11)
+        batch_size = workers * max_tasks_per_child if max_tasks_per_child else len(indices)
+        for batch_start in range(0, len(indices), max(batch_size, 1)):
+            batch = indices[batch_start:batch_start + batch_size]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(_load_building, paths[index], class_dict, ontology, namespace, cache, store): index
+                    for index in batch
+                }
+                for future in as_completed(futures):
+                    index = futures[future]
+                    try:
+                        finish(index, future.result())
+                    except BrokenProcessPool:
+                        broken.append(index)
+                    except Exception:
+                        finish(index, BuildingResult(path=paths[index], error=traceback.format_exc()))
+        return broken
+
+    # A worker that dies outright (e.g. killed for memory) breaks the whole pool
+    # and every file still in it. Retry those in a fresh pool; once a round
+    # makes no progress, load the rest one file per pool so only the culprit fails.
+    pending = list(range(len(paths)))
+    while pending:
+        broken = run(pending, max_workers)
+        if len(broken) < len(pending):
+            pending = broken
+            continue
+        for index in broken:
+            if run([index], 1):
+                finish(index, BuildingResult(
+                    path=paths[index],
+                    error=f"Worker process died while loading {paths[index]}"
+                ))
+        pending = []
+
+    return results
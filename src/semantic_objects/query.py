@@ -1,7 +1,33 @@
 from .namespaces import * 
-from rdflib import Graph, URIRef, Literal, RDF
-from typing import Type, get_origin, get_args
+from rdflib import Graph, URIRef, Literal, RDF, Variable
+from typing import FrozenSet, List, NamedTuple, Tuple, Type
 from dataclasses import _MISSING_TYPE, field
+from .schema import get_schema, is_optional
+
+# The variable of a fused query (see SparqlQueryBuilder.get_fused_query) that
+# holds the position of the class a row matched
+CLASS_VARIABLE = '_class'
+
+
+class ClassPattern(NamedTuple):
+    """
+    The graph pattern of a class's SPARQL query as data (see
+    `SparqlQueryBuilder.get_pattern`), for matchers that don't go through
+    SPARQL. Query variables are rdflib Variables.
+
+    Attributes:
+        triples: The triple patterns, all of which must match
+        filters: (variable, allowed terms) - FILTER(?v IN (...))
+        not_exists: Triple patterns that must not match, with the variables
+            the others bind substituted - FILTER NOT EXISTS { ... }
+        optional: Groups of triple patterns matched where they can be,
+            leaving their variables unbound otherwise - OPTIONAL { ... }
+    """
+    triples: List[Tuple]
+    filters: List[Tuple[Variable, FrozenSet]]
+    not_exists: List[Tuple]
+    optional: List[List[Tuple]] = []
+
 
 class SparqlQueryBuilder:
     """
@@ -22,6 +48,8 @@ class SparqlQueryBuilder:
         self.used_namespaces = []
         self.graph = Graph()
         bind_prefixes(self.graph)
+        # Patterns matched with OPTIONAL (see _add_field_patterns)
+        self.optional_groups = []
         # Add the class type triple
         self.graph.add((PARAM['name'], RDF.type, self.resource_class._get_iri()))
 
@@ -66,6 +94,11 @@ class SparqlQueryBuilder:
             qp = self.convert_to_prefixed(p)
             
             where.append(f"{qs} {qp} {qo} .")
+
+        for group in self.optional_groups:
+            patterns = " ".join(f"{self._get_var_name(graph, s)} {self.convert_to_prefixed(p)} "
+                                f"{self._get_var_name(graph, o)} ." for s, p, o in group)
+            where.append(f"OPTIONAL {{ {patterns} }}")
         
         where += list(filters.values())
         where = "\n".join(where)
@@ -104,6 +137,96 @@ class SparqlQueryBuilder:
             filter_clause = f"FILTER NOT EXISTS {{ {qs} <{str(relation_uri)}> {var_name} }}"
             return None, filter_clause
     
+    def _add_field_patterns(self):
+        """
+        Add the triple patterns for the class's template parameters to
+        self.graph: one relation per field (or a fixed value), and the type
+        and class-level constraints of Resource-typed fields. Optional fields
+        (see `schema.is_optional`) and the value and unit of required properties go
+        to self.optional_groups instead, a list of patterns each.
+
+        Returns:
+            The (field_name, relation, exact_values) of fields with
+            exact_values metadata, which are matched separately
+        """
+        exact_value_constraints = []  # Track fields with exact_values metadata
+        schema = get_schema(self.resource_class)
+
+        for field_name, field_obj in schema.template_parameters.items():
+            relation = self.resource_class._infer_relation_for_field(field_name, field_obj)
+
+            # Check for exact_values metadata
+            exact_values = field_obj.metadata.get('exact_values')
+            if exact_values is not None:
+                # Store for later processing
+                exact_value_constraints.append((field_name, relation, exact_values))
+                continue  # Don't add regular triple for exact_values fields
+
+            fixed_value = self.resource_class._resolve_fixed_default(field_obj)
+            if not isinstance(fixed_value, _MISSING_TYPE) and fixed_value is not None:
+                self.graph.add((PARAM['name'], relation._get_iri(), fixed_value._get_iri()))
+            elif isinstance(fixed_value, _MISSING_TYPE):
+                self._add_field_pattern(self.graph.add, field_name, relation, schema.field_types[field_name])
+                self._add_value_patterns(field_name, schema.field_types[field_name])
+            elif is_optional(field_obj):
+                # Matched if present, without dropping instances that lack it
+                group = []
+                self._add_field_pattern(group.append, field_name, relation, schema.field_types[field_name])
+                self.optional_groups.append(group)
+
+        return exact_value_constraints
+
+    def _add_field_pattern(self, add, field_name, relation, field_type):
+        """
+        Pass add() the patterns matching field_name's value: its relation from
+        ?name and, for a Resource (Optional, List, etc. already unwrapped by
+        the schema), its type and class-level constraints.
+        """
+        add((PARAM['name'], relation._get_iri(), PARAM[field_name]))
+
+        # Check if the field type is a subclass of Resource
+        if (hasattr(field_type, '__mro__') and 
+            any(base.__name__ == 'Resource' for base in field_type.__mro__)):
+            # Check if this class has a _semantic_type attribute
+            # This allows classes to specify which parent type should be used in the semantic model
+            if hasattr(field_type, '_semantic_type') and field_type._semantic_type is not None:
+                semantic_type = field_type._semantic_type
+                # Use the semantic type for the RDF type triple
+                add((PARAM[field_name], RDF.type, semantic_type._get_iri()))
+
+                # Add triples for any class-level fields (fields with init=False and a fixed value)
+                field_type_schema = get_schema(field_type)
+                for class_field_name, class_field_value in field_type_schema.fixed_defaults.items():
+                    class_field_obj = field_type_schema.fields[class_field_name]
+                    # Check if this is a class-level field (init=False with a fixed value)
+                    if class_field_obj.init or class_field_value is None:
+                        continue
+                    # Infer the relation for this class-level field
+                    try:
+                        class_field_relation = field_type._infer_relation_for_field(class_field_name, class_field_obj)
+                        # Add triple for this class-level constraint
+                        if hasattr(class_field_value, '_get_iri'):
+                            add((PARAM[field_name], class_field_relation._get_iri(), class_field_value._get_iri()))
+                    except (ValueError, AttributeError):
+                        # If we can't infer the relation or get the value, skip it
+                        pass
+            else:
+                # Add type triple for this dependency using the field type itself
+                add((PARAM[field_name], RDF.type, field_type._get_iri()))
+
+    def _add_value_patterns(self, field_name, field_type):
+        """
+        For a required field holding a property built from a value and a unit
+        (e.g. an Area), optionally match those too - as ?<field>_value and
+        ?<field>_unit - so loading it needs no lookups of its own.
+        """
+        if not (isinstance(field_type, type) and hasattr(field_type, '__dataclass_fields__')):
+            return
+        init_fields = {name for name, f in get_schema(field_type).fields.items() if f.init}
+        for name, predicate in (('value', S223['hasValue']), ('unit', QUDT['hasUnit'])):
+            if name in init_fields:
+                self.optional_groups.append([(PARAM[field_name], predicate, PARAM[f'{field_name}_{name}'])])
+
     def get_sparql_query(self, ontology=None):
         """
         Generate a SPARQL query from the resource class definition.
@@ -114,79 +237,12 @@ class SparqlQueryBuilder:
         Returns:
             A SPARQL query string that can be used to query for instances of this class
         """
-        seen_fields = set()
-        exact_value_constraints = []  # Track fields with exact_values metadata
-        
-        for base in self.resource_class.__mro__:
-            if hasattr(base, '__dataclass_fields__'):
-                for field_name, field_obj in base.__dataclass_fields__.items():
-                    # Skip fields with init=False and templatize=False
-                    if (field_obj.init == False and 
-                        field_obj.metadata.get('templatize', True) == False):
-                        continue
-                    if field_name in seen_fields:
-                        continue
-                    seen_fields.add(field_name)
-                    
-                    relation = self.resource_class._infer_relation_for_field(field_name, field_obj)
-                    
-                    # Check for exact_values metadata
-                    exact_values = field_obj.metadata.get('exact_values')
-                    if exact_values is not None:
-                        # Store for later processing
-                        exact_value_constraints.append((field_name, relation, exact_values))
-                        continue  # Don't add regular triple for exact_values fields
-                    
-                    fixed_value = self.resource_class._resolve_fixed_default(field_obj)
-                    if not isinstance(fixed_value, _MISSING_TYPE) and fixed_value is not None:
-                        self.graph.add((PARAM['name'], relation._get_iri(), fixed_value._get_iri()))
-                    elif isinstance(fixed_value, _MISSING_TYPE):
-                        self.graph.add((PARAM['name'], relation._get_iri(), PARAM[field_name]))
-                        
-                        # Add type triple for Resource subclass dependencies
-                        field_type = field_obj.type
-                        # Handle Optional, List, etc. - extract the actual type
-                        origin = get_origin(field_type)
-                        if origin is not None:
-                            args = get_args(field_type)
-                            if args:
-                                field_type = args[0]
-                        
-                        # Check if the field type is a subclass of Resource
-                        if (hasattr(field_type, '__mro__') and 
-                            any(base.__name__ == 'Resource' for base in field_type.__mro__)):
-                            # Check if this class has a _semantic_type attribute
-                            # This allows classes to specify which parent type should be used in the semantic model
-                            if hasattr(field_type, '_semantic_type') and field_type._semantic_type is not None:
-                                semantic_type = field_type._semantic_type
-                                # Use the semantic type for the RDF type triple
-                                self.graph.add((PARAM[field_name], RDF.type, semantic_type._get_iri()))
-                                
-                                # Add triples for any class-level fields (fields with init=False and a fixed value)
-                                if hasattr(field_type, '__dataclass_fields__'):
-                                    for class_field_name, class_field_obj in field_type.__dataclass_fields__.items():
-                                        # Check if this is a class-level field (init=False with a fixed value)
-                                        if class_field_obj.init:
-                                            continue
-                                        class_field_value = field_type._resolve_fixed_default(class_field_obj)
-                                        if isinstance(class_field_value, _MISSING_TYPE) or class_field_value is None:
-                                            continue
-                                        # Infer the relation for this class-level field
-                                        try:
-                                            class_field_relation = field_type._infer_relation_for_field(class_field_name, class_field_obj)
-                                            # Add triple for this class-level constraint
-                                            if hasattr(class_field_value, '_get_iri'):
-                                                self.graph.add((PARAM[field_name], class_field_relation._get_iri(), class_field_value._get_iri()))
-                                        except (ValueError, AttributeError):
-                                            # If we can't infer the relation or get the value, skip it
-                                            pass
-                            else:
-                                # Add type triple for this dependency using the field type itself
-                                self.graph.add((PARAM[field_name], RDF.type, field_type._get_iri()))
-        
+        exact_value_constraints = self._add_field_patterns()
+
         # Now bind the prefixes we need by calling convert_to_prefixed on each URI
         # This will cause RDFLib to automatically bind the necessary namespaces
-        for s, p, o in self.graph.triples((None, None, None)):
+        optional_triples = [triple for group in self.optional_groups for triple in group]
+        for s, p, o in [*self.graph.triples((None, None, None)), *optional_triples]:
             for node in [s, p, o]:
                 if isinstance(node, URIRef):
                     # This call will bind the namespace if needed
@@ -205,6 +261,41 @@ class SparqlQueryBuilder:
         
         return query
     
+    def _get_term(self, graph, node):
+        """node as a ClassPattern term: a Variable where the query names one."""
+        name = self._get_var_name(graph, node)
+        if isinstance(name, str) and name.startswith('?'):
+            return Variable(name[1:])
+        return node
+
+    def get_pattern(self, ontology=None):
+        """
+        The pattern `get_sparql_query(ontology)` matches, as a ClassPattern:
+        the same triples, variables and exact_values filters, unparsed.
+
+        Args:
+            ontology: Optional ontology identifier (e.g., 's223') for special handling
+
+        Returns:
+            A ClassPattern
+        """
+        exact_value_constraints = self._add_field_patterns()
+        triples = [tuple(self._get_term(self.graph, node) for node in triple)
+                   for triple in self.graph.triples((None, None, None))]
+        filters, not_exists = [], []
+        subject = self._get_term(self.graph, PARAM['name'])
+        # The same variable for every exact_values field, as in the query text
+        values = Variable(f'{subject}_exact_values')
+        for field_name, relation, exact_values in exact_value_constraints:
+            if len(exact_values) > 0:
+                triples.append((subject, relation._get_iri(), values))
+                filters.append((values, frozenset(self._get_term(self.graph, v._get_iri()) for v in exact_values)))
+            else:
+                not_exists.append((subject, relation._get_iri(), values))
+        optional = [[tuple(self._get_term(self.graph, node) for node in triple) for triple in group]
+                    for group in self.optional_groups]
+        return ClassPattern(triples, filters, not_exists, optional)
+
     def _add_exact_values_to_query(self, query, exact_value_constraints):
         """
         Add exact value constraints to an existing SPARQL query.
@@ -222,7 +313,12 @@ class SparqlQueryBuilder:
             return query
         
         prefix_part = parts[0]
-        where_part = parts[1].rstrip(' }')
+        # Drop the WHERE clause's own closing brace (only that one: an
+        # OPTIONAL group can end the clause too) and keep the OPTIONAL groups
+        # last, after the patterns added below
+        where_lines = parts[1].rstrip()[:-1].strip().split('\n')
+        optional_lines = [line for line in where_lines if line.startswith('OPTIONAL {')]
+        where_part = '\n'.join(line for line in where_lines if not line.startswith('OPTIONAL {'))
         
         # Add exact value patterns and filters
         additional_where = []
@@ -243,5 +339,51 @@ class SparqlQueryBuilder:
             new_where += '\n' + '\n'.join(additional_where)
         if additional_filters:
             new_where += '\n' + '\n'.join(additional_filters)
+        if optional_lines:
+            new_where += '\n' + '\n'.join(optional_lines)
         
         return f"{prefix_part}WHERE {{ {new_where} }}"
+
+    @staticmethod
+    def get_fused_query(resource_classes, ontology=None):
+        """
+        One SPARQL query for several classes: each class's query pattern as a
+        branch of a UNION, with the class's position in resource_classes bound
+        to the discriminator variable ?_class (see CLASS_VARIABLE) so result
+        rows can be told apart. A row only binds its own branch's variables;
+        the others are unbound.
+
+        Args:
+            resource_classes: The Resource classes to query for, in order
+            ontology: Optional ontology identifier (e.g., 's223') for special handling
+
+        Returns:
+            A SPARQL query string for instances of all the classes
+
+        Raises:
+            ValueError: if two classes' queries bind one prefix to different
+                namespaces
+        """
+        prefixes = {}
+        branches = []
+        for index, resource_class in enumerate(resource_classes):
+            head, _, where = resource_class.get_sparql_query(ontology=ontology).partition('WHERE {')
+            for line in head.splitlines():
+                if line.startswith('PREFIX'):
+                    prefix = line.split()[1]
+                    if prefixes.setdefault(prefix, line) != line:
+                        raise ValueError(f"conflicting declarations of prefix {prefix}: {prefixes[prefix]}, {line}")
+            where = where.rstrip()[:-1].strip()
+            branches.append(f"{{ {where}\nBIND({index} AS ?{CLASS_VARIABLE}) }}")
+        where = "\nUNION\n".join(branches)
+        return "\n".join(prefixes.values()) + f"\nSELECT DISTINCT * WHERE {{ {where} }}"
+
+
+def add_values(query, variable, terms):
+    """
+    query with a `VALUES ?variable { ... }` block of terms (rdflib terms)
+    first in its WHERE clause, restricting its solutions to those values.
+    """
+    head, _, where = query.partition('WHERE {')
+    values = " ".join(term.n3() for term in terms)
+    return f"{head}WHERE {{ VALUES ?{variable} {{ {values} }}\n{where.lstrip()}"
@@ -0,0 +1,132 @@
+"""
+Registry - Look up semantic object classes by IRI, local name or hierarchy
+
+Every class `semantic_object` decorates is registered here, so code that has
+an RDF IRI (a loader resolving `qudt:hasUnit` objects, an exporter, type
+inference) can find the Python class for it without scanning modules:
+
+    class_for_iri(UNIT.DEG_C)        -> qudt.units.DEG_C
+    class_for_name('Pump')           -> s223 Pump (first registered)
+    subclasses(s223.Equipment)       -> the classes declaring it as a base
+    descendants(s223.Equipment)      -> every class below it, at any depth
+
+The indexes are updated as each class is decorated. Several classes can share
+an IRI or local name (a hand-written subclass pinning its parent's `_name`,
+the same ontology term in two namespaces): the `classes_for_*` lookups return
+all of them in registration order, the `class_for_*` ones the first. Decorating
+a class again under the same module and qualified name (re-running a module or
+notebook cell) replaces the earlier definition everywhere.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+# (module, qualified name) -> class: the registered definition of each class
+_classes: Dict[Tuple[str, str], type] = {}
+# class -> the (IRI, local name) it was indexed under
+_keys: Dict[type, Tuple[Optional[str], Optional[str]]] = {}
+_by_iri: Dict[str, List[type]] = {}
+_by_name: Dict[str, List[type]] = {}
+_subclasses: Dict[type, List[type]] = {}
+# class -> its descendants, memoized; entries are dropped for every ancestor
+# of a newly registered class
+_descendants: Dict[type, Tuple[type, ...]] = {}
+
+
+def _iri(cls) -> Optional[str]:
+    """cls's IRI as a plain string (URIRefs don't hash like str), or None for
+    classes without a namespace such as framework bases."""
+    if getattr(cls, '_ns', None) is None:
+        return None
+    try:
+        return str(cls._get_iri())
+    except Exception:
+        return None
+
+
+def _unregister(cls):
+    for index, key in zip((_by_iri, _by_name), _keys.pop(cls, ())):
+        entries = index.get(key)
+        if entries is not None and cls in entries:
+            entries.remove(cls)
+            if not entries:
+                del index[key]
+    for base in cls.__bases__:
+        siblings = _subclasses.get(base)
+        if siblings is not None and cls in siblings:
+            siblings.remove(cls)
+    _subclasses.pop(cls, None)
+    _descendants.clear()
+
+
+def register_class(cls: type) -> type:
+    """Add cls to the registry (called by `semantic_object`)."""
+    key = (cls.__module__, cls.__qualname__)
+    previous = _classes.get(key)
+    if previous is not None and previous is not cls:
+        _unregister(previous)
+    _classes[key] = cls
+
+    iri, name = _iri(cls), cls.__dict__.get('_local_name')
+    _keys[cls] = (iri, name)
+    for index, key in ((_by_iri, iri), (_by_name, name)):
+        if key is not None:
+            entries = index.setdefault(key, [])
+            if cls not in entries:
+                entries.append(cls)
+    for base in cls.__bases__:
+        siblings = _subclasses.setdefault(base, [])
+        if cls not in siblings:
+            siblings.append(cls)
+    for ancestor in cls.__mro__:
+        _descendants.pop(ancestor, None)
+    return cls
+
+
+def classes_for_iri(iri) -> List[type]:
+    """Every registered class whose IRI is `iri`."""
+    return list(_by_iri.get(str(iri), ()))
+
+
+def class_for_iri(iri, default=None):
+    """The first registered class whose IRI is `iri`, or `default`."""
+    entries = _by_iri.get(str(iri))
+    return entries[0] if entries else default
+
+
+def classes_for_name(local_name: str) -> List[type]:
+    """Every registered class whose `_name` (its IRI's local name) is local_name."""
+    return list(_by_name.get(local_name, ()))
+
+
+def class_for_name(local_name: str, default=None):
+    """The first registered class named `local_name`, or `default`."""
+    entries = _by_name.get(local_name)
+    return entries[0] if entries else default
+
+
+def subclasses(cls: type) -> List[type]:
+    """The registered classes listing cls as a direct base."""
+    return list(_subclasses.get(cls, ()))
+
+
+def descendants(cls: type) -> Tuple[type, ...]:
+    """Every registered class below cls, breadth first, each once."""
+    result = _descendants.get(cls)
+    if result is None:
+        seen = {}
+        frontier = [cls]
+        while frontier:
+            next_frontier = []
+            for klass in frontier:
+                for subclass in _subclasses.get(klass, ()):
+                    if subclass not in seen:
+                        seen[subclass] = None
+                        next_frontier.append(subclass)
+            frontier = next_frontier
+        result = _descendants[cls] = tuple(seen)
+    return result
+
+
+def registered_classes() -> List[type]:
+    """Every registered class, in registration order."""
+    return list(_classes.values())
@@ -0,0 +1,171 @@
+"""
+Results - Stream SPARQL results in bounded memory
+
+`query_to_df` builds one dict per result row and then one DataFrame, so wide
+`SELECT DISTINCT *` results over large graphs are held twice over. The
+functions here consume the rdflib result incrementally instead:
+
+  query_rows:    a generator of row tuples (named after the query variables)
+  query_batches: a generator of DataFrames of at most `batch_size` rows, built
+                 column by column with typed columns - IRIs as a categorical
+                 (each distinct IRI stored once per batch), literals as their
+                 Python values in pandas' nullable dtypes (Int64, Float64,
+                 boolean, string, datetime64, ...)
+  batch_rows:    the same for rows that don't come from SPARQL (the matcher's)
+
+Example:
+    for batch in query_batches(Space.get_sparql_query(ontology='s223'), g):
+        print(batch.dtypes)
+"""
+
+from collections import namedtuple
+from typing import Any, Iterator, List, Optional, Union
+
+import pandas as pd
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.plugins.sparql.sparql import Query
+
+from .stores import to_store
+
+
+def _python_value(term) -> Any:
+    """An rdflib term as a plain Python value: IRIs/blank nodes as strings,
+    literals via toPython(), unbound as None."""
+    if term is None:
+        return None
+    if isinstance(term, Literal):
+        return term.toPython()
+    return str(term)
+
+
+def _column(terms: List[Any], categorical: bool):
+    """One result column (rdflib terms or None) as a typed pandas array."""
+    if categorical and all(term is None or isinstance(term, (URIRef, BNode)) for term in terms):
+        return pd.Categorical([None if term is None else str(term) for term in terms])
+
+    values = [_python_value(term) for term in terms]
+    types = {type(value) for value in values if value is not None}
+    if len(types) == 1 or types == {int, float}:
+        return pd.array(values)
+    # Mixed (or all unbound) - keep the values as they are
+    return pd.array(values, dtype=object)
+
+
+def _frame(batch: List[tuple], columns: List[str], categorical: bool) -> pd.DataFrame:
+    data = {}
+    for position, column in enumerate(columns):
+        data[column] = _column([row[position] for row in batch], categorical)
+    return pd.DataFrame(data, columns=columns)
+
+
+def _run(query: Union[str, Query], graph: Graph, store: Optional[str]):
+    """Execute the query; return (column names, iterator of row tuples of terms)."""
+    results = to_store(graph, store).query(query)
+    variables = list(results.vars or [])
+    columns = [str(var) for var in variables]
+    return columns, (tuple(solution.get(var) for var in variables) for solution in _solutions(results))
+
+
+def _solutions(results):
+    """
+    Yield each solution mapping of an rdflib SELECT result once.
+
+    Iterating a Result (or reading `.bindings`) appends every solution to a
+    list kept on the Result, so the whole result ends up in memory anyway.
+    rdflib's Result keeps the solutions it hasn't produced yet in a private
+    generator (`_genbindings`), which is consumed directly when there is one;
+    any other result - another rdflib version's, or one already read - goes
+    through the public `bindings`.
+    """
+    pending = getattr(results, '_genbindings', None)
+    if pending is None or not hasattr(pending, '__next__'):
+        solutions = results.bindings
+    else:
+        results._genbindings = None
+        solutions = pending
+    for solution in solutions:
+        # Like Result.__iter__, an empty binding {} is not a result row
+        if solution:
+            yield solution
+
+
+def query_rows(
+    query: Union[str, Query],
+    graph: Graph,
+    convert: bool = True,
+    store: Optional[str] = None
+) -> Iterator[tuple]:
+    """
+    Execute a SPARQL query and yield one tuple per result row.
+
+    Rows are named tuples with one field per query variable (in `results.vars`
+    order), so `row.name` and `row._fields` work, and are produced as the
+    result is consumed rather than collected first.
+
+    Args:
+        query: SPARQL query string or prepared query
+        graph: RDF graph to query
+        convert: If True, yield Python values (IRIs as strings, literals via
+            toPython()); if False, the rdflib terms themselves
+        store: Evaluate the query in this store (see `query_to_df`)
+    """
+    columns, rows = _run(query, graph, store)
+    Row = namedtuple('Row', columns, rename=True)
+    for row in rows:
+        if convert:
+            yield Row._make(_python_value(term) for term in row)
+        else:
+            yield Row._make(row)
+
+
+def query_batches(
+    query: Union[str, Query],
+    graph: Graph,
+    batch_size: int = 10000,
+    categorical: bool = True,
+    store: Optional[str] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Execute a SPARQL query and yield the results as DataFrames of at most
+    `batch_size` rows, one column per query variable.
+
+    Only one batch of rows is held at a time. A query with no results yields
+    nothing.
+
+    Args:
+        query: SPARQL query string or prepared query
+        graph: RDF graph to query
+        batch_size: Maximum rows per DataFrame
+        categorical: If True, columns holding only IRIs are categorical;
+            if False they're plain strings
+        store: Evaluate the query in this store (see `query_to_df`)
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+
+    columns, rows = _run(query, graph, store)
+    yield from batch_rows(columns, rows, batch_size, categorical)
+
+
+def batch_rows(
+    columns: List[str],
+    rows: Iterator[tuple],
+    batch_size: int = 10000,
+    categorical: bool = True
+) -> Iterator[pd.DataFrame]:
+    """
+    `query_batches` for result rows already at hand: row tuples of rdflib
+    terms (or None), one per solution, with the given column names - e.g.
+    from `matcher.PatternMatcher.match`.
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == batch_size:
+            yield _frame(batch, columns, categorical)
+            batch = []
+    if batch:
+        yield _frame(batch, columns, categorical)
@@ -6,14 +6,16 @@ from . import relations
 
 @dataclass
 class Node(core.Node):
+    __slots__ = ()
     _ns = S223
     _name = 'Class'
     _other_types = [SH.NodeShape, RDFS.Class]
 
 @dataclass
 class ExternalReference(Node):
+    __slots__ = ()
     _name = 'ExternalReference'
 
 @dataclass
 class EnumerationKind(Node):
-    pass
\ No newline at end of file
+    __slots__ = ()
\ No newline at end of file
@@ -49,6 +49,24 @@ class QuantifiableObservableProperty(_GeneratedQOP):
         if self.unit is None:
             self.unit = DEFAULT_UNIT_MAP[self.qk][DEFAULT_UNIT_SYSTEM]
 
+    @classmethod
+    def _bulk_post_init(cls, columns, length):
+        """Set default units for a batch (see Resource._bulk_post_init)"""
+        super()._bulk_post_init(columns, length)
+        units = columns.get('unit')
+        if units is None:
+            if cls.unit is not None:
+                return
+            units = columns['unit'] = [None] * length
+        qks = columns.get('qk') or [cls.qk] * length
+        defaults = {}
+        for i, unit in enumerate(units):
+            if unit is None:
+                qk = qks[i]
+                if qk not in defaults:
+                    defaults[qk] = DEFAULT_UNIT_MAP[qk][DEFAULT_UNIT_SYSTEM]
+                units[i] = defaults[qk]
+
 
 @semantic_object
 class Area(QuantifiableObservableProperty):
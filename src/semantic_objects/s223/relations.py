@@ -6,4 +6,10 @@ ontology - see _generated/relations.py, regenerated via
 relation-level customization that can't be derived from SHACL would go; currently
 there is none.
 """
-from ._generated.relations import *
+from ..lazy import lazy_exports as _lazy_exports, star_import as _star_import
+from ._generated import relations as _generated_relations
+
+# Re-exported lazily: with a split _generated/ package each class is only
+# imported on first use (see semantic_objects.lazy)
+__all__ = list(_generated_relations.__all__)
+__getattr__, __dir__ = _lazy_exports(__name__, _star_import(globals(), _generated_relations))
@@ -0,0 +1,703 @@
+"""
+Compiled per-class schema for Resource introspection.
+
+`Resource.get_relations()`, `_get_template_parameters()`,
+`_get_inter_field_relations()`, `get_dependencies()` and friends used to walk
+the whole MRO (and re-run relation inference for every field) on every call.
+Exporters, SparqlQueryBuilder and ModelLoader call them for the same class many
+times, so exporting or querying a whole generated package was quadratic.
+
+`get_schema(cls)` builds a `ClassSchema` for a class the first time it's asked
+for and caches it on the class itself. Every part of the schema is computed
+lazily, so a class that's only ever instantiated never pays for relation
+inference. When `semantic_object` decorates a class, the schemas that can
+depend on it - its subclasses' and those of classes whose fields refer to it,
+transitively - are invalidated (see `invalidate_schemas`), so no class serves
+stale metadata while everything else stays compiled.
+
+Generated SPARQL queries (and their parsed rdflib form) are part of the
+schema too, so they are built once per class and ontology.
+
+Relation inference itself is answered from a global relation index (see
+`find_relation`) that `semantic_object` extends as each class is decorated.
+
+`Resource.get_related_classes()` is answered from a memoized transitive
+closure over the class reference graph (see `related_classes`).
+"""
+import weakref
+from dataclasses import _MISSING_TYPE
+from functools import cached_property
+from typing import Self, get_args, get_origin
+
+# Bumped by `invalidate_schemas()` to invalidate everything at once. A cached
+# schema built under an older generation is discarded and rebuilt on next use.
+_generation = 0
+
+# class -> the classes with a compiled schema that refer to it (see
+# `_schema_references`), for invalidating just the schemas that depend on a class
+_dependents = weakref.WeakKeyDictionary()
+
+
+def invalidate_schemas(cls=None):
+    """
+    Invalidate cached ClassSchemas. `semantic_object` passes the class it
+    decorated: only the schemas that can depend on it are dropped - its own,
+    its subclasses' and those of classes whose fields or relations refer to
+    any of them - along with their memoized relation lookups and related
+    class closures. Without cls, every schema is (e.g. after changing a
+    class's fields in place).
+    """
+    global _generation
+    if cls is None:
+        _generation += 1
+        _relation_pairs.clear()
+        return
+
+    affected, pending = {cls}, [cls]
+    while pending:
+        for dependent in list(_dependents.get(pending.pop(), ())):
+            if dependent not in affected:
+                affected.add(dependent)
+                pending.append(dependent)
+    for klass in affected:
+        if '_compiled_schema' in klass.__dict__:
+            delattr(klass, '_compiled_schema')
+
+    for pair in [pair for pair in _relation_pairs if pair[0] in affected or pair[1] in affected]:
+        del _relation_pairs[pair]
+    for klass in [klass for klass, closure in _closures.items() if any(a in closure for a in affected)]:
+        del _closures[klass]
+    for klass in affected:
+        _references.pop(klass, None)
+        _kinds.pop(klass, None)
+
+
+def _schema_references(cls):
+    """The classes cls's schema is built from: its bases, and its fields' types
+    and relations (explicit or inter-field)."""
+    references = set(cls.__mro__[1:])
+    for field_obj in getattr(cls, '__dataclass_fields__', {}).values():
+        references.add(unwrap_type(field_obj.type))
+        references.add(field_obj.metadata.get('relation'))
+    for rel in getattr(cls, '_inter_field_relations', ()):
+        references.add(rel.get('relation'))
+    return [reference for reference in references if isinstance(reference, type) and reference is not cls]
+
+
+def get_schema(cls) -> 'ClassSchema':
+    """The compiled schema for `cls`, built on first use and cached on the class.
+
+    Looked up in `cls.__dict__` rather than via attribute access so a subclass
+    never picks up its parent's cached schema (nor one compiled by another
+    import of this module, e.g. `src.semantic_objects`).
+    """
+    schema = cls.__dict__.get('_compiled_schema')
+    if not isinstance(schema, ClassSchema) or schema.generation != _generation:
+        schema = ClassSchema(cls)
+        setattr(cls, '_compiled_schema', schema)
+        for reference in _schema_references(cls):
+            _dependents.setdefault(reference, weakref.WeakSet()).add(cls)
+    return schema
+
+
+def unwrap_type(annotation):
+    """Strip Optional/List/... wrapping from a field annotation (`Optional[X]` -> `X`)."""
+    origin = get_origin(annotation)
+    if origin is not None:
+        args = get_args(annotation)
+        if args:
+            return args[0]
+    return annotation
+
+
+def resolve_fixed_default(field_obj):
+    """Return a field's fixed value, whether pinned via `default` or
+    `default_factory` (used for unhashable values like Resource instances).
+    Returns the `_MISSING_TYPE` sentinel if the field has neither - i.e. it's
+    a real template parameter, not a fixed value."""
+    if not isinstance(field_obj.default, _MISSING_TYPE):
+        return field_obj.default
+    if not isinstance(field_obj.default_factory, _MISSING_TYPE):
+        return field_obj.default_factory()
+    return field_obj.default
+
+
+def is_optional(field_obj):
+    """Whether a field with no value by default (`optional_field()`, or
+    `field(default=None)`) is optional - it has no minimum count, unlike e.g.
+    `unit = required_field(...)` with a None default filled in later."""
+    return not field_obj.metadata.get('min')
+
+
+def _skip_as_template_parameter(field_obj):
+    """Fields with init=False and templatize=False aren't template parameters."""
+    return field_obj.init == False and field_obj.metadata.get('templatize', True) == False
+
+
+# Relation index used by relation inference.
+#
+# `_relation_tables` maps a source class to {target key: relation}, the first
+# `_valid_relations` entry it declares (or inherits) for each target, with Self
+# resolved to the source class itself. Tables are built as `semantic_object`
+# decorates classes (see `index_relations`) and lazily for anything else.
+#
+# `_relation_pairs` memoizes whole (source class, target type) lookups,
+# misses included, so repeat lookups are a single dict hit.
+_relation_tables = {}
+_relation_pairs = {}
+
+
+def _target_key(target):
+    """Index key for a relation target: classes match by name (so re-imported or
+    regenerated classes still line up), anything else by equality."""
+    if hasattr(target, '__name__'):
+        return ('name', target.__name__)
+    key = ('value', target)
+    hash(key)  # raises TypeError for unhashable targets
+    return key
+
+
+def _relation_table(source_class):
+    """The {target key: relation} table for source_class, built on first use.
+
+    Rebuilt (dropping memoized pair lookups) if `_valid_relations` has been
+    reassigned since the table was built."""
+    valid_relations = getattr(source_class, '_valid_relations', None)
+    entry = _relation_tables.get(source_class)
+    if entry is not None and entry[0] is valid_relations:
+        return entry[1]
+    if entry is not None:
+        _relation_pairs.clear()
+
+    table = {}
+    for relation, valid_target in valid_relations or ():
+        # Handle Self reference in _valid_relations
+        if valid_target is Self or str(valid_target) == 'Self':
+            valid_target = source_class
+        try:
+            table.setdefault(_target_key(valid_target), relation)
+        except TypeError:
+            continue  # unhashable target, can't match an annotation anyway
+    _relation_tables[source_class] = (valid_relations, table)
+    return table
+
+
+def index_relations(cls):
+    """Add cls (and anything up its MRO not indexed yet) to the relation index.
+    Called by `semantic_object` so lookups never pay for building tables."""
+    for source_class in cls.__mro__:
+        if hasattr(source_class, '_valid_relations'):
+            _relation_table(source_class)
+
+
+def find_relation(cls, target_type):
+    """The relation cls declares for target_type, or None if nothing matches.
+
+    Equivalent to walking cls's MRO, then target_type's MRO, then each
+    `_valid_relations` entry and returning the first relation whose declared
+    target matches (by identity or by class name) - answered from the relation
+    index and memoized per (cls, target_type) pair."""
+    pair = (cls, target_type)
+    try:
+        return _relation_pairs[pair]
+    except KeyError:
+        pass
+    except TypeError:
+        pair = None  # unhashable annotation, look it up without memoizing
+
+    target_mro = target_type.__mro__ if hasattr(target_type, '__mro__') else [target_type]
+    target_keys = []
+    for target_class in target_mro:
+        try:
+            target_keys.append(_target_key(target_class))
+        except TypeError:
+            continue
+
+    relation = None
+    for source_class in cls.__mro__:
+        if not hasattr(source_class, '_valid_relations'):
+            continue
+        table = _relation_table(source_class)
+        if not table:
+            continue
+        for key in target_keys:
+            if key in table:
+                relation = table[key]
+                break
+        if relation is not None:
+            break
+
+    if pair is not None:
+        _relation_pairs[pair] = relation
+    return relation
+
+
+# Transitive closure of the class reference graph, used by
+# `Resource.get_related_classes`.
+#
+# A Resource class references the relations of its fields and its fields' raw
+# annotations; anything else is a leaf. `_closures` maps each class to the
+# classes reachable from it (itself included) as an insertion-ordered dict.
+# Closures are computed a strongly connected component at a time, so every
+# class of a reference cycle shares one closure and a component's closure is
+# built from its successors' memoized ones. Dropped whenever a class is
+# invalidated along with the schemas (see `invalidate_schemas`) -
+# all of them when the generation changes (`_closure_generation`).
+_closures = {}
+_references = {}
+_kinds = {}
+_closure_generation = None
+
+
+def _has_base_named(klass, base_name):
+    """Whether `base_name` names a class on klass's MRO. Checked by name so
+    classes from every import of the package (`semantic_objects` and
+    `src.semantic_objects`) are recognised."""
+    return isinstance(klass, type) and any(base.__name__ == base_name for base in klass.__mro__)
+
+
+def _check_closure_generation():
+    global _closure_generation
+    if _closure_generation != _generation:
+        _closures.clear()
+        _references.clear()
+        _kinds.clear()
+        _closure_generation = _generation
+
+
+def class_references(klass):
+    """The classes (and raw field annotations) klass refers to directly: its
+    relations, then its fields' types. Empty for anything but a Resource."""
+    references = _references.get(klass)
+    if references is None:
+        if _has_base_named(klass, 'Resource'):
+            references = [relation for relation, field_name in klass.get_relations()]
+            references += [field_obj.type for field_obj in klass.__dataclass_fields__.values()]
+            references = tuple(dict.fromkeys(references))
+        else:
+            references = ()
+        _references[klass] = references
+    return references
+
+
+def _close(root):
+    """Compute and memoize the closure of every class reachable from root that
+    has none yet (Tarjan's strongly connected components, iteratively)."""
+    index, low, stack, on_stack = {}, {}, [], set()
+
+    def visit(node):
+        index[node] = low[node] = len(index)
+        stack.append(node)
+        on_stack.add(node)
+        return node, iter(class_references(node))
+
+    work = [visit(root)]
+    while work:
+        node, successors = work[-1]
+        for successor in successors:
+            if successor in _closures:
+                continue
+            if successor not in index:
+                work.append(visit(successor))
+                break
+            if successor in on_stack:
+                low[node] = min(low[node], index[successor])
+        else:
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[node])
+            if low[node] != index[node]:
+                continue
+            # node is the root of a component: pop it and close it as a whole
+            members = []
+            while True:
+                member = stack.pop()
+                on_stack.discard(member)
+                members.append(member)
+                if member is node:
+                    break
+            members.reverse()
+            closure = dict.fromkeys(members)
+            for member in members:
+                for successor in class_references(member):
+                    if successor not in closure:
+                        closure.update(_closures[successor])
+            for member in members:
+                _closures[member] = closure
+
+
+def reachable_classes(cls):
+    """Everything reachable from cls in the reference graph, cls included, in
+    first-seen order (memoized; don't mutate the result)."""
+    _check_closure_generation()
+    closure = _closures.get(cls)
+    if closure is None:
+        _close(cls)
+        closure = _closures[cls]
+    return closure
+
+
+def _kind(klass, include_abstract):
+    """'predicate', 'entity' or None: where get_related_classes files klass."""
+    kind = _kinds.get(klass, False)
+    if kind is False:
+        kind = None
+        if _has_base_named(klass, 'Resource'):
+            if _has_base_named(klass, 'Predicate'):
+                kind = 'predicate'
+            elif _has_base_named(klass, 'Node'):
+                kind = 'entity'
+        _kinds[klass] = kind
+    if kind is not None and not include_abstract and getattr(klass, 'abstract', False):
+        return None
+    return kind
+
+
+def related_classes(classes, get_recursive=True, include_abstract=False):
+    """
+    (predicate_list, entity_list) of the classes related to any of `classes`,
+    as returned by `Resource.get_related_classes()` for a single class.
+
+    A class already reachable from an earlier one contributes nothing new (its
+    closure is contained in that one's), so a whole module's worth of classes
+    costs about one pass over the reference graph.
+    """
+    _check_closure_generation()
+    related = {}
+    for cls in classes:
+        if get_recursive:
+            if cls not in related:
+                related.update(reachable_classes(cls))
+        else:
+            related[cls] = None
+            related.update(dict.fromkeys(class_references(cls)))
+
+    predicate_lst, entity_lst = [], []
+    for klass in related:
+        kind = _kind(klass, include_abstract)
+        if kind == 'predicate':
+            predicate_lst.append(klass)
+        elif kind == 'entity':
+            entity_lst.append(klass)
+    return predicate_lst, entity_lst
+
+
+class ClassSchema:
+    """Resolved field/relation/dependency metadata for one Resource class."""
+
+    def __init__(self, cls):
+        self.cls = cls
+        self.generation = _generation
+        # field object -> resolved relation, or the ValueError raised resolving it.
+        # Keyed by the Field object (not just its name) because get_relations()
+        # resolves inherited fields through the base class's own Field objects.
+        self._relation_cache = {}
+        # ontology -> generated SPARQL text / rdflib prepared query / native matcher
+        self._sparql_queries = {}
+        self._prepared_queries = {}
+        self._matchers = {}
+
+    # -- fields ----------------------------------------------------------------
+
+    @cached_property
+    def fields(self):
+        """All dataclass fields of the class (its own and inherited), by name."""
+        return dict(getattr(self.cls, '__dataclass_fields__', {}))
+
+    @cached_property
+    def field_types(self):
+        """Each field's annotation with Optional/List/... unwrapped."""
+        return {name: unwrap_type(field_obj.type) for name, field_obj in self.fields.items()}
+
+    @cached_property
+    def fixed_defaults(self):
+        """Fields pinned to a fixed value (via `default` or `default_factory`)."""
+        fixed = {}
+        for name, field_obj in self.fields.items():
+            value = resolve_fixed_default(field_obj)
+            if not isinstance(value, _MISSING_TYPE):
+                fixed[name] = value
+        return fixed
+
+    @cached_property
+    def declared_fields(self):
+        """Fields introduced (or redefined) by this class rather than inherited as-is."""
+        parent_fields = set()
+        for base in self.cls.__mro__[1:]:
+            if hasattr(base, '__dataclass_fields__'):
+                parent_fields.update(base.__dataclass_fields__.values())
+        return {name: f for name, f in self.fields.items() if f not in parent_fields}
+
+    @cached_property
+    def template_parameters(self):
+        """Template parameter fields, first definition up the MRO winning."""
+        parameters = {}
+        for base in self.cls.__mro__:
+            if hasattr(base, '__dataclass_fields__'):
+                for field_name, field_obj in base.__dataclass_fields__.items():
+                    if _skip_as_template_parameter(field_obj):
+                        continue
+                    if field_name in parameters:
+                        continue
+                    parameters[field_name] = field_obj
+        return parameters
+
+    @cached_property
+    def optional_fields(self):
+        return [name for name, field_obj in self.fields.items()
+                if field_obj.metadata.get('optional', False)]
+
+    # -- relations -------------------------------------------------------------
+
+    def relation_for(self, field_name, field_obj):
+        """The relation for a field - explicit metadata, or inferred from the
+        `_valid_relations` declared up both class hierarchies. Memoized per field.
+
+        Raises:
+            ValueError: If no relation can be found
+        """
+        cached = self._relation_cache.get(field_obj)
+        if cached is None:
+            cached = self._resolve_relation(field_name, field_obj)
+            self._relation_cache[field_obj] = cached
+        if isinstance(cached, ValueError):
+            raise ValueError(*cached.args)
+        return cached
+
+    def _resolve_relation(self, field_name, field_obj):
+        # If relation is explicitly provided, use it
+        if field_obj.metadata.get('relation') is not None:
+            return field_obj.metadata['relation']
+
+        # TODO: Look back into handling lists/optional, like looking in Optional, List, etc. - extract the actual type
+        target_type = unwrap_type(field_obj.type)
+
+        # Handle Self reference
+        if target_type == self.cls or str(target_type) == 'Self':
+            target_type = self.cls
+
+        relation = find_relation(self.cls, target_type)
+        if relation is None:
+            return ValueError(f"No relation found for field '{field_name}' with type '{target_type}' on {self.cls}, set it manually")
+        return relation
+
+    @cached_property
+    def inter_field_relations(self):
+        all_relations = []
+        seen_relations = set()
+        for base in reversed(self.cls.__mro__):
+            if hasattr(base, '_inter_field_relations'):
+                for rel in base._inter_field_relations:
+                    # Create a unique key for this relation
+                    rel_key = (rel['source_field'], rel['relation']._name if hasattr(rel['relation'], '_name') else str(rel['relation']), rel['target_field'])
+                    if rel_key not in seen_relations:
+                        all_relations.append(rel)
+                        seen_relations.add(rel_key)
+        return all_relations
+
+    @cached_property
+    def relations(self):
+        """(relation, field_name) pairs, as returned by `Resource.get_relations()`."""
+        all_relations = []
+        seen_relations = set()
+
+        for base in reversed(self.cls.__mro__):
+            if hasattr(base, '__dataclass_fields__'):
+                for field_name, field_obj in base.__dataclass_fields__.items():
+                    if _skip_as_template_parameter(field_obj):
+                        continue
+                    # Skip fields that are part of inter-field relations (source fields with 'value' metadata)
+                    if field_obj.metadata.get('value') is not None:
+                        continue
+                    # Skip fields with relation explicitly set to None
+                    if field_obj.metadata.get('relation') is None and 'relation' in field_obj.metadata:
+                        continue
+
+                    relation = self.relation_for(field_name, field_obj)
+                    relation_key = (relation._name, field_name)
+                    if relation_key not in seen_relations:
+                        all_relations.append((relation, field_name))
+                        seen_relations.add(relation_key)
+
+        for rel in self.inter_field_relations:
+            relation = rel['relation']
+            source_field = rel['source_field']
+            relation_key = (relation._name, source_field)
+            if relation_key not in seen_relations:
+                all_relations.append((relation, source_field))
+                seen_relations.add(relation_key)
+
+        return all_relations
+
+    # -- queries ---------------------------------------------------------------
+
+    def sparql_query(self, ontology=None):
+        """The generated SPARQL query text, as returned by `Resource.get_sparql_query()`.
+        Memoized per ontology."""
+        query = self._sparql_queries.get(ontology)
+        if query is None:
+            from .query import SparqlQueryBuilder  # Import here to avoid circular dependency
+            query = SparqlQueryBuilder(self.cls).get_sparql_query(ontology)
+            self._sparql_queries[ontology] = query
+        return query
+
+    def prepared_query(self, ontology=None):
+        """`sparql_query(ontology)` parsed and translated to algebra once with
+        rdflib's `prepareQuery`, ready to pass to `Graph.query`. Memoized per ontology."""
+        prepared = self._prepared_queries.get(ontology)
+        if prepared is None:
+            from rdflib.plugins.sparql import prepareQuery
+            prepared = prepareQuery(self.sparql_query(ontology))
+            self._prepared_queries[ontology] = prepared
+        return prepared
+
+    def matcher(self, ontology=None):
+        """The query's pattern compiled for `matcher.PatternMatcher` (matched
+        without SPARQL), or None if it has a shape the matcher doesn't handle.
+        Memoized per ontology."""
+        if ontology not in self._matchers:
+            from .query import SparqlQueryBuilder
+            from .matcher import PatternMatcher
+            pattern = SparqlQueryBuilder(self.cls).get_pattern(ontology)
+            try:
+                self._matchers[ontology] = PatternMatcher(pattern)
+            except ValueError:
+                self._matchers[ontology] = None
+        return self._matchers[ontology]
+
+    # -- loading ---------------------------------------------------------------
+
+    @cached_property
+    def load_plan(self):
+        """
+        How ModelLoader fills each init field from a query binding: a list of
+        (field_name, kind, field_type, related), where kind is 'named' (a
+        NamedNode - the class itself is the value), 'related' (a Resource built
+        from the bound IRI) or 'primitive', and `related` is
+        (has_semantic_type, init field names, has required init fields) for
+        'related' entries.
+        """
+        return self._load_entries(name for name, field_obj in self.fields.items()
+                                  # _name is set after instantiation, and init=False fields can't be passed
+                                  if name != '_name' and field_obj.init)
+
+    @cached_property
+    def late_load_plan(self):
+        """
+        `load_plan` entries for the optional fields ModelLoader sets after
+        instantiation: template parameters with init=False and no value by
+        default (`optional_field()`), which queries match with OPTIONAL.
+        """
+        return self._load_entries(
+            name for name, field_obj in self.template_parameters.items()
+            if not field_obj.init and field_obj.metadata.get('exact_values') is None
+            and resolve_fixed_default(field_obj) is None and is_optional(field_obj))
+
+    def _load_entries(self, field_names):
+        """The `load_plan` entries for field_names."""
+        from .core import Resource, NamedNode  # Import here to avoid circular dependency
+
+        plan = []
+        for field_name in field_names:
+            field_type = self.field_types[field_name]
+            if isinstance(field_type, type) and issubclass(field_type, NamedNode):
+                plan.append((field_name, 'named', field_type, None))
+            elif isinstance(field_type, type) and issubclass(field_type, Resource):
+                related_fields = get_schema(field_type).fields
+                # Fields set at the class level (init=False) can't be passed to __init__
+                init_field_names = frozenset(name for name, f in related_fields.items() if f.init)
+                has_required_instance_fields = any(
+                    f.init and isinstance(f.default, _MISSING_TYPE) for f in related_fields.values()
+                )
+                has_semantic_type = getattr(field_type, '_semantic_type', None) is not None
+                related = (has_semantic_type, init_field_names, has_required_instance_fields)
+                plan.append((field_name, 'related', field_type, related))
+            else:
+                plan.append((field_name, 'primitive', field_type, None))
+        return plan
+
+    # -- construction ----------------------------------------------------------
+
+    @cached_property
+    def construction_plan(self):
+        """
+        How `bulk.bulk_create` builds instances without calling `__init__`:
+        (init fields as (name, default, default_factory) in `__init__` order -
+        MISSING where there's none, init=False fields set by a default_factory
+        as (name, factory), and whether every `__post_init__` in the MRO has a
+        `_bulk_post_init` counterpart to run column-wise instead).
+        """
+        init_fields, factory_fields = [], []
+        for field_name, field_obj in self.fields.items():
+            if field_obj.init:
+                init_fields.append((field_name, field_obj.default, field_obj.default_factory))
+            elif not isinstance(field_obj.default_factory, _MISSING_TYPE):
+                factory_fields.append((field_name, field_obj.default_factory))
+        vectorized = all('_bulk_post_init' in klass.__dict__
+                         for klass in self.cls.__mro__ if '__post_init__' in klass.__dict__)
+        return tuple(init_fields), tuple(factory_fields), vectorized
+
+    # -- instance serialization ------------------------------------------------
+
+    @cached_property
+    def instance_triples(self):
+        """
+        What `serializer.to_graph` writes for an instance of the class - the
+        triples its BuildingMOTIF template body declares, compiled once:
+        (rdf:type object, [(field name, predicate IRI or None, fixed object IRI
+        or None, dependency class or None)], [(source field, predicate IRI,
+        target field)]).
+        """
+        semantic_type = getattr(self.cls, '_semantic_type', None)
+        type_iri = (semantic_type if semantic_type is not None else self.cls)._get_iri()
+        dependencies = {dependency['args']['name']: dependency['template'] for dependency in self.dependencies}
+
+        fields = []
+        for field_name, field_obj in self.template_parameters.items():
+            if field_obj.metadata.get('value') is not None:
+                continue
+            predicate = None
+            # A relation explicitly set to None only links the field through
+            # inter-field relations, but its dependency's triples still apply
+            if not (field_obj.metadata.get('relation') is None and 'relation' in field_obj.metadata):
+                predicate = self.relation_for(field_name, field_obj)._get_iri()
+            fixed_value = resolve_fixed_default(field_obj)
+            if not isinstance(fixed_value, _MISSING_TYPE) and fixed_value is not None:
+                if predicate is not None:
+                    fields.append((field_name, predicate, fixed_value._get_iri(), None))
+                continue
+            fields.append((field_name, predicate, None, dependencies.get(field_name)))
+
+        inter_field = [(rel['source_field'], rel['relation']._get_iri(), rel['target_field'])
+                       for rel in self.inter_field_relations]
+        return type_iri, fields, inter_field
+
+    # -- dependencies ----------------------------------------------------------
+
+    @cached_property
+    def dependencies(self):
+        """BuildingMOTIF template dependencies, as returned by `Resource.get_dependencies()`."""
+        from .core import Resource  # Import here to avoid circular dependency
+
+        dependencies = []
+        for field_name, field_obj in self.fields.items():
+            # Fields that are sources of inter-field relations aren't separate dependencies
+            if field_obj.metadata.get('value') is not None:
+                continue
+            annotation_type = self.field_types[field_name]
+            if not isinstance(annotation_type, type):
+                continue
+            if not issubclass(annotation_type, Resource):
+                continue
+            if annotation_type.templatize == False:
+                continue
+            if _skip_as_template_parameter(field_obj):
+                continue
+            if field_name in self.fixed_defaults:
+                continue
+            dependencies.append({
+                'template': annotation_type,
+                'args': {'name': field_name}
+            })
+        return dependencies
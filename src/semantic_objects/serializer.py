@@ -0,0 +1,124 @@
+"""
+Serializer - Write semantic object instances straight to RDF
+
+`BMotifSession.evaluate` turns an instance into triples by regenerating its
+class's BuildingMOTIF templates, flattening `get_field_values(recursive=True)`
+and evaluating the template with inlined dependencies - once per object.
+`to_graph` produces the same triples without BuildingMOTIF: each class's
+template body is compiled once into a triple plan (see
+`ClassSchema.instance_triples`), and instances are walked with it directly.
+
+    graph = to_graph(spaces + windows, namespace='urn:building-7#')
+
+    with open('building-7.nt', 'w') as f:        # streamed as N-Triples
+        to_graph(spaces + windows, f, namespace='urn:building-7#')
+
+Instances are named `namespace[instance._name]`. Nested instances (a Space's
+Area property) are written with their field's template, like BuildingMOTIF
+dependencies, and only once however many objects refer to them. Fields left
+as None are skipped rather than written as literals.
+"""
+
+from typing import Iterable, Iterator, TextIO, Tuple, Union
+
+from rdflib import Graph, Literal, Namespace, URIRef
+
+from .core import Resource
+from .namespaces import RDF, bind_prefixes
+from .schema import get_schema
+
+DEFAULT_NAMESPACE = Namespace('urn:test#')  # BMotifSession's default namespace
+
+# Triples are handed to Graph.addN / written in batches of this many
+BATCH_SIZE = 10000
+
+
+def iter_triples(instances: Iterable[Resource],
+                 namespace: Union[str, Namespace, None] = None) -> Iterator[Tuple]:
+    """Yield the triples describing `instances` and the instances they nest."""
+    namespace = DEFAULT_NAMESPACE if namespace is None else Namespace(str(namespace))
+
+    def node(value):
+        if isinstance(value, Resource):
+            return namespace[value._name]
+        if isinstance(value, type) and issubclass(value, Resource):
+            return value._get_iri()
+        if isinstance(value, URIRef):
+            return value
+        return Literal(value)
+
+    # id -> instance; holding the instance keeps its id from being reused
+    emitted = {}
+    plans = {}
+    for instance in instances:
+        stack = [(instance, type(instance))]
+        while stack:
+            instance, template = stack.pop()
+            if id(instance) in emitted:
+                continue
+            emitted[id(instance)] = instance
+
+            plan = plans.get(template)
+            if plan is None:
+                plan = plans[template] = get_schema(template).instance_triples
+            type_iri, fields, inter_field = plan
+
+            subject = namespace[instance._name]
+            yield subject, RDF.type, type_iri
+            for field_name, predicate, fixed, dependency in fields:
+                if fixed is not None:
+                    yield subject, predicate, fixed
+                    continue
+                value = getattr(instance, field_name, None)
+                if value is None:
+                    continue
+                if predicate is not None:
+                    yield subject, predicate, node(value)
+                if dependency is not None and isinstance(value, Resource):
+                    stack.append((value, dependency))
+            for source_field, predicate, target_field in inter_field:
+                source = getattr(instance, source_field, None)
+                target = getattr(instance, target_field, None)
+                if source is not None and target is not None:
+                    yield node(source), predicate, node(target)
+
+
+def _batches(triples, size=BATCH_SIZE):
+    batch = []
+    for triple in triples:
+        batch.append(triple)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def to_graph(instances: Iterable[Resource], graph_or_writer: Union[Graph, TextIO, None] = None,
+             namespace: Union[str, Namespace, None] = None) -> Union[Graph, TextIO]:
+    """
+    Write the triples for `instances` (and the instances they nest) without
+    evaluating BuildingMOTIF templates.
+
+    Args:
+        instances: Resource instances to serialize
+        graph_or_writer: An rdflib Graph to add the triples to (with addN), a
+            text stream to write them to as N-Triples, or None for a new Graph
+        namespace: Namespace instance names are minted in (default
+            `urn:test#`, as BMotifSession)
+
+    Returns:
+        The graph or stream written to
+    """
+    if graph_or_writer is None:
+        graph_or_writer = Graph()
+        bind_prefixes(graph_or_writer)
+
+    triples = iter_triples(instances, namespace)
+    if isinstance(graph_or_writer, Graph):
+        for batch in _batches(triples):
+            graph_or_writer.addN((s, p, o, graph_or_writer) for s, p, o in batch)
+    else:
+        for batch in _batches(triples):
+            graph_or_writer.write(''.join(f"{s.n3()} {p.n3()} {o.n3()} .\n" for s, p, o in batch))
+    return graph_or_writer
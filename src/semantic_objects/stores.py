@@ -0,0 +1,87 @@
+"""
+Stores - Choose the rdflib store backing loaded graphs
+
+'default' is rdflib's in-memory store. 'oxigraph' is the Oxigraph store from
+oxrdflib: files are parsed by Oxigraph's native parsers and SPARQL queries are
+evaluated by Oxigraph, which is much faster on large models. Either way the
+result is an ordinary rdflib Graph.
+
+Example:
+    g = load_graph('building.ttl', store='oxigraph')
+    df = query_to_df(Space.get_sparql_query(), g)
+"""
+
+from pathlib import Path
+from typing import Optional, Union
+
+from rdflib import Graph
+from rdflib.util import guess_format
+
+# store name -> rdflib store plugin name
+STORES = {
+    'default': 'default',
+    'oxigraph': 'Oxigraph',
+}
+
+
+def _check_store(store: str) -> str:
+    if store not in STORES:
+        raise ValueError(f"Unknown store {store!r}; expected one of {sorted(STORES)}")
+    return store
+
+
+def new_graph(store: str = 'default') -> Graph:
+    """An empty Graph backed by `store`."""
+    return Graph(store=STORES[_check_store(store)])
+
+
+def store_of(graph: Graph) -> str:
+    """The name in STORES of the store backing `graph` ('default' if unknown)."""
+    if type(graph.store).__name__ == 'OxigraphStore':
+        return 'oxigraph'
+    return 'default'
+
+
+def parser_format(source: Union[str, Path], store: str = 'default',
+                  format: Optional[str] = None) -> Optional[str]:
+    """
+    The rdflib parser to use for `source` in `store`: Oxigraph's native parser
+    for the format when parsing into Oxigraph, otherwise `format` as given
+    (None lets rdflib guess from the file name).
+    """
+    if _check_store(store) != 'oxigraph':
+        return format
+    fmt = format or guess_format(str(source))
+    if fmt is None or fmt.startswith('ox-'):
+        return fmt
+    native = f'ox-{fmt}'
+    try:
+        from rdflib.plugin import get
+        from rdflib.parser import Parser
+        get(native, Parser)
+    except Exception:
+        # No native parser for this format - rdflib parses, Oxigraph stores
+        return fmt
+    return native
+
+
+def load_graph(source: Union[str, Path], store: str = 'default',
+               format: Optional[str] = None) -> Graph:
+    """Parse an RDF file into a new Graph backed by `store`."""
+    graph = new_graph(store)
+    graph.parse(str(source), format=parser_format(source, store, format))
+    return graph
+
+
+def to_store(graph: Graph, store: Optional[str]) -> Graph:
+    """
+    `graph` itself if it's already backed by `store` (or store is None),
+    otherwise a copy of its triples and prefixes in a new graph backed by `store`.
+    """
+    if store is None or store_of(graph) == _check_store(store):
+        return graph
+    copy = new_graph(store)
+    for prefix, namespace in graph.namespaces():
+        copy.bind(prefix, namespace, override=True, replace=True)
+    copy.addN((s, p, o, copy) for s, p, o in graph)
+    return copy
@@ -1,8 +1,10 @@
+from ..lazy import lazy_exports as _lazy_exports, star_import as _star_import
 from . import properties
-from .core import *
-from .entities import *
-from .properties import *
-from .relations import *
+from . import core, entities, relations
+
+# Same names as `from .core import *` etc. in turn, but generated classes
+# not imported yet are only imported on first access
+__getattr__, __dir__ = _lazy_exports(__name__, _star_import(globals(), core, entities, properties, relations))
 
 
 def get_module_classes():
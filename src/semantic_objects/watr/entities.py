@@ -6,4 +6,10 @@ from the vendored WATR ontology's SHACL shapes. Nothing needs hand customization
 here currently - add __post_init__ coercion, _inter_field_relations, or other
 non-derivable behavior on a subclass here as needed.
 """
-from ._generated.entities import *
+from ..lazy import lazy_exports as _lazy_exports, star_import as _star_import
+from ._generated import entities as _generated_entities
+
+# Re-exported lazily: with a split _generated/ package each class is only
+# imported on first use (see semantic_objects.lazy)
+__all__ = list(_generated_entities.__all__)
+__getattr__, __dir__ = _lazy_exports(__name__, _star_import(globals(), _generated_entities))
@@ -5,4 +5,10 @@ See _generated/enumerationkinds.py (regenerated via
 values derived from the vendored ontology. Nothing needs hand customization
 here currently.
 """
-from ._generated.enumerationkinds import *
+from ..lazy import lazy_exports as _lazy_exports, star_import as _star_import
+from ._generated import enumerationkinds as _generated_enumerationkinds
+
+# Re-exported lazily: with a split _generated/ package each class is only
+# imported on first use (see semantic_objects.lazy)
+__all__ = list(_generated_enumerationkinds.__all__)
+__getattr__, __dir__ = _lazy_exports(__name__, _star_import(globals(), _generated_enumerationkinds))
@@ -5,4 +5,10 @@ See _generated/properties.py (regenerated via
 the vendored WATR ontology's SHACL shapes. Nothing needs hand customization here
 currently.
 """
-from ._generated.properties import *
+from ..lazy import lazy_exports as _lazy_exports, star_import as _star_import
+from ._generated import properties as _generated_properties
+
+# Re-exported lazily: with a split _generated/ package each class is only
+# imported on first use (see semantic_objects.lazy)
+__all__ = list(_generated_properties.__all__)
+__getattr__, __dir__ = _lazy_exports(__name__, _star_import(globals(), _generated_properties))
@@ -14,11 +14,12 @@ ONTOLOGY_PATH = REPO_ROOT / "src" / "semantic_objects" / "ontologies" / "watr" /
 GENERATED_DIR = REPO_ROOT / "src" / "semantic_objects" / "watr" / "_generated"
 
 
-def _generate_into(output_dir: Path):
+def _generate_into(output_dir: Path, slots: bool = False, split: bool = False):
     config = IngestConfig(ontology_name="watr", source_path=ONTOLOGY_PATH, output_dir=output_dir)
     adapter = WatrAdapter()
     ir = OntologyParser(config, adapter).parse()
-    Emitter(ir, adapter.scaffold_parent_local_names(), ONTOLOGY_PATH, output_dir, "watr", adapter=adapter).emit()
+    Emitter(ir, adapter.scaffold_parent_local_names(), ONTOLOGY_PATH, output_dir, "watr", adapter=adapter,
+            slots=slots, split=split).emit()
 
 
 def test_generation_is_idempotent():
@@ -35,6 +36,37 @@ def test_generation_is_idempotent():
             assert filecmp.cmp(out1 / name, out2 / name, shallow=False), f"{name} differs between runs"
 
 
+def test_slotted_generation_leaves_multi_parent_branches_unslotted():
+    # Reactor(Tank, UnitProcess): Tank and UnitProcess both add fields, and
+    # Python can't combine two bases that each add slots of their own
+    with tempfile.TemporaryDirectory() as d:
+        out = Path(d)
+        _generate_into(out, slots=True)
+        source = (out / "entities.py").read_text()
+    assert "@semantic_object(slots=True)\nclass Pump(" in source
+    assert "@semantic_object\nclass Tank(" in source
+    assert "@semantic_object\nclass UnitProcess(" in source
+
+
+def test_split_generation_writes_one_module_per_class():
+    with tempfile.TemporaryDirectory() as d:
+        out = Path(d)
+        _generate_into(out, split=True)
+        index = (out / "entities.py").read_text()
+        reactor = (out / "_entities" / "Reactor.py").read_text()
+        for path in out.rglob("*.py"):
+            compile(path.read_text(), str(path), "exec")
+        assert "    'Reactor': '._entities.Reactor',\n" in index
+        assert "from .Tank import Tank\nfrom .UnitProcess import UnitProcess\n" in reactor
+        assert "class Reactor(Tank, UnitProcess):" in reactor
+        assert "lazy_exports(__name__, star_import(globals()" in (out / "__init__.py").read_text()
+
+        # Regenerating without --split removes the per-class packages
+        _generate_into(out)
+        assert not (out / "_entities").exists()
+        assert "class Reactor(Tank, UnitProcess):" in (out / "entities.py").read_text()
+
+
 @pytest.fixture(scope="module")
 def generated():
     assert (GENERATED_DIR / "entities.py").exists(), (
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Test bulk_create against constructing objects one at a time"""
+
+import numpy as np
+import pytest
+
+from semantic_objects.core import Resource, semantic_object
+from semantic_objects.frame import ResourceFrame
+from semantic_objects.naming import naming_session
+from semantic_objects.qudt.units import FT2, M2
+from semantic_objects.s223.properties import Area, Azimuth
+from examples.s223_framework_demo import Space, Window
+
+
+def state(value):
+    """An instance's name and field values, nested instances included."""
+    if isinstance(value, Resource):
+        return (type(value), value._name,
+                tuple((name, state(getattr(value, name))) for name in value.__dataclass_fields__))
+    return value
+
+
+def test_matches_constructor():
+    values = [1.0, 2.5, 4.0]
+    with naming_session():
+        expected = [Window(area=Area(value=v, unit=FT2), azimuth=v, tilt=3.0) for v in values]
+    with naming_session():
+        built = Window.bulk_create(area=Area.bulk_create(value=values, unit=FT2),
+                                   azimuth=np.array(values), tilt=3.0)
+    assert [state(w) for w in built] == [state(w) for w in expected]
+    assert type(built[0].azimuth) is Azimuth and type(built[0].azimuth.value) is float
+
+    with naming_session():
+        expected = [Space(area=v) for v in values]
+    with naming_session():
+        built = Space.bulk_create(area=values)
+    assert [state(s) for s in built] == [state(s) for s in expected]
+
+
+def test_names_and_default_units():
+    areas = Area.bulk_create(value=[1.0, 2.0, 3.0], unit=[None, FT2, None], _name=['A', None, 'C'])
+    assert [a.unit for a in areas] == [M2, FT2, M2]
+    assert areas[0]._name == 'A' and areas[2]._name == 'C'
+    assert areas[1]._name.startswith('Area_')
+
+
+def test_column_validation():
+    with pytest.raises(TypeError, match="unexpected column"):
+        Area.bulk_create(value=[1.0], colour=['red'])
+    with pytest.raises(TypeError, match="missing required column"):
+        Window.bulk_create(area=[1.0], azimuth=[2.0])
+    with pytest.raises(ValueError, match="different lengths"):
+        Area.bulk_create(value=[1.0, 2.0], unit=[FT2])
+    with pytest.raises(ValueError, match="at least one column"):
+        Area.bulk_create(value=1.0)
+
+
+def test_classes_without_bulk_post_init_use_the_constructor():
+    @semantic_object
+    class BulkTestArea(Area):
+        def __post_init__(self):
+            super().__post_init__()
+            self.value = self.value * 2
+
+    areas = BulkTestArea.bulk_create(value=[1.0, 2.0])
+    assert [a.value for a in areas] == [2.0, 4.0]
+
+
+def test_as_frame():
+    values = np.arange(1.0, 6.0)
+    with naming_session():
+        expected = ResourceFrame.from_instances(Space.bulk_create(area=values))
+    with naming_session():
+        frame = Space.bulk_create(area=values, as_frame=True)
+    for column in ('name', 'area', 'area.unit'):
+        assert list(frame.iri_column(column)) == list(expected.iri_column(column))
+    np.testing.assert_array_equal(frame['area.value'], expected['area.value'])
@@ -68,11 +68,56 @@ def test_field_relation():
     print("✓ Relation test passed")
 
 
+def test_exact_values_with_property_field():
+    """exact_values patterns stay outside the OPTIONAL groups of a Property field's value and unit."""
+    from dataclasses import field
+    from typing import Optional
+
+    from rdflib import Graph, Literal, Namespace, RDF
+    from rdflib.plugins.sparql import prepareQuery
+
+    from semantic_objects.core import semantic_object
+    from semantic_objects.fields import required_field
+    from semantic_objects.model_loader import ModelLoader
+    from semantic_objects.namespaces import S223, QUDT, UNIT
+    from semantic_objects.s223.entities import PhysicalSpace
+    from semantic_objects.s223.properties import Area
+    from semantic_objects.s223.relations import hasAspect, hasProperty
+
+    @semantic_object
+    class ExactValuesSetpointSpace(PhysicalSpace):
+        _name = 'PhysicalSpace'
+        area: Area = required_field(relation=hasProperty)
+        aspects: Optional[list] = field(default=None, init=False, metadata={
+            'relation': hasAspect, 'exact_values': [Setpoint], 'qualified': False})
+
+    query = ExactValuesSetpointSpace.get_sparql_query(ontology='s223')
+    assert query.count('{') == query.count('}')
+    prepareQuery(query)
+
+    EX = Namespace('http://example.org/building#')
+    QK = Namespace('http://qudt.org/vocab/quantitykind/')
+    g = Graph()
+    for i, aspect in enumerate([Setpoint, Threshold]):
+        space, area = EX[f'Space{i}'], EX[f'Space{i}_Area']
+        g.add((space, RDF.type, S223.PhysicalSpace))
+        g.add((space, S223.hasProperty, area))
+        g.add((space, S223.hasAspect, aspect._get_iri()))
+        g.add((area, RDF.type, S223.QuantifiableObservableProperty))
+        g.add((area, S223.hasQuantityKind, QK.Area))
+        g.add((area, S223.hasValue, Literal(10.0 * (i + 1))))
+        g.add((area, QUDT.hasUnit, UNIT.M2))
+    for native in (True, False):
+        loaded = ModelLoader(g, native=native).load_instances(ExactValuesSetpointSpace, ontology='s223')
+        assert [(space._name, space.area.value) for space in loaded] == [('Space0', 10.0)]
+
+
 if __name__ == '__main__':
     print("Testing exact_values field metadata functionality...\n")
     
     test_exact_values_metadata()
     test_field_relation()
     test_area_sp_query_generation()
+    test_exact_values_with_property_field()
     
     print("\n✅ All tests passed!")
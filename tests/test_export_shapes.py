@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Test batch SHACL shapes export against the per-class generation path"""
+
+from rdflib import Graph
+from rdflib.compare import isomorphic
+
+from src.semantic_objects import s223
+from src.semantic_objects.core import Predicate, Node
+from src.semantic_objects.exporters import export_shapes, _collect_shape_classes
+from src.semantic_objects.s223 import PhysicalSpace, Window, relations
+
+
+def _per_class_graph(classes, include_hierarchy=False):
+    g = Graph()
+    for klass in classes:
+        if issubclass(klass, Predicate):
+            g.parse(data=klass.generate_rdf_property_definition(), format='turtle')
+        else:
+            g.parse(data=klass.generate_rdf_class_definition(include_hierarchy), format='turtle')
+    return g
+
+
+def test_export_shapes_matches_per_class():
+    """One shared graph holds exactly what the per-class definitions hold"""
+    classes = [PhysicalSpace, Window, relations.contains, relations.hasProperty]
+    for include_hierarchy in (False, True):
+        g = export_shapes(classes, include_hierarchy=include_hierarchy)
+        assert isomorphic(g, _per_class_graph(classes, include_hierarchy))
+
+
+def test_export_shapes_module_scan():
+    """Modules are scanned for ontology classes only, framework bases skipped"""
+    classes = _collect_shape_classes(s223)
+    assert PhysicalSpace in classes
+    assert relations.contains in classes
+    assert Node not in classes
+    assert Predicate not in classes
+    assert len(classes) == len(set(classes))
+
+
+def test_export_shapes_writes_destination(tmp_path):
+    """The graph is serialized to the destination in the requested format"""
+    destination = tmp_path / 'shapes.nt'
+    g = export_shapes([PhysicalSpace, relations.contains], destination, format='nt')
+    parsed = Graph()
+    parsed.parse(destination, format='nt')
+    assert len(parsed) == len(g)
+
+
+if __name__ == "__main__":
+    test_export_shapes_matches_per_class()
+    test_export_shapes_module_scan()
+    print("✓ Batch shapes export matches per-class output")
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Test columnar ResourceFrames against instance loading"""
+
+import numpy as np
+import pytest
+from rdflib import Literal, Namespace
+
+from semantic_objects.frame import ResourceFrame
+from semantic_objects.model_loader import ModelLoader
+from semantic_objects.namespaces import QUDT, RDF, S223, UNIT
+from semantic_objects.qudt.units import FT2, M2
+from semantic_objects.s223.properties import Area, Azimuth, Tilt
+from examples.s223_framework_demo import Space, Window
+from tests.test_model_loader import create_matching_graph
+
+EX = Namespace("http://example.org/building#")
+QK = Namespace("http://qudt.org/vocab/quantitykind/")
+
+
+def create_graph():
+    """create_matching_graph's two spaces, plus a window with all three properties."""
+    g = create_matching_graph()
+    g.add((EX.Window0, RDF.type, S223.Window))
+    for kind, value, unit in [('Area', 10.0, UNIT.M2), ('Azimuth', 180.0, UNIT.DEG), ('Tilt', 90.0, UNIT.DEG)]:
+        prop = EX[f'Window0_{kind}']
+        g.add((EX.Window0, S223.hasProperty, prop))
+        g.add((prop, RDF.type, S223.QuantifiableObservableProperty))
+        g.add((prop, S223.hasQuantityKind, QK[kind]))
+        g.add((prop, S223.hasValue, Literal(value)))
+        g.add((prop, QUDT.hasUnit, unit))
+    return g
+
+
+def test_load_frame_columns():
+    frame = ModelLoader(create_graph()).load_frame(Space, ontology='s223')
+
+    assert len(frame) == 2
+    assert set(frame.columns) == {'area', 'area.value', 'area.unit'}
+    assert frame['area'].dtype == np.int32
+    assert frame['area.value'].dtype == np.float64
+    names = list(frame.iri_column('name'))
+    assert sorted(name.split('#')[-1] for name in names) == ['Space0', 'Space1']
+    values = dict(zip(names, frame['area.value']))
+    assert values['http://example.org/building#Space1'] == 150.0
+
+
+def test_frame_instances_match_load_instances():
+    graph = create_graph()
+    for resource_class in (Space, Window):
+        loaded = ModelLoader(graph).load_instances(resource_class, ontology='s223')
+        built = ModelLoader(graph).load_frame(resource_class, ontology='s223').to_instances()
+        assert sorted(i._name for i in built) == sorted(i._name for i in loaded)
+        loaded = {i._name: i for i in loaded}
+        for instance in built:
+            expected = loaded[instance._name]
+            for field_name in ('area', 'azimuth', 'tilt'):
+                if hasattr(expected, field_name):
+                    assert getattr(instance, field_name).value == getattr(expected, field_name).value
+                    assert getattr(instance, field_name).unit is getattr(expected, field_name).unit
+
+
+def test_vectorized_filter():
+    frame = ModelLoader(create_graph()).load_frame(Space, ontology='s223')
+
+    large_metric = frame.filter((frame['area.value'] > 120) & frame.iri_mask('area.unit', UNIT.M2))
+    assert [name.split('#')[-1] for name in large_metric.iri_column('name')] == ['Space1']
+    assert len(frame.filter(frame.iri_mask('area.unit', UNIT.DEG_C))) == 0
+
+
+def test_instances_and_pandas_round_trip():
+    spaces = [Space(area=Area(value=float(i), unit=FT2 if i % 2 else M2)) for i in range(1, 6)]
+    frame = ResourceFrame.from_instances(spaces)
+    assert list(frame['area.value']) == [1.0, 2.0, 3.0, 4.0, 5.0]
+
+    df = frame.to_pandas()
+    assert list(df.columns) == ['name', 'area', 'area.value', 'area.unit']
+    assert str(df['area.unit'].dtype) == 'category'
+
+    rebuilt = ResourceFrame.from_pandas(df, Space)
+    for column in ('name', 'area', 'area.unit'):
+        assert list(rebuilt.iri_column(column)) == list(frame.iri_column(column))
+    np.testing.assert_array_equal(rebuilt['area.value'], frame['area.value'])
+
+    instances = rebuilt.to_instances()
+    assert [i._name for i in instances] == [s._name for s in spaces]
+    assert [(i.area.value, i.area.unit) for i in instances] == [(s.area.value, s.area.unit) for s in spaces]
+
+
+def test_arrow_round_trip():
+    pytest.importorskip('pyarrow')
+    windows = [Window(area=Area(value=1.0), azimuth=Azimuth(value=2.0), tilt=Tilt(value=3.0))]
+    frame = ResourceFrame.from_instances(windows)
+    rebuilt = ResourceFrame.from_arrow(frame.to_arrow(), Window)
+    assert list(rebuilt['tilt.value']) == [3.0]
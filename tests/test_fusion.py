@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Test loading several classes with one fused (UNION) query"""
+
+from rdflib.plugins.sparql import prepareQuery
+
+from semantic_objects.model_loader import ModelLoader
+from semantic_objects.query import CLASS_VARIABLE, SparqlQueryBuilder
+from semantic_objects.s223.properties import Area_SP
+from examples.s223_framework_demo import Space, Window
+from tests.test_matcher import create_mixed_graph
+
+CLASSES = {'spaces': Space, 'windows': Window, 'setpoints': Area_SP}
+
+
+def summarize(results):
+    def describe(instance):
+        related = sorted((name, type(value).__name__) for name, value in vars(instance).items()
+                         if not name.startswith('_') and value is not None)
+        return str(instance._name), str(related)
+    return {key: sorted(describe(instance) for instance in instances) for key, instances in results.items()}
+
+
+def test_fused_query():
+    query = SparqlQueryBuilder.get_fused_query([Space, Window], ontology='s223')
+    prepareQuery(query)
+    assert query.count('UNION') == 1
+    assert f'BIND(0 AS ?{CLASS_VARIABLE})' in query and f'BIND(1 AS ?{CLASS_VARIABLE})' in query
+
+    graph = create_mixed_graph()
+    rows = list(graph.query(query))
+    assert {int(row[CLASS_VARIABLE]) for row in rows} == {0, 1}
+    spaces = {str(row['name']) for row in rows if int(row[CLASS_VARIABLE]) == 0}
+    assert spaces == {str(row['name']) for row in graph.query(Space.get_sparql_query(ontology='s223'))}
+
+
+def test_fused_loading_matches_per_class_loading(capsys):
+    for store in ('default', 'oxigraph'):
+        loader = ModelLoader(create_mixed_graph(), store=store, native=False)
+        expected = summarize(ModelLoader(create_mixed_graph(), store=store, native=False)
+                             .load_multiple_classes(CLASSES, ontology='s223'))
+        assert expected['spaces'] and expected['windows'] and expected['setpoints']
+        fused = loader.load_multiple_classes(CLASSES, ontology='s223', fused=True)
+        assert list(fused) == list(CLASSES)
+        assert summarize(fused) == expected
+        assert 'fused query' not in capsys.readouterr().out
+        # the loads share the loader's identity map
+        space = fused['spaces'][0]
+        assert any(space is other for other in loader.load_instances(Space, ontology='s223'))
@@ -0,0 +1,84 @@
+"""Test the persistent parsed-graph cache used by ModelLoader."""
+
+import os
+
+from rdflib import Graph, Literal, URIRef
+from rdflib.compare import isomorphic
+
+from semantic_objects.graph_cache import GraphCache, decode_graph, encode_graph
+from semantic_objects.model_loader import ModelLoader
+from examples.s223_framework_demo import Space
+from test_model_loader import create_matching_graph
+
+
+def write_model(path, graph=None):
+    (graph if graph is not None else create_matching_graph()).serialize(
+        destination=str(path), format='turtle'
+    )
+    return path
+
+
+def test_encode_decode_round_trip():
+    """Terms, literal datatypes/languages, blank nodes and prefixes survive"""
+    g = create_matching_graph()
+    g.add((URIRef('urn:model#Room1'), URIRef('urn:model#label'), Literal('Raum', lang='de')))
+    decoded = decode_graph(encode_graph(g))
+    assert isomorphic(g, decoded)
+    assert dict(decoded.namespaces())['s223'] == dict(g.namespaces())['s223']
+
+
+def test_unchanged_file_is_not_reparsed(tmp_path, monkeypatch):
+    """A second load of an unchanged file comes from the cache, even after a touch"""
+    model = write_model(tmp_path / 'model.ttl')
+    cache = GraphCache(tmp_path / 'cache')
+    first = ModelLoader(str(model), cache=cache).g
+
+    def no_parse(*args, **kwargs):
+        raise AssertionError('cached file was parsed again')
+
+    monkeypatch.setattr(Graph, 'parse', no_parse)
+    second = ModelLoader(str(model), cache=cache)
+    assert isomorphic(first, second.g)
+    assert len(second.load_instances(Space, ontology='s223')) == 2
+
+    # Same contents, new mtime: re-hashed, still a hit
+    os.utime(model, ns=(0, 0))
+    assert isomorphic(first, cache.load(model))
+
+
+def test_changed_file_and_invalidation(tmp_path):
+    """Editing a file or invalidating it forces a re-parse"""
+    model = write_model(tmp_path / 'model.ttl')
+    cache = GraphCache(tmp_path / 'cache')
+    original = cache.load(model)
+
+    g = create_matching_graph()
+    g.add((URIRef('urn:model#Extra'), URIRef('urn:model#p'), Literal(1)))
+    write_model(model, g)
+    assert len(cache.load(model)) == len(original) + 1
+
+    assert cache.size() > 0
+    cache.invalidate(model)
+    assert cache.size() == 0
+    assert len(cache.load(model)) == len(original) + 1
+
+    cache.invalidate()
+    assert cache.size() == 0
+    assert not (tmp_path / 'cache' / 'index.json').exists()
+
+
+def test_size_bound_evicts_least_recently_used(tmp_path):
+    """Entries over max_bytes are evicted oldest first"""
+    cache = GraphCache(tmp_path / 'cache')
+    first = write_model(tmp_path / 'first.ttl')
+    cache.load(first)
+    entry_size = cache.size()
+
+    g = create_matching_graph()
+    g.add((URIRef('urn:model#Extra'), URIRef('urn:model#p'), Literal(1)))
+    second = write_model(tmp_path / 'second.ttl', g)
+
+    bounded = GraphCache(tmp_path / 'cache', max_bytes=entry_size * 3 // 2)
+    bounded.load(second)
+    assert entry_size < bounded.size() <= entry_size * 3 // 2
+    assert list(bounded._read_index()) == [str(second.resolve())]
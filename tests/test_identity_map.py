@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Test the loader's weak identity map"""
+
+import gc
+
+from semantic_objects.identity_map import IdentityMap
+from semantic_objects.model_loader import ModelLoader
+from examples.s223_framework_demo import Space
+from tests.test_model_loader import create_matching_graph
+
+
+def test_same_object_across_loads():
+    loader = ModelLoader(source=create_matching_graph())
+    first = {space._name: space for space in loader.load_instances(Space, ontology='s223')}
+    second = {space._name: space for space in loader.load_instances(Space, ontology='s223')}
+    assert first.keys() == second.keys()
+    assert all(second[name] is first[name] for name in first)
+    assert all(second[name].area is first[name].area for name in first)
+
+    results = loader.load_multiple_classes({'spaces': Space}, ontology='s223')
+    assert {space._name: space for space in results['spaces']} == first
+    assert all(space is first[space._name] for space in results['spaces'])
+
+    stats = loader.identity_map.stats()
+    assert stats['hits'] >= 4 and stats['live'] == 4  # two spaces, two areas
+
+
+def test_dropped_objects_are_reclaimed():
+    loader = ModelLoader(source=create_matching_graph())
+    spaces = loader.load_instances(Space, ontology='s223')
+    assert len(loader.identity_map) == 4
+
+    del spaces
+    gc.collect()
+    assert len(loader.identity_map) == 0
+
+    reloaded = loader.load_instances(Space, ontology='s223')
+    assert len(reloaded) == 2 and len(loader.identity_map) == 4
+    assert all(space.area.value in (100.0, 150.0) for space in reloaded)
+
+
+def test_identity_map_operations():
+    identity_map = IdentityMap()
+    space = Space(area=None)
+    assert identity_map.get('urn:x#S') is None
+    assert identity_map.setdefault('urn:x#S', space) is space
+    assert identity_map.setdefault('urn:x#S', Space(area=None)) is space
+    assert identity_map.get('urn:x#S') is space and 'urn:x#S' in identity_map
+    assert identity_map.stats() == {'hits': 1, 'misses': 1, 'hit_rate': 0.5, 'live': 1}
+
+    replacement = Space(area=None)
+    identity_map['urn:x#S'] = replacement
+    assert identity_map['urn:x#S'] is replacement
+    assert identity_map.iri_of(space) == identity_map.iri_of(replacement) == 'urn:x#S'
+
+    del space, replacement
+    gc.collect()
+    assert len(identity_map) == 0 and identity_map._iris == {}
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Test lazily exported module attributes (semantic_objects.lazy)"""
+
+import sys
+import textwrap
+
+import pytest
+
+from src.semantic_objects.lazy import lazy_index, load_all, star_import
+
+
+@pytest.fixture
+def lazypkg(tmp_path, monkeypatch):
+    package = tmp_path / 'lazypkg'
+    package.mkdir()
+    (package / 'heavy.py').write_text("LOADS = []\nclass Pump:\n    pass\nLOADS.append('Pump')\n")
+    (package / 'light.py').write_text("__all__ = ['Valve', 'Pump']\nclass Valve:\n    pass\nPump = 'light'\n")
+    (package / '__init__.py').write_text(textwrap.dedent("""
+        from src.semantic_objects.lazy import lazy_exports
+        __all__ = ['Pump']
+        __getattr__, __dir__ = lazy_exports(__name__, {'Pump': '.heavy'})
+    """))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield
+    for name in [name for name in sys.modules if name.split('.')[0] == 'lazypkg']:
+        del sys.modules[name]
+
+
+def test_names_are_imported_on_first_use_and_cached(lazypkg):
+    import lazypkg
+    assert 'lazypkg.heavy' not in sys.modules
+    assert 'Pump' in dir(lazypkg)
+
+    pump = lazypkg.Pump
+    assert pump is sys.modules['lazypkg.heavy'].Pump
+    assert vars(lazypkg)['Pump'] is pump
+    assert lazy_index(lazypkg) == {'Pump': 'lazypkg.heavy'}
+    with pytest.raises(AttributeError):
+        lazypkg.Missing
+
+
+def test_star_import_defers_unloaded_names_and_lets_later_modules_win(lazypkg):
+    import lazypkg
+    from lazypkg import light
+
+    namespace = {}
+    assert star_import(namespace, lazypkg) == {'Pump': 'lazypkg.heavy'}
+    assert namespace == {}
+    assert star_import(namespace, lazypkg, light) == {}
+    assert namespace == {'Pump': 'light', 'Valve': light.Valve}
+
+    namespace = {}
+    assert star_import(namespace, light, lazypkg) == {'Pump': 'lazypkg.heavy'}
+    assert 'Pump' not in namespace
+
+
+def test_load_all_imports_every_indexed_name(lazypkg):
+    import lazypkg
+    assert load_all(lazypkg) is lazypkg
+    assert 'Pump' in vars(lazypkg)
+    assert sys.modules['lazypkg.heavy'].LOADS == ['Pump']
+
+
+def test_ontology_packages_export_lazily():
+    from src.semantic_objects import s223
+    from src.semantic_objects.s223 import entities
+
+    assert s223.Pump is entities.Pump
+    assert 'Pump' in dir(s223)
+    assert entities.Pump in vars(load_all(entities)).values()
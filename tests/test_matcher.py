@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Test the native pattern matcher against the SPARQL queries it replaces"""
+
+from dataclasses import field
+from typing import Optional
+
+import pytest
+from rdflib import Literal, Namespace, RDF, Variable
+
+from semantic_objects.core import Resource, semantic_object
+from semantic_objects.matcher import PatternMatcher
+from semantic_objects.model_loader import ModelLoader
+from semantic_objects.namespaces import S223, QUDT, UNIT
+from semantic_objects.planner import GraphStatistics
+from semantic_objects.query import ClassPattern, SparqlQueryBuilder
+from semantic_objects.schema import get_schema
+from semantic_objects.s223 import properties
+from semantic_objects.s223.properties import Area_SP
+from semantic_objects.s223.relations import hasAspect
+from examples import s223_framework_demo as demo
+from tests.test_frame import create_graph
+
+EX = Namespace('http://example.org/building#')
+QK = Namespace('http://qudt.org/vocab/quantitykind/')
+
+
+def sparql_rows(graph, resource_class):
+    results = graph.query(resource_class.get_prepared_query(ontology='s223'))
+    return sorted(tuple(sorted((str(k), v) for k, v in row.asdict().items())) for row in results)
+
+
+def native_rows(graph, resource_class, statistics=None, subjects=None):
+    matcher = get_schema(resource_class).matcher('s223')
+    rows = matcher.match(graph, statistics, subjects)
+    return sorted(tuple(sorted((str(k), v) for k, v in zip(matcher.variables, row) if v is not None))
+                  for row in rows)
+
+
+def create_mixed_graph():
+    """The frame test graph plus near misses: an area without a value, a space
+    whose property has another quantity kind, and area setpoints with exactly,
+    partly and not the required aspects."""
+    g = create_graph()
+    g.add((EX.Space2, RDF.type, S223.Space))
+    g.add((EX.Space2, S223.hasProperty, EX.Space2_Temp))
+    g.add((EX.Space2_Temp, RDF.type, S223.QuantifiableObservableProperty))
+    g.add((EX.Space2_Temp, S223.hasQuantityKind, QK.Temperature))
+    g.add((EX.Space3, RDF.type, S223.Space))
+    g.add((EX.Space3, S223.hasProperty, EX.Space3_Area))
+    g.add((EX.Space3_Area, RDF.type, S223.QuantifiableObservableProperty))
+    g.add((EX.Space3_Area, S223.hasQuantityKind, QK.Area))
+    for i, aspects in enumerate([['Aspect-Setpoint'], ['Aspect-Setpoint', 'Aspect-Threshold'],
+                                 ['Aspect-Setpoint', 'Aspect-Dewpoint'], []]):
+        sp = EX[f'AreaSP{i}']
+        g.add((sp, RDF.type, S223.Area_SP))
+        g.add((sp, S223.hasQuantityKind, QK.Area))
+        g.add((sp, S223.hasValue, Literal(float(i))))
+        g.add((sp, QUDT.hasUnit, UNIT.M2))
+        for aspect in aspects:
+            g.add((sp, S223.hasAspect, S223[aspect]))
+    return g
+
+
+CLASSES = [cls for module in (demo, properties) for cls in vars(module).values()
+           if isinstance(cls, type) and issubclass(cls, Resource) and cls.__module__ == module.__name__]
+
+
+@pytest.mark.parametrize('resource_class', CLASSES, ids=lambda cls: cls.__name__)
+def test_same_rows_as_sparql(resource_class):
+    try:
+        resource_class.get_sparql_query(ontology='s223')
+    except Exception:
+        pytest.skip("no query for this class")
+    if get_schema(resource_class).matcher('s223') is None:
+        pytest.skip("pattern not supported by the matcher")
+    graph = create_mixed_graph()
+    expected = sparql_rows(graph, resource_class)
+    assert native_rows(graph, resource_class) == expected
+    assert native_rows(graph, resource_class, GraphStatistics(graph)) == expected
+
+
+def test_exact_values():
+    graph = create_mixed_graph()
+    rows = native_rows(graph, Area_SP, GraphStatistics(graph))
+    assert rows == sparql_rows(graph, Area_SP)
+    assert {dict(row)['name'] for row in rows} == {EX.AreaSP0, EX.AreaSP1, EX.AreaSP2}
+
+    @semantic_object
+    class UnqualifiedArea(properties.Area):
+        _semantic_type = properties.QuantifiableObservableProperty
+        aspects: Optional[list] = field(default=None, init=False,
+                                        metadata={'relation': hasAspect, 'exact_values': [], 'qualified': False})
+
+    graph.add((EX.AreaSP3, RDF.type, S223.UnqualifiedArea))
+    graph.add((EX.AreaSP0, RDF.type, S223.UnqualifiedArea))
+    rows = native_rows(graph, UnqualifiedArea)
+    assert rows == sparql_rows(graph, UnqualifiedArea)
+    assert [dict(row)['name'] for row in rows] == [EX.AreaSP3]
+
+
+def test_subjects():
+    graph = create_mixed_graph()
+    subjects = [EX.Space1, EX.Space2, EX.Nowhere, EX.Space1]
+    rows = native_rows(graph, demo.Space, subjects=subjects)
+    assert rows == [row for row in sparql_rows(graph, demo.Space) if dict(row)['name'] == EX.Space1]
+
+
+def test_unsupported_patterns():
+    name, a, b = Variable('name'), Variable('a'), Variable('b')
+    with pytest.raises(ValueError):
+        PatternMatcher(ClassPattern([(name, S223.hasProperty, a)], [], []))
+    with pytest.raises(ValueError):
+        PatternMatcher(ClassPattern([(name, RDF.type, S223.Space), (name, S223.hasProperty, a),
+                                     (a, S223.connectedTo, b)], [], []))
+    pattern = SparqlQueryBuilder(demo.Space).get_pattern('s223')
+    assert PatternMatcher(pattern).variables[0] == name
+
+
+def test_loader_matches_sparql_loader():
+    graph = create_mixed_graph()
+    native, sparql = ModelLoader(graph), ModelLoader(graph, native=False)
+    for cls in (demo.Space, demo.Window, Area_SP):
+        assert native._matcher(cls, 's223') is not None and sparql._matcher(cls, 's223') is None
+        expected = sparql.query_class(cls, ontology='s223')
+        df = native.query_class(cls, ontology='s223')
+        assert sorted(df.columns) == sorted(expected.columns)
+        key = sorted(df.columns)
+        assert (df[key].sort_values(key).astype(str).values.tolist()
+                == expected[key].sort_values(key).astype(str).values.tolist())
+        assert (sorted(str(i._name) for i in native.load_instances(cls, ontology='s223'))
+                == sorted(str(i._name) for i in sparql.load_instances(cls, ontology='s223')))
@@ -177,6 +177,161 @@ def test_load_multiple_classes():
     print()
 
 
+def create_matching_graph():
+    """Like create_sample_graph, but with properties typed the way the generated
+    queries match them (s223:hasQuantityKind), so instances actually load."""
+    g = Graph()
+    bind_prefixes(g)
+    EX = Namespace("http://example.org/building#")
+    QK = Namespace("http://qudt.org/vocab/quantitykind/")
+    RDF_TYPE = URIRef("http://www.w3.org/1999/02/22-rdf-syntax-ns#type")
+
+    for i, (value, unit) in enumerate([(100.0, UNIT["FT_2"]), (150.0, UNIT["M2"])]):
+        space = EX[f"Space{i}"]
+        area = EX[f"Space{i}_Area"]
+        g.add((space, RDF_TYPE, S223["Space"]))
+        g.add((space, S223["hasProperty"], area))
+        g.add((area, RDF_TYPE, S223["QuantifiableObservableProperty"]))
+        g.add((area, S223["hasQuantityKind"], QK["Area"]))
+        g.add((area, S223["hasValue"], Literal(value)))
+        g.add((area, QUDT["hasUnit"], unit))
+
+    g.add((EX["Room1"], RDF_TYPE, S223["LoaderTestRoom"]))
+    g.add((EX["Room1"], S223["hasDomainSpace"], EX["Zone1"]))
+    g.add((EX["Zone1"], RDF_TYPE, S223["DomainSpace"]))
+    return g
+
+
+def test_load_instances_values_and_units():
+    """Values and units are joined onto related properties, and the DataFrame
+    path (query_class + _instantiate_from_row) builds the same objects."""
+    from semantic_objects.units import FT_2
+    from semantic_objects.qudt.units import M2
+
+    loader = ModelLoader(source=create_matching_graph())
+    spaces = {space._name: space for space in loader.load_instances(Space, ontology='s223')}
+    assert set(spaces) == {'Space0', 'Space1'}
+    assert spaces['Space0'].area.value == 100.0
+    assert spaces['Space0'].area.unit is FT_2
+    assert spaces['Space1'].area.value == 150.0
+    assert spaces['Space1'].area.unit is M2
+
+    df = loader.query_class(Space, ontology='s223')
+    cache = {}
+    from_rows = [loader._instantiate_from_row(Space, row, cache) for _, row in df.iterrows()]
+    assert sorted((s._name, s.area.value, s.area.unit) for s in from_rows) == \
+        sorted((s._name, s.area.value, s.area.unit) for s in spaces.values())
+
+
+def test_load_instances_names_related_nodes():
+    """Related Nodes without a _semantic_type are named after their IRI"""
+    from semantic_objects.core import semantic_object
+    from semantic_objects.fields import required_field
+    from semantic_objects.s223.core import Node as S223Node
+    from semantic_objects.s223.relations import hasDomainSpace
+    from examples.s223_framework_demo import DomainSpace
+
+    @semantic_object
+    class LoaderTestRoom(S223Node):
+        zone: DomainSpace = required_field(relation=hasDomainSpace)
+
+    loader = ModelLoader(source=create_matching_graph())
+    rooms = loader.load_instances(LoaderTestRoom, ontology='s223')
+    assert len(rooms) == 1
+    assert rooms[0]._name == 'Room1'
+    assert isinstance(rooms[0].zone, DomainSpace)
+    assert rooms[0].zone._name == 'Zone1'
+
+
+def test_load_multiple_classes_shares_objects():
+    """Classes loaded together share instances and cross-references resolve to
+    the object loaded for the referenced class, whatever order they're requested in"""
+    from semantic_objects.core import semantic_object
+    from semantic_objects.fields import required_field
+    from semantic_objects.s223.core import Node as S223Node
+    from semantic_objects.s223.relations import hasDomainSpace
+    from examples.s223_framework_demo import DomainSpace
+
+    @semantic_object
+    class LoaderTestRoom(S223Node):
+        zone: DomainSpace = required_field(relation=hasDomainSpace)
+
+    loader = ModelLoader(source=create_matching_graph())
+    results = loader.load_multiple_classes(
+        {'rooms': LoaderTestRoom, 'zones': DomainSpace, 'spaces': Space, 'windows': Window},
+        ontology='s223'
+    )
+    assert list(results) == ['rooms', 'zones', 'spaces', 'windows']
+    assert len(results['spaces']) == 2
+    assert results['windows'] == []
+    assert len(results['zones']) == 1
+    assert results['rooms'][0].zone is results['zones'][0]
+
+    # Loaded in the "wrong" order (as a reference cycle would force), the room's
+    # zone starts out as a plain DomainSpace and is repointed afterwards
+    @semantic_object
+    class LoaderTestZone(DomainSpace):
+        _name = 'DomainSpace'
+
+    loader._dependency_order = lambda class_dict: list(class_dict)
+    results = loader.load_multiple_classes({'rooms': LoaderTestRoom, 'zones': LoaderTestZone}, ontology='s223')
+    assert isinstance(results['zones'][0], LoaderTestZone)
+    assert results['rooms'][0].zone is results['zones'][0]
+
+
+def test_optional_fields_and_value_columns():
+    """Optional fields are matched with OPTIONAL, so instances without them still
+    load, and property values/units come with the query rows - no lookups."""
+    from semantic_objects.core import semantic_object
+    from semantic_objects.fields import optional_field
+    from semantic_objects.model_loader import _TermLookups
+    from semantic_objects.s223.core import Node as S223Node
+    from semantic_objects.s223.relations import hasDomainSpace
+    from semantic_objects.units import FT_2
+    from examples.s223_framework_demo import DomainSpace
+
+    @semantic_object
+    class LoaderTestOffice(S223Node):
+        zone: DomainSpace = optional_field(relation=hasDomainSpace)
+
+    assert 'OPTIONAL' in LoaderTestOffice.get_sparql_query(ontology='s223')
+    g = create_matching_graph()
+    EX = Namespace("http://example.org/building#")
+    RDF_TYPE = URIRef("http://www.w3.org/1999/02/22-rdf-syntax-ns#type")
+    g.add((EX["Office1"], RDF_TYPE, S223["LoaderTestOffice"]))
+    g.add((EX["Office1"], S223["hasDomainSpace"], EX["Zone1"]))
+    g.add((EX["Office2"], RDF_TYPE, S223["LoaderTestOffice"]))
+
+    for native in (True, False):
+        loader = ModelLoader(source=g, native=native)
+        offices = {office._name: office for office in loader.load_instances(LoaderTestOffice, ontology='s223')}
+        assert set(offices) == {'Office1', 'Office2'}
+        assert isinstance(offices['Office1'].zone, DomainSpace) and offices['Office1'].zone._name == 'Zone1'
+        assert offices['Office2'].zone is None
+
+        lookups = _TermLookups(loader.g, bulk=True)
+        spaces = {space._name: space for space in loader._load_rows(Space, 's223', {}, lookups)}
+        assert spaces['Space0'].area.value == 100.0 and spaces['Space0'].area.unit is FT_2
+        assert lookups._indexes == {}
+
+
+def test_load_instances_subjects():
+    """Only the given subjects that are instances of the class load - natively,
+    with one planned query reused across VALUES chunks, and on Oxigraph."""
+    EX = Namespace("http://example.org/building#")
+    subjects = [EX["Space1"], str(EX["Space0"]), EX["Space1"], EX["Room1"], EX["Nowhere"]]
+    for loader in (ModelLoader(create_matching_graph()), ModelLoader(create_matching_graph(), native=False),
+                   ModelLoader(create_matching_graph(), store='oxigraph')):
+        assert sorted(s._name for s in loader.load_instances(Space, ontology='s223', subjects=subjects,
+                                                              chunk_size=2)) == ['Space0', 'Space1']
+        spaces = loader.load_instances(Space, ontology='s223', subjects=[EX["Space1"]])
+        assert [(s._name, s.area.value) for s in spaces] == [('Space1', 150.0)]
+        assert loader.load_instances(Space, ontology='s223', subjects=[]) == []
+    sparql = ModelLoader(create_matching_graph(), native=False)
+    sparql.load_instances(Space, ontology='s223', subjects=subjects, chunk_size=1)
+    assert len([key for key in sparql._planned_queries if 'subjects' in key]) == 1
+
+
 def main():
     """Run all tests."""
     print("\n" + "=" * 80)
@@ -187,6 +342,11 @@ def main():
         test_query_generation()
         test_load_instances()
         test_load_multiple_classes()
+        test_load_instances_values_and_units()
+        test_load_instances_names_related_nodes()
+        test_load_multiple_classes_shares_objects()
+        test_optional_fields_and_value_columns()
+        test_load_instances_subjects()
         
         print("=" * 80)
         print("ALL TESTS COMPLETED")
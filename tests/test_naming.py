@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Test the pluggable instance naming allocators"""
+
+import os
+import threading
+
+import pytest
+
+from src.semantic_objects.core import semantic_object, Node
+from src.semantic_objects.naming import (
+    CounterAllocator, NameAllocator, UUIDAllocator, WorkerAllocator, get_allocator, naming_session
+)
+
+
+@semantic_object
+class Widget(Node):
+    pass
+
+
+def test_session_numbers_from_one_and_restores_previous_allocator():
+    outer = get_allocator()
+    with naming_session() as allocator:
+        assert [Widget()._name for _ in range(2)] == ['Widget_1', 'Widget_2']
+        with naming_session():
+            assert Widget()._name == 'Widget_1'
+        assert Widget()._name == 'Widget_3'
+        assert get_allocator() is allocator
+    assert get_allocator() is outer
+
+
+def test_allocation_is_skipped_for_named_instances():
+    @semantic_object
+    class NamedWidget(Node):
+        _name = 'TheWidget'
+
+    with naming_session() as allocator:
+        assert NamedWidget()._name == 'TheWidget'
+        assert allocator.allocate(Widget) == 'Widget_1'
+
+
+def test_counter_allocator_is_collision_free_across_threads():
+    allocator = CounterAllocator()
+    names = []
+
+    def build():
+        with naming_session(allocator):
+            names.extend(Widget()._name for _ in range(500))
+
+    threads = [threading.Thread(target=build) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(set(names)) == 2000
+
+
+def test_worker_and_uuid_allocators():
+    assert WorkerAllocator().allocate(Widget) == f'w{os.getpid()}_Widget_1'
+
+    first = [UUIDAllocator(seed='building-1').allocate(Widget) for _ in range(2)]
+    assert first[0] == first[1]
+    seeded = UUIDAllocator(seed='building-1')
+    assert seeded.allocate(Widget) == first[0]
+    assert seeded.allocate(Widget) != first[0]
+    assert UUIDAllocator(seed='building-2').allocate(Widget) != first[0]
+    assert UUIDAllocator().allocate(Widget) != UUIDAllocator().allocate(Widget)
+
+
+def test_allocators_must_implement_allocate():
+    class Incomplete(NameAllocator):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
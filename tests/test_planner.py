@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Test selectivity-based ordering of query patterns"""
+
+from rdflib import Namespace, RDF, Variable
+
+from semantic_objects.model_loader import ModelLoader
+from semantic_objects.namespaces import S223
+from semantic_objects.planner import GraphStatistics, order_triples, plan_query, union_query, with_values
+from semantic_objects.query import add_values
+from examples.s223_framework_demo import Space, Window
+from tests.test_frame import create_graph
+
+
+def rows(results):
+    return sorted(tuple(sorted((str(k), str(v)) for k, v in row.asdict().items())) for row in results)
+
+
+def test_statistics_and_order():
+    graph = create_graph()
+    statistics = GraphStatistics(graph)
+    assert statistics.class_size(S223.Space) == 2
+    assert statistics.predicate(S223.hasProperty)[0] == len(list(graph.triples((None, S223.hasProperty, None))))
+
+    name, area = Variable('name'), Variable('area')
+    spaces = (name, RDF.type, S223.Space)
+    properties = (area, RDF.type, S223.QuantifiableObservableProperty)
+    link = (name, S223.hasProperty, area)
+    ordered = order_triples([properties, spaces, link], statistics)
+    # The two classes aren't joined directly, so the link goes between them
+    assert ordered == [spaces, link, properties]
+
+
+def test_planned_queries_match_unplanned():
+    graph = create_graph()
+    loader = ModelLoader(source=graph)
+    for cls in (Space, Window):
+        query = cls.get_sparql_query(ontology='s223')
+        planned = plan_query(query, loader.statistics)
+        assert rows(graph.query(planned)) == rows(graph.query(query))
+        assert len(loader.query_class(cls, ontology='s223')) == len(graph.query(query))
+    assert loader._class_query(Space, 's223') is loader._class_query(Space, 's223')
+
+    loader.refresh_statistics()
+    assert loader._planned_queries == {}
+    assert len(loader.load_instances(Space, ontology='s223')) == 2
+
+
+def test_values_queries():
+    graph = create_graph()
+    statistics = GraphStatistics(graph)
+    name, area = Variable('name'), Variable('area')
+    properties = (area, RDF.type, S223.QuantifiableObservableProperty)
+    link = (name, S223.hasProperty, area)
+    # With ?name bound by VALUES, start from its properties
+    assert order_triples([properties, link], statistics, {name}) == [link, properties]
+
+    EX = Namespace('http://example.org/building#')
+    query = add_values(Space.get_sparql_query(ontology='s223'), 'name', [EX.Space0])
+    planned = plan_query(query, statistics)
+    assert rows(graph.query(planned)) == rows(graph.query(query))
+    assert {str(row['name']) for row in graph.query(planned)} == {str(EX.Space0)}
+    both = with_values(planned, name, [EX.Space0, EX.Space1, EX.Nowhere])
+    assert {str(row['name']) for row in graph.query(both)} == {str(EX.Space0), str(EX.Space1)}
+    assert {str(row['name']) for row in graph.query(planned)} == {str(EX.Space0)}
+
+
+def test_planning_prepared_queries():
+    """Loaders plan copies of the classes' prepared queries, which stay as parsed"""
+    graph = create_graph()
+    prepared = Space.get_prepared_query(ontology='s223')
+    algebra = str(prepared.algebra)
+    for loader in (ModelLoader(source=graph, native=False), ModelLoader(source=graph, native=False)):
+        planned = loader._class_query(Space, 's223')
+        assert planned is not prepared and planned.algebra is not prepared.algebra
+        assert rows(graph.query(planned)) == rows(graph.query(prepared))
+    assert str(prepared.algebra) == algebra
+
+    EX = Namespace('http://example.org/building#')
+    planned = plan_query(prepared, GraphStatistics(graph), values=Variable('name'))
+    assert list(graph.query(planned)) == []
+    planned_algebra = str(planned.algebra)
+    first = graph.query(with_values(planned, Variable('name'), [EX.Space1, EX.Nowhere]))
+    second = graph.query(with_values(planned, Variable('name'), [EX.Space0]))
+    assert {str(row['name']) for row in first} == {str(EX.Space1)}
+    assert {str(row['name']) for row in second} == {str(EX.Space0)}
+    assert str(planned.algebra) == planned_algebra
+    assert list(graph.query(planned)) == []
+
+    fused = union_query([prepared, Window.get_prepared_query(ontology='s223')], Variable('_class'))
+    fused_rows = list(graph.query(plan_query(fused, GraphStatistics(graph))))
+    assert {int(row['_class']) for row in fused_rows} == {0, 1}
+    assert (sorted(str(row['name']) for row in fused_rows if int(row['_class']) == 0)
+            == sorted(str(row['name']) for row in graph.query(prepared)))
+    assert str(prepared.algebra) == algebra
@@ -0,0 +1,40 @@
+"""Test loading a portfolio of model files in parallel."""
+
+import pickle
+
+from semantic_objects.portfolio import load_portfolio
+from examples.s223_framework_demo import Space, Window
+from test_model_loader import create_matching_graph
+
+
+def test_load_portfolio(tmp_path):
+    """Each file gets its own plain-data result, in order, and a bad file only
+    fails its own result"""
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"building_{i}.ttl"
+        create_matching_graph().serialize(destination=str(path), format='turtle')
+        paths.append(path)
+    paths.insert(1, tmp_path / "missing.ttl")
+
+    seen = []
+    results = load_portfolio(
+        paths, [Space, Window], ontology='s223', max_workers=2,
+        progress=lambda done, total, result: seen.append((done, total))
+    )
+
+    assert [result.path for result in results] == [str(path) for path in paths]
+    assert [result.ok for result in results] == [True, False, True, True]
+    assert "Source must be a file path" in results[1].error
+    assert sorted(seen) == [(1, 4), (2, 4), (3, 4), (4, 4)]
+
+    spaces = results[0].instances['Space']
+    assert results[0].instances['Window'] == []
+    assert sorted(space['_name'] for space in spaces) == ['Space0', 'Space1']
+    area = next(space for space in spaces if space['_name'] == 'Space0')['area']
+    assert area['value'] == 100.0
+    assert area['unit'] == 'http://qudt.org/vocab/unit/FT_2'
+
+    # Plain data all the way down
+    assert pickle.loads(pickle.dumps(results))[0].instances == results[0].instances
+
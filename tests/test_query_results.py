@@ -0,0 +1,81 @@
+"""Test streaming SPARQL results as row tuples and typed DataFrame batches."""
+
+import pandas as pd
+import pytest
+from rdflib import Literal, URIRef
+
+from semantic_objects.model_loader import ModelLoader, query_to_df
+from semantic_objects.results import _solutions, query_batches, query_rows
+from examples.s223_framework_demo import Space
+from test_model_loader import create_matching_graph
+
+
+QUERY = Space.get_sparql_query(ontology='s223')
+
+
+def test_query_rows():
+    """Rows are named tuples of Python values (or raw terms), one per result"""
+    g = create_matching_graph()
+    rows = list(query_rows(QUERY, g))
+    assert len(rows) == 2
+    assert set(rows[0]._fields) == set(query_to_df(QUERY, g).columns)
+    assert sorted(row.name for row in rows) == [
+        'http://example.org/building#Space0', 'http://example.org/building#Space1'
+    ]
+
+    raw = list(query_rows(QUERY, g, convert=False))
+    assert all(isinstance(row.name, URIRef) for row in raw)
+    assert list(query_rows(QUERY, g, store='oxigraph')) != []
+
+
+def test_solutions_without_pending_generator():
+    """Results without rdflib's private pending generator are read through `bindings`"""
+    g = create_matching_graph()
+    streamed = list(_solutions(g.query(QUERY)))
+    assert len(streamed) == 2
+
+    class PublicResult:
+        """Only the public Result API"""
+        def __init__(self, bindings):
+            self.vars = list(streamed[0])
+            self.bindings = bindings
+
+    assert list(_solutions(PublicResult(streamed + [{}]))) == streamed
+
+    read = g.query(QUERY)
+    assert len(read.bindings) == 2  # the pending generator is drained
+    assert list(_solutions(read)) == streamed
+
+
+def test_query_batches_are_typed_and_bounded():
+    """Batches hold at most batch_size rows, IRIs are categorical and literals typed"""
+    g = create_matching_graph()
+    batches = list(query_batches(QUERY, g, batch_size=1))
+    assert [len(batch) for batch in batches] == [1, 1]
+
+    df = pd.concat(list(query_batches(QUERY, g)), ignore_index=True)
+    assert len(df) == 2
+    assert isinstance(df['name'].dtype, pd.CategoricalDtype)
+
+    g.add((URIRef('http://example.org/building#Space0_Area'),
+           URIRef('urn:test#count'), Literal(3)))
+    query = """SELECT ?area ?count WHERE {
+        ?area <http://data.ashrae.org/standard223#hasValue> ?value .
+        OPTIONAL { ?area <urn:test#count> ?count }
+    }"""
+    typed = next(query_batches(query, g))
+    assert str(typed['count'].dtype) == 'Int64'
+    assert typed['count'].isna().sum() == 1
+    plain = next(query_batches(query, g, categorical=False))
+    assert not isinstance(plain['area'].dtype, pd.CategoricalDtype)
+
+    assert list(query_batches('SELECT * WHERE { ?s <urn:none> ?o }', g)) == []
+    with pytest.raises(ValueError):
+        next(query_batches(QUERY, g, batch_size=0))
+
+
+def test_query_class_batches():
+    """ModelLoader streams a class's results like query_class"""
+    loader = ModelLoader(create_matching_graph())
+    batches = list(loader.query_class_batches(Space, ontology='s223'))
+    assert sum(len(batch) for batch in batches) == len(loader.query_class(Space, ontology='s223'))
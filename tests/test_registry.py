@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Test the class registry (IRI, local name and hierarchy lookups)"""
+
+from src.semantic_objects.core import semantic_object
+from src.semantic_objects.namespaces import S223, UNIT
+from src.semantic_objects.qudt import units
+from src.semantic_objects.registry import (
+    class_for_iri, class_for_name, classes_for_iri, descendants, registered_classes, subclasses
+)
+from src.semantic_objects.s223 import entities
+from src.semantic_objects.s223.core import Node
+
+
+def test_generated_classes_are_found_by_iri_and_local_name():
+    assert class_for_iri(UNIT.DEG_C) is units.DEG_C
+    assert class_for_iri(str(S223.Pump)) is entities.Pump
+    assert class_for_name('Pump') is entities.Pump
+    assert class_for_iri(S223.NoSuchClass) is None
+    assert class_for_name('NoSuchClass', default=Node) is Node
+
+
+def test_hierarchy_indexes_follow_new_classes():
+    @semantic_object
+    class RegistryPump(entities.Pump):
+        pass
+
+    @semantic_object
+    class RegistrySubPump(RegistryPump):
+        _name = 'Pump'
+
+    assert RegistryPump in subclasses(entities.Pump)
+    assert RegistrySubPump not in subclasses(entities.Pump)
+    assert {RegistryPump, RegistrySubPump} <= set(descendants(entities.Pump))
+    assert set(descendants(entities.Equipment)) >= set(descendants(entities.Pump))
+    # Sharing an IRI doesn't displace the class that defined it first
+    assert classes_for_iri(S223.Pump)[0] is entities.Pump
+    assert RegistrySubPump in classes_for_iri(S223.Pump)
+
+
+def test_redefining_a_class_replaces_it():
+    def define():
+        @semantic_object
+        class Redefined(entities.Pump):
+            pass
+        return Redefined
+
+    first, second = define(), define()
+    assert second in subclasses(entities.Pump)
+    assert first not in subclasses(entities.Pump)
+    assert first not in registered_classes()
+    assert classes_for_iri(S223.Redefined) == [second]
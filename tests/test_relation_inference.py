@@ -120,6 +120,26 @@ def test_rdf_generation():
     
     print()
 
+def test_relation_index_lookup():
+    """Test that the relation index resolves Self, walks both hierarchies and caches misses"""
+    print("Testing relation index lookups...")
+
+    from src.semantic_objects.schema import find_relation, _relation_pairs
+    from src.semantic_objects.s223.entities import DomainSpace, Equipment, Fan
+
+    # Self resolves to the declaring class, and to subclasses through the MRO
+    assert find_relation(PhysicalSpace, PhysicalSpace)._local_name == 'contains'
+    assert find_relation(PhysicalSpace, DomainSpace)._local_name == 'encloses'
+    # Both hierarchies: Connectable (an Equipment base) declares connectedFrom
+    # for Self, and Fan matches through its own Connectable base
+    assert find_relation(Equipment, Fan)._local_name == 'connectedFrom'
+
+    # Misses are memoized as None rather than rescanned
+    assert find_relation(Area, PhysicalSpace) is None
+    assert _relation_pairs[(Area, PhysicalSpace)] is None
+    print("✓ Relation index lookups correct!")
+    print()
+
 if __name__ == "__main__":
     print("=" * 60)
     print("RELATION INFERENCE TEST SUITE")
@@ -130,6 +150,7 @@ if __name__ == "__main__":
         test_space_relation_inference()
         test_window_relation_inference()
         test_physical_space_self_reference()
+        test_relation_index_lookup()
         test_yaml_generation()
         test_rdf_generation()
         
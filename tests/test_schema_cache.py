@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""Test that per-class compiled schemas are cached and invalidated correctly"""
+
+from src.semantic_objects.core import semantic_object, Node
+from src.semantic_objects.fields import required_field
+from src.semantic_objects.schema import get_schema, invalidate_schemas, reachable_classes
+from src.semantic_objects.s223 import relations
+from src.semantic_objects.s223.entities import PhysicalSpace
+from src.semantic_objects.s223.properties import Area
+from examples.s223_framework_demo import Space, Window
+
+
+def test_schema_is_cached_per_class():
+    """The same schema object is reused, and subclasses get their own"""
+    assert get_schema(Space) is get_schema(Space)
+    assert get_schema(Window) is not get_schema(Space)
+    assert get_schema(PhysicalSpace) is not get_schema(Space)
+
+
+def test_cached_results_match_and_are_copies():
+    """Repeated calls return equal results that callers can mutate safely"""
+    first = Window.get_relations()
+    first.clear()
+    assert Window.get_relations() != []
+
+    params = Space._get_template_parameters()
+    params.pop('area')
+    assert 'area' in Space._get_template_parameters()
+
+
+def test_relation_failure_is_cached_and_reraised():
+    """A field with no inferable relation raises the same ValueError every time"""
+
+    @semantic_object
+    class Unrelated(Node):
+        pass
+
+    @semantic_object
+    class Holder(Node):
+        thing: Unrelated
+
+    messages = []
+    for _ in range(2):
+        try:
+            Holder.get_relations()
+        except ValueError as e:
+            messages.append(str(e))
+    assert len(messages) == 2
+    assert messages[0] == messages[1]
+    assert "No relation found for field 'thing'" in messages[0]
+
+
+def test_decorating_a_class_keeps_other_schemas():
+    """Defining a new semantic object leaves the schemas compiled so far alone"""
+    schema = get_schema(Space)
+
+    @semantic_object
+    class Redefined(Node):
+        area: Area
+
+    assert get_schema(Space) is schema
+
+
+def test_invalidating_a_class_drops_its_dependents():
+    """Invalidating a class drops the schemas of its subclasses and of the classes
+    whose fields refer to it, transitively, and their memoized relation lookups"""
+    from src.semantic_objects.schema import _relation_pairs, find_relation
+
+    @semantic_object
+    class Part(Node):
+        pass
+
+    @semantic_object
+    class Assembly(Node):
+        part: Part = required_field(relation=relations.contains)
+
+    @semantic_object
+    class Plant(Node):
+        assembly: Assembly = required_field(relation=relations.contains)
+
+    @semantic_object
+    class SpecialPart(Part):
+        pass
+
+    @semantic_object
+    class Other(Node):
+        pass
+
+    schemas = {cls: get_schema(cls) for cls in (Part, Assembly, Plant, SpecialPart, Other)}
+    find_relation(PhysicalSpace, Part)
+    assert (PhysicalSpace, Part) in _relation_pairs
+
+    invalidate_schemas(Part)
+    for cls in (Part, Assembly, Plant, SpecialPart):
+        assert get_schema(cls) is not schemas[cls]
+    assert get_schema(Other) is schemas[Other]
+    assert (PhysicalSpace, Part) not in _relation_pairs
+
+    invalidate_schemas()
+    assert get_schema(Other) is not schemas[Other]
+
+
+def test_sparql_query_is_cached_per_ontology():
+    """Query text and the prepared query are built once per class and ontology,
+    and rebuilt when a class they depend on is invalidated"""
+    from rdflib.plugins.sparql.sparql import Query
+    # Space comes from the `semantic_objects` import of the package, so
+    # invalidate through that copy's schema module
+    from semantic_objects.schema import invalidate_schemas
+    from semantic_objects.s223.properties import Area
+
+    query = Space.get_sparql_query(ontology='s223')
+    assert Space.get_sparql_query(ontology='s223') is query
+    assert 'SELECT DISTINCT' in query
+    prepared = Space.get_prepared_query(ontology='s223')
+    assert isinstance(prepared, Query)
+    assert Space.get_prepared_query(ontology='s223') is prepared
+    assert Space.get_prepared_query() is not prepared
+
+    invalidate_schemas(Area)
+    assert Space.get_prepared_query(ontology='s223') is not prepared
+    assert Space.get_sparql_query(ontology='s223') == query
+
+
+def test_coercion_plan_lists_only_resource_fields():
+    """__post_init__ only revisits fields annotated with a Resource class"""
+
+    @semantic_object
+    class Mixed(Node):
+        area: Area
+        note: str = 'n'
+        count: int = 0
+
+    assert Mixed._coercions == (('area', Area),)
+
+    mixed = Mixed(area=12)
+    assert isinstance(mixed.area, Area)
+    assert mixed.note == 'n'
+    area = Area(3)
+    assert Mixed(area=area).area is area
+
+
+def test_coercion_plan_of_undecorated_subclass():
+    """A subclass declared with plain @dataclass coerces its own Resource fields"""
+    from dataclasses import dataclass
+    from src.semantic_objects.s223.core import Node as S223Node
+
+    @dataclass
+    class Plain(S223Node):
+        area: Area = None
+
+    plain = Plain(area=5.0)
+    assert isinstance(plain.area, Area)
+    assert Plain.__dict__['_coercions'] == (('area', Area),)
+    assert all(isinstance(p.area, Area) for p in Plain.bulk_create(area=[1.0, 2.0]))
+
+
+def test_related_classes_close_over_reference_cycles():
+    """Classes on a reference cycle share one memoized closure, which picks up
+    everything reachable from any of them"""
+
+    @semantic_object
+    class Leaf(Node):
+        pass
+
+    @semantic_object
+    class Outer(Node):
+        inner: Node = required_field(relation=relations.contains)
+
+    @semantic_object
+    class Inner(Node):
+        outer: Outer = required_field(relation=relations.contains)
+        leaf: Leaf = required_field(relation=relations.hasMember)
+
+    Outer.__dataclass_fields__['inner'].type = Inner
+    invalidate_schemas()
+
+    assert reachable_classes(Outer) is reachable_classes(Inner)
+    predicates, entities = Outer.get_related_classes()
+    assert set(entities) == {Outer, Inner, Leaf}
+    assert set(predicates) == {relations.contains, relations.hasMember}
+    assert Leaf.get_related_classes() == ([], [Leaf])
+    assert Outer.get_related_classes(get_recursive=False) == ([relations.contains], [Outer, Inner])
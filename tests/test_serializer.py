@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Test the direct instance-to-RDF serializer against BuildingMOTIF evaluation"""
+
+import io
+
+from rdflib import Graph, Namespace
+
+from semantic_objects.build_model import BMotifSession
+from semantic_objects.namespaces import RDF, S223
+from semantic_objects.s223 import entities, enumerationkinds
+from semantic_objects.s223.properties import Area, Area_FT2, Azimuth, Tilt
+from semantic_objects.serializer import iter_triples, to_graph
+from examples.s223_framework_demo import Space, SpaceWithWindow, Window
+
+EX = Namespace('urn:ex#')
+
+
+def sample_instances():
+    space = Space(area=Area(value=100.0))
+    space._name = 'S1'
+    window = Window(area=Area(value=1.0), azimuth=Azimuth(value=2.0), tilt=Tilt(value=3.0))
+    window._name = 'W1'
+    domain_space = entities.DomainSpace(domain=enumerationkinds.HVAC())
+    domain_space._name = 'D1'
+    combined = SpaceWithWindow(area=Area_FT2(value=5.0), space=space, window=window)
+    combined._name = 'SW'
+    return [space, window, domain_space, combined]
+
+
+def test_matches_buildingmotif_evaluation():
+    instances = sample_instances()
+    session = BMotifSession(ns='ex')
+    for instance in instances:
+        session.evaluate(instance)
+    expected = {triple for triple in session.graph if triple[0] != EX['']}  # drop the owl:Ontology header
+
+    assert set(to_graph(instances, namespace=EX)) == expected
+
+
+def test_nested_instances_are_written_once():
+    instances = sample_instances()
+    # SW nests S1 and W1 (and their properties), which are also listed
+    triples = list(iter_triples(instances, namespace=EX))
+    assert len(triples) == len(set(triples))
+    assert (EX.S1, S223.connectedTo, EX.W1) in triples
+    assert len([t for t in triples if t[1:] == (RDF.type, S223.QuantifiableObservableProperty)]) == 5
+
+
+def test_streams_ntriples():
+    instances = sample_instances()
+    stream = to_graph(instances, io.StringIO(), namespace=EX)
+    parsed = Graph().parse(data=stream.getvalue(), format='nt')
+    assert set(parsed) == set(to_graph(instances, namespace=EX))
+    assert len(stream.getvalue().splitlines()) == len(parsed)
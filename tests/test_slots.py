@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Test opt-in slotted semantic objects (@semantic_object(slots=True))"""
+
+import pickle
+import weakref
+import pytest
+from rdflib import Graph, Namespace, RDF
+
+from src.semantic_objects.core import semantic_object
+from src.semantic_objects.fields import required_field
+from src.semantic_objects.model_loader import ModelLoader
+from src.semantic_objects.namespaces import S223
+from src.semantic_objects.s223.core import Node
+from src.semantic_objects.s223 import enumerationkinds, relations
+
+
+@semantic_object(slots=True)
+class SlottedConnection(Node):
+    label = 'Slotted connection'
+    medium: enumerationkinds.Medium = required_field(relation=relations.hasMedium)
+
+
+@semantic_object(slots=True)
+class SlottedAirConnection(SlottedConnection):
+    _name = 'AirConnection'
+    _semantic_type = SlottedConnection
+    medium = enumerationkinds.Air
+
+
+@semantic_object
+class PlainAirConnection(SlottedAirConnection):
+    extra: int = 0
+
+
+def test_slotted_instances_have_no_dict():
+    conn = SlottedAirConnection()
+    assert not hasattr(conn, '__dict__')
+    assert 'medium' in SlottedConnection.__slots__
+    with pytest.raises(AttributeError):
+        conn.unknown = 1
+
+
+def test_class_level_pins_still_apply():
+    conn = SlottedAirConnection()
+    assert conn.medium is enumerationkinds.Air
+    assert SlottedAirConnection.medium is enumerationkinds.Air
+    assert SlottedAirConnection.label == 'Slotted connection'
+    assert conn._semantic_type is SlottedConnection
+    assert SlottedAirConnection._get_iri() == S223.AirConnection
+
+    assert conn._name == 'AirConnection'
+    conn._name = 'conn1'
+    assert conn._name == 'conn1'
+    assert SlottedAirConnection._name == 'AirConnection'
+
+
+def test_slotted_instances_pickle_and_weakref():
+    conn = SlottedAirConnection()
+    conn._name = 'conn1'
+    copy = pickle.loads(pickle.dumps(conn))
+    assert (copy._name, copy.medium) == ('conn1', enumerationkinds.Air)
+    assert weakref.ref(conn)() is conn
+
+
+def test_unslotted_subclass_keeps_dict():
+    conn = PlainAirConnection(extra=2)
+    assert hasattr(conn, '__dict__')
+    assert conn.medium is enumerationkinds.Air
+
+
+def test_loader_builds_slotted_instances():
+    ex = Namespace('urn:ex#')
+    g = Graph()
+    g.add((ex.c1, RDF.type, SlottedConnection._get_iri()))
+    g.add((ex.c1, relations.hasMedium._get_iri(), enumerationkinds.Air._get_iri()))
+    g.add((enumerationkinds.Air._get_iri(), RDF.type, enumerationkinds.Medium._get_iri()))
+
+    loaded = ModelLoader(g).load_instances(SlottedConnection, ontology='s223')
+    assert len(loaded) == 1
+    assert not hasattr(loaded[0], '__dict__')
+    assert loaded[0]._name == 'c1'
+    assert isinstance(loaded[0].medium, enumerationkinds.Medium)
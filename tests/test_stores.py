@@ -0,0 +1,67 @@
+"""Test loading and querying models with the default and Oxigraph stores."""
+
+import pytest
+
+from semantic_objects.graph_cache import GraphCache
+from semantic_objects.model_loader import ModelLoader, query_to_df
+from semantic_objects.stores import load_graph, store_of, to_store
+from examples.s223_framework_demo import Space, Window
+from test_model_loader import create_matching_graph
+
+
+def summarize(loaded):
+    return sorted((space._name, space.area.value, space.area.unit) for space in loaded)
+
+
+def test_load_graph_and_copy_between_stores(tmp_path):
+    """Files parse into either store, and graphs copy across with their prefixes"""
+    path = tmp_path / 'model.ttl'
+    create_matching_graph().serialize(destination=str(path), format='turtle')
+
+    default = load_graph(path)
+    oxigraph = load_graph(path, store='oxigraph')
+    assert store_of(default) == 'default'
+    assert store_of(oxigraph) == 'oxigraph'
+    assert set(default) == set(oxigraph)
+
+    assert to_store(oxigraph, 'oxigraph') is oxigraph
+    assert to_store(oxigraph, None) is oxigraph
+    copy = to_store(default, 'oxigraph')
+    assert store_of(copy) == 'oxigraph'
+    assert set(copy) == set(default)
+    assert dict(copy.namespaces())['s223'] == dict(default.namespaces())['s223']
+
+    with pytest.raises(ValueError, match="Unknown store"):
+        load_graph(path, store='nope')
+
+
+def test_model_loader_store(tmp_path):
+    """Both stores load the same instances, from files, graphs and the graph cache"""
+    path = tmp_path / 'model.ttl'
+    create_matching_graph().serialize(destination=str(path), format='turtle')
+    expected = summarize(ModelLoader(str(path)).load_instances(Space, ontology='s223'))
+    assert len(expected) == 2
+
+    sources = [
+        ModelLoader(str(path), store='oxigraph'),
+        ModelLoader(create_matching_graph(), store='oxigraph'),
+        ModelLoader(str(path), store='oxigraph', cache=GraphCache(tmp_path / 'cache')),
+        ModelLoader(str(path), store='oxigraph', cache=GraphCache(tmp_path / 'cache')),
+    ]
+    for loader in sources:
+        assert store_of(loader.g) == 'oxigraph'
+        assert summarize(loader.load_instances(Space, ontology='s223')) == expected
+        results = loader.load_multiple_classes({'Space': Space, 'Window': Window}, ontology='s223')
+        assert summarize(results['Space']) == expected
+
+
+def test_query_to_df_store():
+    """query_to_df gives the same rows whichever store evaluates the query"""
+    g = create_matching_graph()
+    query = Space.get_sparql_query(ontology='s223')
+    default = query_to_df(query, g)
+    oxigraph = query_to_df(query, g, store='oxigraph')
+    columns = sorted(default.columns)
+    assert sorted(oxigraph.columns) == columns
+    rows = lambda df: sorted(tuple(str(v) for v in row) for row in df[columns].itertuples(index=False))
+    assert rows(oxigraph) == rows(default)